@@ -0,0 +1,88 @@
+'''
+
+Title: Active-set Stepping for Sparse Boards in Conway's Game of Life
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file implements an incremental stepping mode for the deterministic rules (the nature
+rules of GameOfLife_OG and the sacrifice pre-game of GameOfLife_SacrificeRules).
+A cell can only change in the next generation if it or one of its neighbours changed in the last one,
+so only that frontier is evaluated. The cost of a generation follows the activity on the board
+instead of its area: a board that has settled into still lifes costs almost nothing to step.
+
+verify_active_set runs the incremental mode next to the full-grid engine and checks that both
+give the same grid every generation.
+
+'''
+
+# importing all the dependencies
+import numpy as np
+from GameOfLife_Engine import OFFSETS, life_step, sacrifice_step
+
+
+# the cell itself and its eight neighbours
+NEIGHBORHOOD = [(0, 0)] + OFFSETS
+
+
+class ActiveSetStepper:
+
+    # n is the number of neighbours for the sacrifice, None for the nature rules only
+    def __init__(self, grid, n=None):
+        rows, cols = grid.shape
+        # one ring of dead cells around the board keeps the bounded edges
+        self.padded = np.zeros((rows + 2, cols + 2), dtype=grid.dtype)
+        self.padded[1:-1, 1:-1] = grid
+        self.n = n
+        self.alive_cells = int(np.sum(grid == 1))
+        # at the start every live cell counts as changed
+        self.frontier = self.neighborhood(np.flatnonzero(grid == 1))
+
+    @property
+    def grid(self):
+        return self.padded[1:-1, 1:-1]
+
+    # flat indices of the given cells and of their neighbours inside the board
+    def neighborhood(self, cells):
+        rows, cols = self.grid.shape
+        row, col = np.divmod(cells, cols)
+        around = []
+        for i, j in NEIGHBORHOOD:
+            r, c = row + i, col + j
+            inside = (r >= 0) & (r < rows) & (c >= 0) & (c < cols)
+            around.append(r[inside] * cols + c[inside])
+        return np.unique(np.concatenate(around))
+
+    # advancing the board by one generation, evaluating only the frontier; the grid returned is a
+    # copy, so the callers can edit it without touching the board of the stepper
+    def step(self):
+        cols = self.grid.shape[1]
+        row, col = np.divmod(self.frontier, cols)
+        row += 1
+        col += 1
+        neighbors = np.zeros(len(self.frontier), dtype=int)
+        for i, j in OFFSETS:
+            neighbors += self.padded[row + i, col + j] == 1
+        alive = self.padded[row, col] == 1
+        survive = alive & (neighbors >= 2) & (neighbors <= 3)
+        if self.n is not None:
+            survive &= neighbors != self.n
+        new_alive = survive | (~alive & (neighbors == 3))
+
+        changed = new_alive != alive
+        self.padded[row[changed], col[changed]] = new_alive[changed]
+        self.alive_cells += int(np.sum(new_alive)) - int(np.sum(alive))
+        self.frontier = self.neighborhood(self.frontier[changed])
+        return self.grid.copy()
+
+
+# checking the active-set mode against the full-grid engine for a number of generations
+def verify_active_set(grid, generations, n=None):
+    stepper = ActiveSetStepper(grid, n)
+    full = grid
+    for generation in range(generations):
+        full = life_step(full) if n is None else sacrifice_step(full, n)
+        stepper.step()
+        if not np.array_equal(stepper.grid, full) or stepper.alive_cells != np.sum(full):
+            return False
+    return True
@@ -0,0 +1,287 @@
+'''
+
+Title: Cached Loader and Batch Statistics for the Population Series in Data/
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: The population files in Data/ were saved by different versions of the scripts, in
+different layouts. detect_layout() tells them apart:
+header  -> a "Generation Count,Population Count" header and one row per generation (AliveCells_OG.csv)
+row     -> one line of space-separated populations, one per generation (Example.csv, Hex1-0.1.csv)
+column  -> one population per line (file1.csv ... file8.csv)
+binary  -> the binary format of GameOfLife_Recorder.py
+empty   -> no data (AliveCells.csv)
+
+Each file is parsed once and stored as a .npz file in CACHE_DIR named by the SHA-1 hash of its
+contents. An index keeps the modification time, size and hash of every file, so a file which has
+not been modified is loaded from the cache without being read or hashed again.
+
+aligned() puts the series of many runs into one runs x generations array, padded with NaN, and
+the statistics work on the whole array at once:
+final / peak         -> population at the last generation and the largest population
+plateau              -> mean and standard deviation of the last WINDOW generations
+time_to_stability    -> first generation after which the WINDOW-generation mean stays at the plateau,
+                        within REL_TOLERANCE or Z_LIMIT standard errors like GameOfLife_SteadyState.py
+growth_rate          -> exponential growth rate per generation over the first WINDOW generations
+rolling_variance     -> variance of every WINDOW-generation window
+
+Example:
+python GameOfLife_Analysis.py Data --out Data_summary.csv
+
+'''
+
+# importing all the dependencies
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+import numpy as np
+from GameOfLife_Recorder import COLUMNS, MAGIC, read_metrics
+from GameOfLife_SteadyState import REL_TOLERANCE, WINDOW, Z_LIMIT
+
+
+DATA_DIR = 'Data'
+CACHE_DIR = os.path.join(DATA_DIR, '.cache')
+INDEX_FILE = 'index.json'
+SUMMARY_COLUMNS = ('length', 'final', 'peak', 'plateau', 'plateau_std', 'time_to_stability', 'growth_rate')
+
+
+# the layout of a population file, from its first bytes
+def detect_layout(path):
+    with open(path, 'rb') as file:
+        start = file.read(4096)
+    if start.startswith(MAGIC):
+        return 'binary'
+    lines = start.decode(errors='replace').split('\n')
+    first = next((line.strip() for line in lines if line.strip()), '')
+    if not first:
+        return 'empty'
+    if ',' in first:
+        return 'header'
+    if len(first.split()) > 1:
+        return 'row'
+    return 'column'
+
+
+# the generations and populations of a file, parsed from its layout
+def parse_series(path, layout=None):
+    layout = layout or detect_layout(path)
+    if layout in ('header', 'binary'):
+        metrics = read_metrics(path)
+        names = list(metrics)
+        # the population column, or the first column after the generations (like the Mean of an ensemble)
+        population = COLUMNS[1] if COLUMNS[1] in metrics else names[min(1, len(names) - 1)]
+        populations = metrics[population]
+        if COLUMNS[0] in metrics:
+            return metrics[COLUMNS[0]].astype(np.int64), populations
+        return np.arange(len(populations)), populations
+    if layout == 'empty':
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+    # row and column files hold only the populations, from generation 0 on
+    with open(path) as file:
+        populations = np.array(file.read().split(), dtype=float)
+    return np.arange(len(populations)), populations
+
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SeriesCache:
+
+    # cache_dir holds one .npz per distinct file contents and the index of the files seen
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, INDEX_FILE)
+        self.index = {}
+        self.changed = False
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as file:
+                self.index = json.load(file)
+
+    # the generations, populations and layout of a file, parsed only if its contents are new
+    def load(self, path):
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        entry = self.index.get(key)
+        if entry is None or entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            # modified or new: the hash decides whether it has to be parsed again
+            entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': file_hash(path)}
+            self.index[key] = entry
+            self.changed = True
+        cached = os.path.join(self.cache_dir, entry['hash'] + '.npz')
+        if os.path.exists(cached):
+            with np.load(cached) as data:
+                return data['generations'], data['populations'], str(data['layout'])
+        layout = detect_layout(path)
+        generations, populations = parse_series(path, layout)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        np.savez(cached, generations=generations, populations=populations, layout=np.array(layout))
+        return generations, populations, layout
+
+    def save_index(self):
+        if self.changed:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.index_path, 'w') as file:
+                json.dump(self.index, file, indent=1)
+            self.changed = False
+
+
+# every population file of a directory (or the given files) as name -> (generations, populations),
+# empty files are left out
+def load_series(paths=DATA_DIR, cache_dir=CACHE_DIR, pattern='*.csv'):
+    if isinstance(paths, str):
+        paths = sorted(glob.glob(os.path.join(paths, pattern))) if os.path.isdir(paths) else [paths]
+    cache = SeriesCache(cache_dir) if cache_dir else None
+    series = {}
+    for path in paths:
+        if cache is not None:
+            generations, populations, layout = cache.load(path)
+        else:
+            generations, populations = parse_series(path)
+        if len(populations):
+            series[os.path.splitext(os.path.basename(path))[0]] = (generations, populations)
+    if cache is not None:
+        cache.save_index()
+    return series
+
+
+# the series as one runs x generations array, column g holding generation g, padded with NaN
+def aligned(series, generations=None):
+    names = list(series)
+    last = max((int(gens[-1]) for gens, pops in series.values()), default=-1)
+    length = last + 1 if generations is None else generations
+    populations = np.full((len(names), length), np.nan)
+    for row, name in enumerate(names):
+        gens, pops = series[name]
+        keep = gens < length
+        populations[row, gens[keep].astype(np.int64)] = pops[keep]
+    return names, populations
+
+
+# index of the first and last generation of every run
+def extents(populations):
+    valid = ~np.isnan(populations)
+    first = valid.argmax(axis=1)
+    last = populations.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)
+    return first, last
+
+
+# the values of the last window generations of every run, NaN where a run is shorter
+def last_window(populations, window=WINDOW):
+    first, last = extents(populations)
+    columns = last[:, None] - np.arange(window)[None, :]
+    values = populations[np.arange(len(populations))[:, None], np.maximum(columns, 0)]
+    return np.where(columns >= first[:, None], values, np.nan)
+
+
+def plateau(populations, window=WINDOW):
+    values = last_window(populations, window)
+    return np.nanmean(values, axis=1), np.nanstd(values, axis=1)
+
+
+# mean and variance of every window of window generations, NaN unless all of them are there
+def rolling_moments(populations, window=WINDOW):
+    valid = ~np.isnan(populations)
+    values = np.where(valid, populations, 0.0)
+    # window sums as differences of cumulative sums, which start with a 0 column
+    totals = []
+    for column in (values, values * values, valid):
+        total = np.zeros((len(populations), populations.shape[1] + 1))
+        np.cumsum(column, axis=1, out=total[:, 1:])
+        totals.append(total[:, window:] - total[:, :-window])
+    sums, squares, counts = totals
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(counts == window, sums / counts, np.nan)
+        variance = np.maximum(squares / counts - mean * mean, 0.0)
+    return mean, variance
+
+
+def rolling_variance(populations, window=WINDOW):
+    return rolling_moments(populations, window)[1]
+
+
+# first generation after which the mean of every window stays at the plateau level
+def time_to_stability(populations, window=WINDOW, rel_tolerance=REL_TOLERANCE, z_limit=Z_LIMIT):
+    level, spread = plateau(populations, window)
+    mean = rolling_moments(populations, window)[0]
+    # the difference of two window means has a standard error of spread * sqrt(2 / window)
+    tolerance = np.maximum(rel_tolerance * np.maximum(np.abs(level), 1.0), z_limit * spread * np.sqrt(2 / window))
+    with np.errstate(invalid='ignore'):
+        off = np.abs(mean - level[:, None]) > tolerance[:, None]
+    first, last = extents(populations)
+    complete = last - first + 1 >= window
+    # windows after the last one that is off the plateau, counted from the window start
+    last_off = np.where(off.any(axis=1), mean.shape[1] - 1 - off[:, ::-1].argmax(axis=1), first - 1)
+    return np.where(complete, np.maximum(last_off + 1, first), np.nan)
+
+
+# least-squares slope of the log population over the first window generations
+def growth_rate(populations, window=WINDOW):
+    first, last = extents(populations)
+    columns = first[:, None] + np.arange(window)[None, :]
+    values = populations[np.arange(len(populations))[:, None], np.minimum(columns, populations.shape[1] - 1)]
+    valid = (columns <= last[:, None]) & ~np.isnan(values)
+    logs = np.where(valid, np.log(np.maximum(np.where(valid, values, 1.0), 1.0)), 0.0)
+    x = np.where(valid, np.arange(window)[None, :], 0.0)
+    counts = valid.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = x.sum(axis=1) / counts
+        y_mean = logs.sum(axis=1) / counts
+        dx = np.where(valid, x - x_mean[:, None], 0.0)
+        slope = (dx * (logs - y_mean[:, None])).sum(axis=1) / (dx * dx).sum(axis=1)
+    return np.where(counts > 1, slope, np.nan)
+
+
+# one row of statistics per run
+def summarize(populations, window=WINDOW):
+    first, last = extents(populations)
+    rows = np.arange(len(populations))
+    level, spread = plateau(populations, window)
+    return {
+        'length': last - first + 1,
+        'final': populations[rows, last],
+        'peak': np.nanmax(populations, axis=1),
+        'plateau': level,
+        'plateau_std': spread,
+        'time_to_stability': time_to_stability(populations, window),
+        'growth_rate': growth_rate(populations, window),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise the population series of many runs.")
+    parser.add_argument('paths', nargs='*', default=[DATA_DIR], help="population files or directories")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="directory of the parsed series")
+    parser.add_argument('--no-cache', action='store_true', help="parse every file again")
+    parser.add_argument('--window', type=int, default=WINDOW, help="generations in each window")
+    parser.add_argument('--out', help="write the summary to this CSV file")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    series = {}
+    for path in args.paths:
+        series.update(load_series(path, None if args.no_cache else args.cache_dir))
+    loaded = time.perf_counter() - start
+    names, populations = aligned(series)
+    summary = summarize(populations, args.window)
+    print(f"{len(names)} runs, up to {populations.shape[1]} generations, loaded in {loaded * 1e3:.1f} ms")
+    print(f"{'run':20s}" + ''.join(f"{column:>18s}" for column in SUMMARY_COLUMNS))
+    for row, name in enumerate(names):
+        print(f"{name:20s}" + ''.join(f"{summary[column][row]:18.4g}" for column in SUMMARY_COLUMNS))
+    if args.out:
+        with open(args.out, 'w') as file:
+            file.write(','.join(('run',) + SUMMARY_COLUMNS) + '\n')
+            for row, name in enumerate(names):
+                file.write(','.join([name] + [repr(float(summary[column][row])) for column in SUMMARY_COLUMNS]) + '\n')
+
+
+if __name__ == "__main__":
+    main()
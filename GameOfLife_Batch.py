@@ -0,0 +1,276 @@
+'''
+
+Title: Headless Batch Runner for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file runs parameter sweeps of the rule variants without a window.
+A sweep spec lists the values to try for every parameter, the runs are the cartesian product
+of those lists, and they are spread over a process pool. Every run starts from a random grid
+with the given density and seed and streams its population series to the output directory
+with the PopulationRecorder, in the same layout as AliveCells.csv. A runs.json manifest maps
+every file to its parameters.
+With --steady, runs that reach a cycle or a stationary population are stopped early (stop) or have
+the rest of their series filled in from the cycle (fast_forward), see GameOfLife_SteadyState.py. A
+stationary population has no cycle to repeat, so with fast_forward it is stopped as well; runs.json
+records for every run whether its series was filled in to the full number of generations.
+With --checkpoint N every run saves a checkpoint every N generations; running the same sweep again
+after an interruption resumes the unfinished runs from their checkpoints. A replay history is then
+only kept from the resumed generation.
+With --sequential the sacrifice pre-game is played in a random order and the selfish kills are made
+in row-major order, on the backend given with --backend (see GameOfLife_Kernels.py). The og rule and
+the simultaneous sacrifice rule can instead be stepped on the bit-packed board with --backend bitboard
+(see GameOfLife_Bitboard.py); the board is then only unpacked for the history, checkpoints and
+steady-state detection.
+
+Example:
+python GameOfLife_Batch.py --rule death_probability --masks all --pdeath 0.1 0.3 0.5 0.7 --seeds 0 1 2 --densities 0.2 0.4 --generations 500 --out runs
+
+The same sweep can be given as a JSON file with --spec, using the keys of DEFAULT_SPEC.
+
+'''
+
+# importing all the dependencies
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from GameOfLife_CounterRNG import GRID, CounterRNG
+from GameOfLife_Kernels import BACKENDS
+from GameOfLife_Engine import initialize_selfishness, life_step, masks, sacrifice_step, selfish_step
+from GameOfLife_RuleTable import compile_rule, table_step
+from GameOfLife_Bitboard import pack_grid, population, step_packed, unpack_grid
+from GameOfLife_Recorder import PopulationRecorder
+from GameOfLife_History import HistoryWriter
+from GameOfLife_SteadyState import SteadyStateDetector
+from GameOfLife_Checkpoint import CheckpointWriter
+
+
+# default values of a sweep, every list is one axis of the sweep
+DEFAULT_SPEC = {
+    'rule': 'og',  # og, sacrifice, death_probability or selfish
+    'rows': 60,
+    'cols': 80,
+    'generations': 500,
+    'seeds': [0],
+    'densities': [0.3],
+    'n': [2],  # sacrifice
+    'sequential': False,  # sacrifice, play the pre-game in a random order; selfish, kill in row-major order
+    'backend': 'jit',  # python, numpy or jit, for the sequential rules; bitboard for og and sacrifice
+    'masks': ['Standard'],  # death_probability, 'all' for every mask
+    'pdeath': [0.5],  # death_probability
+    'selfishness': [0.25],  # selfish, as a fraction of the alive cells
+    'history': False,  # also record every generation of every run for replay
+    'steady': 'off',  # on a cycle or stationary population: off, stop, or fast_forward the series
+    'checkpoint': 0,  # generations between checkpoints of every run, 0 for none
+}
+
+BITBOARD_RULES = ('og', 'sacrifice')  # the rules the bitboard backend steps, without --sequential
+
+# the parameters swept for each rule
+RULE_PARAMETERS = {
+    'og': [],
+    'sacrifice': ['n'],
+    'death_probability': ['masks', 'pdeath'],
+    'selfish': ['selfishness'],
+}
+
+
+# expanding a sweep spec into the list of single runs
+def expand_sweep(spec):
+    spec = {**DEFAULT_SPEC, **spec}
+    rule = spec['rule']
+    if rule not in RULE_PARAMETERS:
+        raise ValueError(f"Unknown rule {rule!r}, expected one of {sorted(RULE_PARAMETERS)}")
+    if spec['backend'] == 'bitboard' and (rule not in BITBOARD_RULES or spec['sequential']):
+        raise ValueError(f"The bitboard backend only steps the {' and '.join(BITBOARD_RULES)} rules, "
+                         f"without sequential")
+    if spec['masks'] == 'all' or spec['masks'] == ['all']:
+        spec['masks'] = list(masks)
+    axes = ['seeds', 'densities'] + RULE_PARAMETERS[rule]
+    runs = []
+    for values in itertools.product(*(spec[axis] for axis in axes)):
+        run = {'rule': rule, 'rows': spec['rows'], 'cols': spec['cols'], 'generations': spec['generations'],
+               'sequential': spec['sequential'], 'backend': spec['backend'], 'history': spec['history'],
+               'steady': spec['steady'], 'checkpoint': spec['checkpoint']}
+        run.update(zip(axes, values))
+        runs.append(run)
+    return runs
+
+
+# file name of a run from its parameters
+def run_name(run):
+    parts = [run['rule'], f"seed-{run['seeds']}", f"density-{run['densities']}"]
+    for axis in RULE_PARAMETERS[run['rule']]:
+        parts.append(f"{axis}-{run[axis]}")
+    return '_'.join(parts) + '.csv'
+
+
+# random starting grid of a run
+def initial_grid(run, rng):
+    return (rng.at(0).field((run['rows'], run['cols']), GRID) < run['densities']).astype(float)
+
+
+# steady-state detector suited to the rule of a run, None when detection is off
+def steady_state_detector(run):
+    if run['steady'] == 'off':
+        return None
+    deterministic = run['rule'] == 'og' or (run['rule'] == 'sacrifice' and not run['sequential'])
+    return SteadyStateDetector(deterministic, absorbing=run['rule'] == 'death_probability')
+
+
+# running one simulation and returning the alive cells of every generation,
+# which are also streamed to the recorder and the grids to the history writer when given
+# the run ends early when the detector finds a steady state, and carries on from its checkpoint
+# file when one is given and exists
+def run_single(run, recorder=None, history=None, detector=None, checkpoint_path=None):
+    # one counter-based generator seeded by the run draws the starting grid and then the random deaths
+    rng = CounterRNG(run['seeds'])
+    grid = initial_grid(run, rng)
+    rule = run['rule']
+    selfishness = None
+    if rule == 'selfish':
+        selfishness = initialize_selfishness(grid, run['selfishness'], rng.at(0))
+    alive_cells_array = np.zeros(run['generations'])
+    first_generation = 0
+    checkpoints = None
+    if checkpoint_path is not None:
+        checkpoints = CheckpointWriter(checkpoint_path, run['checkpoint'], rng, run,
+                                       lambda: {'selfishness': selfishness} if rule == 'selfish' else {}, recorder)
+        if checkpoints.exists():
+            state = checkpoints.resume()
+            grid, first_generation = state['grid'], state['generation']
+            # the series is read back from the recorder, without one the checkpoint holds no series
+            alive_cells_array[state['generations'].astype(int) - 1] = state['populations']
+            if rule == 'selfish':
+                selfishness = state['extra']['selfishness']
+    # the bitboard backend keeps the board packed and only unpacks it when a grid is needed
+    packed = run['backend'] == 'bitboard'
+    unpack = history is not None or checkpoints is not None or detector is not None
+    if packed:
+        words = pack_grid(grid)
+    for generation in range(first_generation, run['generations']):
+        draws = rng.at(generation)
+        if packed:
+            words = step_packed(words, run['cols'], run['n'] if rule == 'sacrifice' else None)
+            if unpack:
+                grid = unpack_grid(words, run['cols'])
+        elif rule == 'og':
+            grid = life_step(grid)
+        elif rule == 'sacrifice':
+            grid = sacrifice_step(grid, run['n'], run['sequential'], draws, run['backend'])
+        elif rule == 'selfish':
+            grid, selfishness = selfish_step(grid, selfishness, run['selfishness'], draws, run['sequential'],
+                                             run['backend'])
+        else:
+            grid = table_step(grid, compile_rule(masks[run['masks']]), run['pdeath'], draws)
+        alive_cells_array[generation] = population(words) if packed else np.sum(grid)
+        if recorder is not None:
+            recorder.append(generation + 1, alive_cells_array[generation])
+        if history is not None:
+            history.append(grid, generation + 1)
+        if checkpoints is not None:
+            checkpoints.append(grid, generation + 1, alive_cells_array[generation])
+        if detector is not None and detector.update(grid, generation + 1, alive_cells_array[generation]):
+            alive_cells_array = alive_cells_array[:generation + 1]
+            if run['steady'] == 'fast_forward' and detector.repeats():
+                # a cycle repeats forever, so the rest of the series is known without stepping
+                alive_cells_array = detector.extrapolate(alive_cells_array, run['generations'])
+                if recorder is not None:
+                    generations = np.arange(generation + 2, len(alive_cells_array) + 1)
+                    recorder.extend(np.column_stack([generations, alive_cells_array[generation + 1:]]))
+            break
+    if checkpoints is not None:
+        checkpoints.close(save=False)
+    return alive_cells_array
+
+
+# running one simulation and writing its population series, used by the process pool
+def run_to_file(job):
+    run, out_dir = job
+    path = os.path.join(out_dir, run_name(run))
+    history = None
+    if run['history']:
+        history = HistoryWriter(path[:-len('.csv')] + '.golh', run['rows'], run['cols'])
+    detector = steady_state_detector(run)
+    checkpoint_path = path[:-len('.csv')] + '.ckpt.npz' if run['checkpoint'] else None
+    with PopulationRecorder(path) as recorder:
+        run_single(run, recorder, history, detector, checkpoint_path)
+    if history is not None:
+        history.close()
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        # the run is complete and is not resumed again
+        os.remove(checkpoint_path)
+    steady_state = None
+    if detector is not None and detector.kind is not None:
+        steady_state = {'kind': detector.kind, 'period': detector.period, 'generation': detector.generation,
+                        'filled': run['steady'] == 'fast_forward' and detector.repeats()}
+    return path, steady_state
+
+
+# running every run of a sweep over a pool of processes
+def run_sweep(spec, out_dir, workers=None):
+    runs = expand_sweep(spec)
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count()
+    jobs = [(run, out_dir) for run in runs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # a few runs per task keeps the pool busy without paying for one message per run
+        chunksize = max(1, len(jobs) // (workers * 4))
+        results = list(pool.map(run_to_file, jobs, chunksize=chunksize))
+    paths = [path for path, steady_state in results]
+    manifest = {}
+    for (path, steady_state), run in zip(results, runs):
+        manifest[os.path.basename(path)] = {**run, 'steady_state': steady_state}
+    with open(os.path.join(out_dir, 'runs.json'), 'w') as jsonfile:
+        json.dump(manifest, jsonfile, indent=2)
+    return paths
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run Game of Life parameter sweeps without a window.")
+    parser.add_argument('--spec', help="JSON file with the sweep spec")
+    parser.add_argument('--rule', choices=sorted(RULE_PARAMETERS))
+    parser.add_argument('--rows', type=int)
+    parser.add_argument('--cols', type=int)
+    parser.add_argument('--generations', type=int)
+    parser.add_argument('--seeds', type=int, nargs='+')
+    parser.add_argument('--densities', type=float, nargs='+')
+    parser.add_argument('--n', type=int, nargs='+')
+    parser.add_argument('--sequential', action='store_true', default=None,
+                        help="play the sacrifice pre-game in a random order, or make the selfish kills in row-major order")
+    parser.add_argument('--backend', choices=BACKENDS + ('bitboard',),
+                        help="backend of the sequential rules, or bitboard for the og and sacrifice rules")
+    parser.add_argument('--masks', nargs='+', help="mask names, or 'all'")
+    parser.add_argument('--pdeath', type=float, nargs='+')
+    parser.add_argument('--selfishness', type=float, nargs='+', help="selfishness levels from 0 to 1")
+    parser.add_argument('--history', action='store_true', default=None, help="record every generation for replay")
+    parser.add_argument('--steady', choices=['off', 'stop', 'fast_forward'],
+                        help="what to do when a run reaches a cycle or a stationary population")
+    parser.add_argument('--checkpoint', type=int, help="save every run every this many generations and resume interrupted runs")
+    parser.add_argument('--out', default='runs', help="output directory")
+    parser.add_argument('--workers', type=int, help="number of processes, all cores by default")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    spec = {}
+    if args.spec:
+        with open(args.spec) as jsonfile:
+            spec = json.load(jsonfile)
+    for key in DEFAULT_SPEC:
+        value = getattr(args, key)
+        if value is not None:
+            spec[key] = value
+    start = time.perf_counter()
+    paths = run_sweep(spec, args.out, args.workers)
+    print(f"{len(paths)} runs written to {args.out} in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
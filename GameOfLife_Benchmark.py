@@ -0,0 +1,368 @@
+'''
+
+Title: Benchmark Suite for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file times every rule variant on its own, without the input() prompts or the
+pygame window of the scripts. The cases are OG, Sacrifice for each n, DeathProbability for each
+mask in masks and Selfish at several levels, each run on every grid size and initial density of
+the matrix. The sequential Sacrifice pre-game and the sequential Selfish kills are timed on every
+backend of GameOfLife_Kernels.py that is available, and OG and Sacrifice also on the bit-packed board
+of GameOfLife_Bitboard.py (the bitboard backend). On small grids the cell by cell update_grid of the
+original Sacrifice and Selfish scripts is timed as well (the _script cases) and every sequential case
+is reported as a whole-step speedup over it. For each case it reports:
+gens/sec     -> generations stepped per second
+ns/cell      -> nanoseconds per cell per generation
+peak_mb      -> peak memory allocated while stepping, measured with tracemalloc in a separate run
+render_ms    -> time to draw one frame with the GridRenderer (SDL dummy driver, small grids only)
+
+The speedups are of whole steps: drawing the visit order and the whole-grid rules around the kernels
+are not compiled, so a step gains much less than its kernel does over the Python loops. Every case
+below TARGET_SPEEDUP is flagged; the Selfish kills have no NumPy backend and without Numba they stay
+below it on small grids.
+
+Results can be saved as a JSON baseline. When a baseline is given, every case slower than its
+stored ns/cell by more than the tolerance is flagged as a regression and the exit code is 1.
+
+Example:
+python GameOfLife_Benchmark.py --sizes 100 500 --densities 0.3 --save benchmark_baseline.json
+python GameOfLife_Benchmark.py --sizes 100 500 --densities 0.3 --baseline benchmark_baseline.json
+
+'''
+
+# importing all the dependencies
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import numpy as np
+from GameOfLife_CounterRNG import GRID, CounterRNG
+from GameOfLife_Kernels import BACKENDS, numba, resolve_backend
+from GameOfLife_Engine import initialize_selfishness, life_step, masks, sacrifice_step, selfish_step
+from GameOfLife_RuleTable import compile_rule, table_step
+from GameOfLife_Bitboard import pack_grid, step_packed
+
+
+SIZES = [100, 500, 1000]  # square grids of size x size
+DENSITIES = [0.1, 0.3]
+SACRIFICE_N = [1, 2, 3, 4]
+PDEATH = 0.5
+SELFISHNESS_LEVELS = [0.0, 0.25, 0.5]
+MIN_TIME = 0.5  # seconds each case is stepped for at least
+RENDER_MAX_CELLS = 200 * 200  # the renderer draws every cell outline once, so only small grids are drawn
+CELL_SIZE = 10
+SCRIPT_MAX_CELLS = 200 * 200  # the cell by cell steps of the original scripts are only timed on small grids
+TARGET_SPEEDUP = 50  # whole-step speedup over the original scripts asked of the sequential rules
+TOLERANCE = 0.2  # a case more than 20% slower than its baseline is a regression
+
+
+# every case of the suite as (name, rule, parameter), a backend which falls back to another one
+# is left out
+def benchmark_cases(sacrifice_n=SACRIFICE_N, selfishness_levels=SELFISHNESS_LEVELS,
+                    backends=BACKENDS + ('bitboard',)):
+    cases = [('og', 'og', None)]
+    cases += [(f'sacrifice_n-{n}', 'sacrifice', n) for n in sacrifice_n]
+    if 'bitboard' in backends:
+        cases += [('og_bitboard', 'bitboard', None)]
+        cases += [(f'sacrifice_n-{n}_bitboard', 'bitboard', n) for n in sacrifice_n]
+    cases += [(f'death_probability_{name}', 'death_probability', name) for name in masks]
+    cases += [(f'selfish_level-{level}', 'selfish', level) for level in selfishness_levels]
+    cases += [(f'sacrifice_script_n-{n}', 'sacrifice_script', n) for n in sacrifice_n]
+    cases += [(f'selfish_script_level-{level}', 'selfish_script', level) for level in selfishness_levels]
+    for kernel, rule, parameters in (('sacrifice', 'sacrifice_sequential', sacrifice_n),
+                                     ('kill_sweep', 'selfish_sequential', selfishness_levels)):
+        for backend in backends:
+            if backend == 'bitboard' or resolve_backend(kernel, backend) != backend:
+                continue
+            name = 'n' if kernel == 'sacrifice' else 'level'
+            cases += [(f'{rule}_{name}-{value}_{backend}', rule, (value, backend)) for value in parameters]
+    return cases
+
+
+# counting the neighbours of one cell like the original scripts
+def script_count_neighbors(grid, row, col):
+    rows, cols = grid.shape
+    count = 0
+    for i in range(-1, 2):
+        for j in range(-1, 2):
+            if (i or j) and 0 <= row + i < rows and 0 <= col + j < cols:
+                count += grid[row + i][col + j]
+    return count
+
+
+# the cell by cell update_grid of the original Sacrifice script
+def script_sacrifice_step(grid, n):
+    new_grid = grid.copy()
+    for row, col in zip(*np.nonzero(grid == 1)):
+        if script_count_neighbors(grid, row, col) == n:
+            new_grid[row][col] = 0
+    for row, col in np.ndindex(grid.shape):
+        neighbors = script_count_neighbors(grid, row, col)
+        if grid[row][col] == 1:
+            if neighbors < 2 or neighbors > 3:
+                new_grid[row][col] = 0
+        elif neighbors == 3:
+            new_grid[row][col] = 1
+    return new_grid
+
+
+# the kill_neighbors walk of the original Selfish script
+def script_kill_neighbors(grid, row, col):
+    neighbors = script_count_neighbors(grid, row, col)
+    for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:
+        while neighbors >= 3:
+            new_row, new_col = row + dy, col + dx
+            if 0 <= new_row < grid.shape[0] and 0 <= new_col < grid.shape[1] and grid[new_row][new_col] == 1:
+                grid[new_row][new_col] = 0
+                neighbors -= 1
+                row, col = new_row, new_col
+            else:
+                break
+
+
+# the cell by cell update_grid of the original Selfish script; the script also drew the whole
+# selfishness plane again for every cell, which is left out so only the stepping is compared
+def script_selfish_step(grid, selfishness, level, generator):
+    new_grid = grid.copy()
+    for row, col in np.ndindex(grid.shape):
+        neighbors = script_count_neighbors(grid, row, col)
+        if selfishness[row][col] == 1:
+            if grid[row][col] == 1:
+                if neighbors >= 4:
+                    selfishness[row][col] += 1
+                    script_kill_neighbors(new_grid, row, col)
+                elif neighbors <= 1:
+                    if selfishness[row][col] >= 1:
+                        selfishness[row][col] -= 1
+                    else:
+                        grid[row][col] = 0
+            elif neighbors == 3 or neighbors == 4:
+                new_grid[row][col] = 1
+                selfishness[row][col] = 1 if generator.random() < level else 0
+        elif grid[row][col] == 1:
+            if neighbors < 2 or neighbors > 3:
+                new_grid[row][col] = 0
+        elif neighbors == 3:
+            new_grid[row][col] = 1
+    return new_grid
+
+
+# function advancing a grid by one generation under a rule, with its own state and generator
+def make_stepper(rule, parameter, grid, rng):
+    if rule == 'og':
+        return life_step
+    if rule == 'sacrifice':
+        return lambda grid: sacrifice_step(grid, parameter)
+    if rule == 'sacrifice_script':
+        return lambda grid: script_sacrifice_step(grid, parameter)
+    state = {'generation': 0}
+    if rule == 'bitboard':
+        # the packed board is kept by the stepper, the grid passed along is not used
+        state['words'] = pack_grid(grid)
+
+        def step_words(grid):
+            state['words'] = step_packed(state['words'], grid.shape[1], parameter)
+            return grid
+        return step_words
+
+    # the random numbers of the next generation
+    def draws():
+        state['generation'] += 1
+        return rng.at(state['generation'] - 1)
+    if rule == 'sacrifice_sequential':
+        n, backend = parameter
+        return lambda grid: sacrifice_step(grid, n, True, draws(), backend)
+    if rule == 'death_probability':
+        table = compile_rule(masks[parameter])
+        return lambda grid: table_step(grid, table, PDEATH, draws())
+    level, sequential, backend = parameter, False, None
+    if rule == 'selfish_sequential':
+        (level, backend), sequential = parameter, True
+    state['selfishness'] = initialize_selfishness(grid, level, rng.at(0))
+    if rule == 'selfish_script':
+        generator = random.Random(0)
+        return lambda grid: script_selfish_step(grid, state['selfishness'], level, generator)
+
+    def step(grid):
+        grid, state['selfishness'] = selfish_step(grid, state['selfishness'], level, draws(), sequential, backend)
+        return grid
+    return step
+
+
+# stepping one case for at least min_time seconds
+def time_stepping(rule, parameter, size, density, min_time=MIN_TIME, seed=0):
+    rng = CounterRNG(seed)
+    grid = (rng.at(0).field((size, size), GRID) < density).astype(float)
+    step = make_stepper(rule, parameter, grid, rng)
+    grid = step(grid)  # warm up
+    generations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        grid = step(grid)
+        generations += 1
+        elapsed = time.perf_counter() - start
+    return generations, elapsed
+
+
+# peak memory allocated while stepping a few generations
+def peak_memory(rule, parameter, size, density, generations=3, seed=0):
+    rng = CounterRNG(seed)
+    grid = (rng.at(0).field((size, size), GRID) < density).astype(float)
+    step = make_stepper(rule, parameter, grid, rng)
+    tracemalloc.start()
+    for generation in range(generations):
+        grid = step(grid)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+# average time to draw one frame, None for grids too large to draw
+def render_frame_time(size, density, frames=20, seed=0):
+    if size * size > RENDER_MAX_CELLS:
+        return None
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    from GameOfLife_Renderer import GridRenderer
+
+    pygame.init()
+    screen = pygame.display.set_mode((size * CELL_SIZE, size * CELL_SIZE))
+    renderer = GridRenderer(size, size, CELL_SIZE)
+    grid = (np.random.default_rng(seed).random((size, size)) < density).astype(float)
+    texts = [("Generation: 0", (10, 10)), (f"Alive Cells: {int(np.sum(grid))}", (10, 50))]
+    renderer.draw(screen, grid, texts)  # warm up
+    start = time.perf_counter()
+    for frame in range(frames):
+        grid = life_step(grid)
+        texts[1] = (f"Alive Cells: {int(np.sum(grid))}", (10, 50))
+        renderer.draw(screen, grid, texts)
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    return elapsed / frames
+
+
+# running the whole matrix, one result per case, size and density
+def run_benchmarks(sizes=SIZES, densities=DENSITIES, cases=None, min_time=MIN_TIME, render=True):
+    cases = cases or benchmark_cases()
+    results = {}
+    render_times = {}
+    for size in sizes:
+        for density in densities:
+            if render:
+                render_times[size, density] = render_frame_time(size, density)
+            for name, rule, parameter in cases:
+                if rule.endswith('_script') and size * size > SCRIPT_MAX_CELLS:
+                    continue
+                generations, elapsed = time_stepping(rule, parameter, size, density, min_time)
+                key = f"{name}/{size}x{size}/density-{density}"
+                results[key] = {
+                    'gens_per_sec': generations / elapsed,
+                    'ns_per_cell': elapsed / generations / (size * size) * 1e9,
+                    'peak_mb': peak_memory(rule, parameter, size, density) / 2 ** 20,
+                    'render_ms': None if render_times.get((size, density)) is None
+                    else render_times[size, density] * 1e3,
+                }
+                print_result(key, results[key])
+    return results
+
+
+def print_result(key, result):
+    render_ms = '-' if result['render_ms'] is None else f"{result['render_ms']:.2f}"
+    print(f"{key:55s} {result['gens_per_sec']:10.1f} gens/s {result['ns_per_cell']:8.2f} ns/cell "
+          f"{result['peak_mb']:8.2f} MB  render {render_ms} ms")
+
+
+# whole-step speedup of every sequential case over the original script on the same grid
+def script_speedups(results):
+    speedups = {}
+    for key, result in results.items():
+        name, size, density = key.split('/')
+        for rule in ('sacrifice', 'selfish'):
+            if name.startswith(rule + '_sequential_'):
+                value = name[len(rule + '_sequential_'):].rsplit('_', 1)[0]
+                script = results.get(f"{rule}_script_{value}/{size}/{density}")
+                if script is not None:
+                    speedups[key] = script['ns_per_cell'] / result['ns_per_cell']
+    return speedups
+
+
+def print_speedups(speedups, target=TARGET_SPEEDUP):
+    if not speedups:
+        return
+    print(f"\nWhole-step speedups of the sequential rules over the original scripts (target {target}x):")
+    for key, speedup in speedups.items():
+        print(f"{key:55s} {speedup:8.1f}x{'' if speedup >= target else '  below the target'}")
+    below = sum(speedup < target for speedup in speedups.values())
+    print(f"{below} of {len(speedups)} cases are below the {target}x target, "
+          f"from {min(speedups.values()):.1f}x to {max(speedups.values()):.1f}x")
+
+
+# cases slower than their baseline by more than the tolerance
+def find_regressions(results, baseline, tolerance=TOLERANCE):
+    regressions = {}
+    for key, result in results.items():
+        stored = baseline.get('results', {}).get(key)
+        if stored is None:
+            continue
+        ratio = result['ns_per_cell'] / stored['ns_per_cell']
+        if ratio > 1 + tolerance:
+            regressions[key] = ratio
+    return regressions
+
+
+def save_baseline(path, results):
+    baseline = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'numba': numba.__version__ if numba is not None else None,
+        'machine': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w') as jsonfile:
+        json.dump(baseline, jsonfile, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every Game of Life rule variant.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help="grids are size x size")
+    parser.add_argument('--densities', type=float, nargs='+', default=DENSITIES)
+    parser.add_argument('--n', type=int, nargs='+', default=SACRIFICE_N, help="sacrifice n values")
+    parser.add_argument('--selfishness', type=float, nargs='+', default=SELFISHNESS_LEVELS)
+    parser.add_argument('--rules', nargs='+', help="only the cases whose name starts with one of these")
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS + ('bitboard',),
+                        default=list(BACKENDS) + ['bitboard'],
+                        help="backends of the sequential cases, bitboard for the og and sacrifice cases")
+    parser.add_argument('--min-time', type=float, default=MIN_TIME, help="seconds each case is stepped for")
+    parser.add_argument('--no-render', action='store_true', help="skip the render-frame timing")
+    parser.add_argument('--save', help="write the results to this JSON baseline")
+    parser.add_argument('--baseline', help="compare against this JSON baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    cases = benchmark_cases(args.n, args.selfishness, args.backends)
+    if args.rules:
+        cases = [case for case in cases if case[0].startswith(tuple(args.rules))]
+    results = run_benchmarks(args.sizes, args.densities, cases, args.min_time, not args.no_render)
+    print_speedups(script_speedups(results))
+    if args.save:
+        save_baseline(args.save, results)
+    if args.baseline:
+        with open(args.baseline) as jsonfile:
+            regressions = find_regressions(results, json.load(jsonfile), args.tolerance)
+        for key, ratio in regressions.items():
+            print(f"REGRESSION {key}: {ratio:.2f}x slower than the baseline")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+'''
+
+Title: Bit-packed Bitboard Backend for Conway's Game of Life
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file stores the board as 64 cells per uint64 word instead of one float per cell.
+Bit b of word w in a row is the cell in column 64 * w + b. The eight neighbours of every cell are
+produced by shifting whole words (carrying the edge bits between words) and are added with
+bitwise full adders into four bit planes holding the neighbour count 0-8. The rules are then
+tested on the bit planes, so a generation touches each word a fixed number of times.
+
+The bounded edges of the original game are kept: bits beyond the last column and rows outside
+the board are always dead. pack_grid and unpack_grid convert to and from the normal grid, so
+draw_grid and the alive cells counts keep working.
+
+A 10000x10000 board takes 12.5 MB. Large boards are stepped in bands of rows so the temporary
+bit planes stay small as well.
+
+'''
+
+# importing all the dependencies
+import numpy as np
+
+
+WORD_BITS = 64
+CHUNK_ROWS = 1024  # rows stepped together, bounds the temporary memory
+
+# number of set bits in every byte, used when np.bitwise_count is not available
+BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+# number of words needed to hold a row of cols cells
+def words_per_row(cols):
+    return (cols + WORD_BITS - 1) // WORD_BITS
+
+
+# packing a 0/1 grid into rows of uint64 words
+def pack_grid(grid):
+    rows, cols = grid.shape
+    bits = np.zeros((rows, words_per_row(cols) * WORD_BITS), dtype=np.uint8)
+    bits[:, :cols] = grid != 0
+    packed = np.packbits(bits, axis=1, bitorder='little')
+    return packed.view('<u8').astype(np.uint64)
+
+
+# unpacking the words back into a float grid like initialize_grid makes
+def unpack_grid(words, cols):
+    bytes_ = np.ascontiguousarray(words.astype('<u8')).view(np.uint8)
+    bits = np.unpackbits(bytes_, axis=1, bitorder='little')
+    return bits[:, :cols].astype(float)
+
+
+# counting the alive cells directly from the words
+def population(words):
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+    return int(BYTE_POPCOUNT[np.ascontiguousarray(words).view(np.uint8)].sum())
+
+
+# mask of the valid bits in the last word of each row
+def last_word_mask(cols):
+    used = cols % WORD_BITS
+    if used == 0:
+        return np.uint64(0xFFFFFFFFFFFFFFFF)
+    return np.uint64((1 << used) - 1)
+
+
+# every cell's west neighbour (column - 1) moved into the cell's bit
+def shift_west(x):
+    out = x << np.uint64(1)
+    out[..., 1:] |= x[..., :-1] >> np.uint64(WORD_BITS - 1)
+    return out
+
+
+# every cell's east neighbour (column + 1) moved into the cell's bit
+def shift_east(x):
+    out = x >> np.uint64(1)
+    out[..., :-1] |= x[..., 1:] << np.uint64(WORD_BITS - 1)
+    return out
+
+
+# bitwise full adder: the sum and carry bits of a + b + c
+def full_adder(a, b, c):
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+# bit planes of the neighbour count for the middle rows of a band
+def neighbor_count_planes(band):
+    west = shift_west(band)
+    east = shift_east(band)
+    # horizontal sums of each row, with and without the centre cell
+    sum3, carry3 = full_adder(west, band, east)
+    sum2, carry2 = west ^ east, west & east
+
+    up_s, up_c = sum3[:-2], carry3[:-2]
+    mid_s, mid_c = sum2[1:-1], carry2[1:-1]
+    down_s, down_c = sum3[2:], carry3[2:]
+
+    # the count is (up_s + mid_s + down_s) + 2 * (up_c + mid_c + down_c)
+    bit0, twos_a = full_adder(up_s, mid_s, down_s)
+    twos_b, fours_a = full_adder(up_c, mid_c, down_c)
+    bit1 = twos_a ^ twos_b
+    fours_b = twos_a & twos_b
+    bit2 = fours_a ^ fours_b
+    bit3 = fours_a & fours_b
+    return bit0, bit1, bit2, bit3
+
+
+# cells whose neighbour count equals k
+def count_equals(planes, k):
+    ones = np.uint64(0xFFFFFFFFFFFFFFFF)
+    result = np.full(planes[0].shape, ones, dtype=np.uint64)
+    if not 0 <= k <= 8:
+        return np.zeros_like(result)
+    for bit, plane in enumerate(planes):
+        result &= plane if (k >> bit) & 1 else ~plane
+    return result
+
+
+# advancing the packed board by one generation, with the sacrifice pre-game when n is given
+def step_packed(words, cols, n=None):
+    rows = words.shape[0]
+    new_words = np.empty_like(words)
+    # one row of dead cells above and below the board
+    padded = np.zeros((rows + 2, words.shape[1]), dtype=np.uint64)
+    padded[1:-1] = words
+    for start in range(0, rows, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, rows)
+        band = padded[start:stop + 2]
+        alive = band[1:-1]
+        planes = neighbor_count_planes(band)
+        # rule Birth: If there are 3 neighbours for a dead cell birth takes place
+        three = count_equals(planes, 3)
+        # rule Death: If neighbors are less than 2 or greater than 3
+        survive = alive & (count_equals(planes, 2) | three)
+        if n is not None:
+            # sacrificial pre-game: a cell with exactly n neighbours sacrifices itself
+            survive &= ~count_equals(planes, n)
+        new_words[start:stop] = survive | (~alive & three)
+    new_words[:, -1] &= last_word_mask(cols)
+    return new_words
+
+
+# Conway's nature rules on the packed board
+def life_step_packed(words, cols):
+    return step_packed(words, cols)
+
+
+# sacrificial pre-game and nature rules on the packed board
+def sacrifice_step_packed(words, cols, n):
+    return step_packed(words, cols, n)
@@ -0,0 +1,158 @@
+'''
+
+Title: Checkpoint and Resume for Long Game of Life Runs
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file saves the whole state of a run every CHECKPOINT_INTERVAL generations so an
+interrupted run can carry on where it stopped. A checkpoint is one compressed .npz file holding
+grid        -> the grid packed into bits, with its shape
+generation  -> the generation of the grid and its alive cells
+params      -> the rule parameters of the run, as JSON
+rng         -> the state of the counter-based generator (its seed), as JSON
+series      -> the population series up to that generation, read back from the population recorder
+extra_*     -> any other state, such as the selfishness plane of the Selfish rules
+
+The state is copied when a checkpoint is due, which is cheap, and the compression and writing are
+done by a background thread, so checkpointing does not hold up the stepping. The file is written
+next to the old one and renamed over it, so a crash while writing leaves the previous checkpoint.
+
+Resuming restores the grid, the extra state, the random generator and the population series, so
+the run continues with exactly the same generations as if it had never stopped: the random numbers
+of a generation depend only on the seed and the generation (GameOfLife_CounterRNG.py).
+
+'''
+
+# importing all the dependencies
+import json
+import os
+import queue
+import threading
+import numpy as np
+from GameOfLife_Recorder import read_population
+
+
+CHECKPOINT_INTERVAL = 100  # generations between checkpoints
+
+
+# writing one checkpoint, replacing the previous one only once it is complete
+def save_checkpoint(path, state):
+    arrays = {
+        'grid': np.packbits(state['grid'] == 1),
+        'shape': np.array(state['grid'].shape),
+        'generation': np.array(state['generation']),
+        'alive_cells': np.array(state['alive_cells']),
+        'params': np.array(json.dumps(state.get('params', {}))),
+        'rng': np.array(json.dumps(state['rng'])),
+        'generations': np.asarray(state['generations']),
+        'populations': np.asarray(state['populations']),
+    }
+    for name, value in state.get('extra', {}).items():
+        arrays['extra_' + name] = value
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        np.savez_compressed(file, **arrays)
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        shape = tuple(data['shape'])
+        grid = np.unpackbits(data['grid'], count=int(np.prod(shape))).reshape(shape).astype(float)
+        return {
+            'grid': grid,
+            'generation': int(data['generation']),
+            'alive_cells': data['alive_cells'][()],
+            'params': json.loads(str(data['params'])),
+            'rng': json.loads(str(data['rng'])),
+            'generations': data['generations'],
+            'populations': data['populations'],
+            'extra': {name[len('extra_'):]: data[name] for name in data.files if name.startswith('extra_')},
+        }
+
+
+# the population series of the recorder up to the generation, read back from its file so the series
+# is not kept in memory; a reset starts the series again, so only the rows after the last one are kept
+def recorded_series(recorder, generation):
+    if recorder is None:
+        return np.array([]), np.array([])
+    recorder.flush()
+    generations, populations = read_population(recorder.path)
+    restarts = np.flatnonzero(np.diff(generations) <= 0)
+    start = restarts[-1] + 1 if len(restarts) else 0
+    kept = np.arange(start, len(generations))
+    kept = kept[generations[kept] <= generation]
+    return generations[kept], populations[kept]
+
+
+class CheckpointWriter:
+
+    # rng is the generator whose state is saved, extra returns a dict of the other state arrays and
+    # recorder is the PopulationRecorder the population series is read back from
+    def __init__(self, path, interval=CHECKPOINT_INTERVAL, rng=None, params=None, extra=None, recorder=None):
+        self.path = path
+        self.interval = interval
+        self.rng = rng
+        self.params = params or {}
+        self.extra = extra
+        self.recorder = recorder
+        self.last = None  # the latest generation, saved on close
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    # restoring the random generator and population series from the checkpoint file, the series is
+    # written back to the recorder; returns the loaded state
+    def resume(self):
+        state = load_checkpoint(self.path)
+        self.params = state['params']
+        if self.rng is not None:
+            self.rng.state = state['rng']
+        if self.recorder is not None and len(state['generations']):
+            self.recorder.extend(np.column_stack([state['generations'], state['populations']]))
+        return state
+
+    # called after every generation, a checkpoint is queued every interval generations
+    def append(self, grid, generation, alive_cells):
+        rng_state = self.rng.state if self.rng is not None else {}
+        self.last = (grid, generation, alive_cells, rng_state)
+        if generation % self.interval == 0:
+            self.save()
+
+    # copying the latest state and handing it to the writing thread
+    def save(self):
+        if self.last is None:
+            return
+        grid, generation, alive_cells, rng_state = self.last
+        extra = self.extra() if self.extra is not None else {}
+        generations, populations = recorded_series(self.recorder, generation)
+        self.queue.put({
+            'grid': grid.copy(),
+            'generation': generation,
+            'alive_cells': alive_cells,
+            'params': self.params,
+            'rng': rng_state,
+            'generations': generations,
+            'populations': populations,
+            'extra': {name: np.array(value) for name, value in extra.items()},
+        })
+        self.last = None
+
+    def run(self):
+        while True:
+            state = self.queue.get()
+            if state is None:
+                break
+            save_checkpoint(self.path, state)
+
+    # saving the latest generation when save is True and waiting for the writes to finish
+    def close(self, save=True):
+        if save:
+            self.save()
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
@@ -0,0 +1,194 @@
+'''
+
+Title: Counter-based Random Numbers for the Stochastic Game of Life Rules
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: A np.random.Generator is a stream: the number a cell gets depends on how many numbers
+were drawn before it, so a board split into bands, tiles or processes draws different numbers than
+the whole board does. The generator in this file has no stream. The random number of a cell is the
+Philox4x32-10 block cipher applied to its counter, encrypted with the seed:
+key      -> the 64-bit seed, as two 32-bit words
+counter  -> (column, row, generation, stream), one 32-bit word each
+
+so the same cell in the same generation gets the same number wherever and in whatever order it is
+computed. The streams keep the different uses of randomness apart: the starting grid (GRID), the
+DeathProbability deaths (DEATH), the Selfish rule 4 draws (SELFISH), the first selfishness plane
+(SELFISHNESS) and the order of the sequential sacrifice pre-game (ORDER).
+
+CounterRNG holds the seed (or one seed per replica of an ensemble). CounterRNG.at(generation, top,
+left) gives the CounterStream of one generation, for a block whose top-left cell is at (top, left)
+of the board, which the rules draw from:
+uniform()  -> floats in [0, 1) with 53 random bits, for the per-cell draws
+keys()     -> 64-bit integers, for choosing cells: the k cells with the smallest keys are a uniform
+              choice of k cells, the same whichever part of the board each key was computed in
+field()    -> a uniform float for every cell of a block, for random starting grids
+
+A split run only has to agree on the k-th smallest key of the whole board. kth_smallest() finds it
+for keys in one array; a board split over processes finds it with a radix select, exchanging a
+histogram of RADIX_BITS of the keys per round (see GameOfLife_Parallel.py). Two equal 64-bit keys
+would make one extra cell die; among a million candidates this happens once in about 10^8 steps.
+
+The state of the generator is its seed only, so a checkpoint saves the seed and a resumed run draws
+exactly what the uninterrupted run would have drawn.
+
+'''
+
+# importing all the dependencies
+import numpy as np
+
+
+GRID, DEATH, SELFISH, SELFISHNESS, ORDER = range(5)  # the streams, the last word of the counter
+PHILOX_M0, PHILOX_M1 = 0xD2511F53, 0xCD9E8D57
+PHILOX_W0, PHILOX_W1 = 0x9E3779B9, 0xBB67AE85
+ROUNDS = 10
+MASK32 = 0xFFFFFFFF
+RADIX_BITS = 16
+# the known-answer vectors of the Random123 Philox4x32-10 as (counter, key, result)
+KNOWN_ANSWERS = [((0, 0, 0, 0), (0, 0), (0x6627e8d5, 0xe169c58d, 0xbc57ac4c, 0x9b00dbd8)),
+                 ((MASK32,) * 4, (MASK32,) * 2, (0x408f276d, 0x41c83b0e, 0xa20bc7c6, 0x6d5451fd)),
+                 ((0x243f6a88, 0x85a308d3, 0x13198a2e, 0x03707344), (0xa4093822, 0x299f31d0),
+                  (0xd16cfe09, 0x94fdcceb, 0x5001e420, 0x24126ea1))]
+
+
+# the 32-bit high and low words of the product of a and 32-bit words in uint64 arrays
+def mulhilo(a, words):
+    product = words * np.uint64(a)
+    return product >> np.uint64(32), product & np.uint64(MASK32)
+
+
+# Philox4x32 of four counter words with two key words, all uint64 arrays of 32-bit values
+def philox(counter, key, rounds=ROUNDS):
+    c0, c1, c2, c3 = counter
+    k0, k1 = key
+    for turn in range(rounds):
+        if turn:
+            k0 = (k0 + np.uint64(PHILOX_W0)) & np.uint64(MASK32)
+            k1 = (k1 + np.uint64(PHILOX_W1)) & np.uint64(MASK32)
+        hi0, lo0 = mulhilo(PHILOX_M0, c0)
+        hi1, lo1 = mulhilo(PHILOX_M1, c2)
+        c0, c1, c2, c3 = hi1 ^ c1 ^ k0, lo1, hi0 ^ c3 ^ k1, lo0
+    return c0, c1, c2, c3
+
+
+# the two key words of a 64-bit seed
+def seed_key(seed):
+    seed = np.asarray(seed, dtype=object)
+    return (np.asarray(seed & MASK32, dtype=np.uint64),
+            np.asarray((seed >> 32) & MASK32, dtype=np.uint64))
+
+
+class CounterRNG:
+
+    # seed is an int, a list of ints (one per replica of an ensemble) or None for a fresh seed
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = np.random.SeedSequence().entropy & (2 ** 64 - 1)
+        self.seed = seed
+        self.key = seed_key(seed)
+
+    # the random numbers of one generation, for cells counted from (top, left) of the board
+    def at(self, generation, top=0, left=0):
+        return CounterStream(self.key, generation, top, left)
+
+    # the replicas in part, for a slice of an ensemble
+    def replicas(self, part):
+        return CounterRNG(list(np.asarray(self.seed, dtype=object)[part]))
+
+    # the seed is all there is to save and restore
+    @property
+    def state(self):
+        return {'bit_generator': 'Philox4x32', 'seed': self.seed}
+
+    @state.setter
+    def state(self, state):
+        self.seed = state['seed']
+        self.key = seed_key(self.seed)
+
+
+class CounterStream:
+
+    def __init__(self, key, generation, top=0, left=0):
+        self.key = key
+        self.generation = generation
+        self.top, self.left = top, left
+
+    # the four Philox words of every cell; replicas picks the key of each cell when the generator
+    # has one seed per replica
+    def words(self, rows, cols, stream, replicas=None):
+        rows = (np.asarray(rows, dtype=np.int64) + self.top) & MASK32
+        cols = (np.asarray(cols, dtype=np.int64) + self.left) & MASK32
+        rows, cols = rows.astype(np.uint64), cols.astype(np.uint64)
+        key = self.key if replicas is None else (self.key[0][replicas], self.key[1][replicas])
+        counter = (cols, rows, np.full(rows.shape, self.generation & MASK32, dtype=np.uint64),
+                   np.full(rows.shape, stream, dtype=np.uint64))
+        return philox(counter, key)
+
+    # a 64-bit key for every cell, for choosing cells with kth_smallest
+    def keys(self, rows, cols, stream, replicas=None):
+        words = self.words(rows, cols, stream, replicas)
+        return (words[0] << np.uint64(32)) | words[1]
+
+    # a float in [0, 1) for every cell, from 53 bits of two words like np.random does
+    def uniform(self, rows, cols, stream, replicas=None):
+        words = self.words(rows, cols, stream, replicas)
+        return ((words[0] >> np.uint64(5)).astype(float) * 67108864.0
+                + (words[1] >> np.uint64(6)).astype(float)) / 9007199254740992.0
+
+    # a float in [0, 1) for every cell of a shape block
+    def field(self, shape, stream):
+        rows, cols = np.indices(shape)
+        return self.uniform(rows.ravel(), cols.ravel(), stream).reshape(shape)
+
+    # mask of the count cells with the smallest keys among the cells (rows, cols)
+    def choose(self, rows, cols, count, stream, replicas=None):
+        if count >= len(rows) or count <= 0:
+            return np.full(len(rows), count > 0)
+        return smallest(self.keys(rows, cols, stream, replicas), count)
+
+
+# the k-th smallest key, counting from 1
+def kth_smallest(keys, k):
+    return np.partition(keys, k - 1)[k - 1]
+
+
+# mask of the count smallest keys
+def smallest(keys, count):
+    if count >= len(keys) or count <= 0:
+        return np.full(len(keys), count > 0)
+    return keys <= kth_smallest(keys, count)
+
+
+# histogram of the next RADIX_BITS bits below shift of the keys starting with prefix above them
+def radix_histogram(keys, prefix, shift):
+    if shift + RADIX_BITS < 64:
+        keys = keys[(keys >> np.uint64(shift + RADIX_BITS)) == np.uint64(prefix)]
+    digits = (keys >> np.uint64(shift)) & np.uint64((1 << RADIX_BITS) - 1)
+    return np.bincount(digits.astype(np.int64), minlength=1 << RADIX_BITS)
+
+
+# the digit holding the k-th smallest key from the summed histogram of every part,
+# returns the longer prefix and the rank of the key among the keys with that prefix
+def radix_digit(histogram, prefix, k):
+    below = np.cumsum(histogram)
+    digit = int(np.searchsorted(below, k))
+    return (prefix << RADIX_BITS) | digit, k - (int(below[digit - 1]) if digit else 0)
+
+
+# the k-th smallest key of keys split into parts, with one histogram per part and round, the way
+# the processes of a split board find it; equal to kth_smallest of all the keys
+def radix_select(parts, k):
+    prefix = 0
+    for shift in range(64 - RADIX_BITS, -1, -RADIX_BITS):
+        histogram = sum(radix_histogram(keys, prefix, shift) for keys in parts)
+        prefix, k = radix_digit(histogram, prefix, k)
+    return np.uint64(prefix)
+
+
+if __name__ == "__main__":
+    for counter, key, expected in KNOWN_ANSWERS:
+        result = philox([np.array([word], dtype=np.uint64) for word in counter],
+                        [np.uint64(word) for word in key])
+        print(' '.join(f'{int(word[0]):08x}' for word in result),
+              'ok' if tuple(int(word[0]) for word in result) == expected else 'MISMATCH')
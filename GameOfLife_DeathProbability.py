@@ -23,113 +23,133 @@ import pygame
 import numpy as np
 import time
 import matplotlib.pyplot as plt
-import random
-import csv
+from GameOfLife_Engine import masks
+from GameOfLife_CounterRNG import CounterRNG
+from GameOfLife_RuleTable import compile_rule, table_step
+from GameOfLife_Renderer import GridRenderer
+from GameOfLife_Viewport import Viewport
+from GameOfLife_Profiler import PhaseTimer
+from GameOfLife_Worker import SimulationWorker
+from GameOfLife_Checkpoint import CheckpointWriter
+from GameOfLife_LivePlot import LivePlot
+from GameOfLife_Recorder import PopulationRecorder, read_population
+from GameOfLife_History import HistoryWriter
+from GameOfLife_Tiles import TiledUniverse
 
 # Constants
 WIDTH, HEIGHT = 800, 600
 CELL_SIZE = 10
 ROWS = HEIGHT // CELL_SIZE
 COLS = WIDTH // CELL_SIZE
+# set to True to play on a WORLD_ROWS x WORLD_COLS board larger than the window, seen through
+# a pan and zoom viewport (mouse wheel or +/- to zoom, arrows or middle drag to pan, 0 to fit)
+VIEWPORT = False
+WORLD_ROWS, WORLD_COLS = 1000, 1000
+if VIEWPORT:
+    ROWS, COLS = WORLD_ROWS, WORLD_COLS
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
 GRAY = (169, 169, 169)
+# the alive cells of every generation are streamed to this file
+POPULATION_FILE = 'AliveCells.csv'
+# set to a file name to record every generation for replay with GameOfLife_History.py
+HISTORY_FILE = None
+# set to True to time every phase of the loop from the start, F3 turns the timings on and off
+PROFILE = False
+# set to a file name to also run cProfile while the timings are on, the stats are written there on close
+PROFILE_FILE = None
+# set to True to step in a background thread, the window then draws the latest generation
+BACKGROUND = False
+# with BACKGROUND, step as fast as possible instead of every update_interval (every generation is still recorded)
+TURBO = False
+# set to a file name to save a checkpoint every CHECKPOINT_INTERVAL generations,
+# the game carries on from it when it is started again
+CHECKPOINT_FILE = None
+CHECKPOINT_INTERVAL = 100
+# set to True to draw the population in a live chart while the game runs
+LIVE_PLOT = False
+# set to True to play on a board without edges, the window shows the cells from (0, 0) and the
+# population counts the whole board
+UNBOUNDED = False
 BLUE = (0, 0, 128)
 RED = (255, 0, 255)
 
-#masks as weighted sum
-masks = {
-    'Standard': np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]]),
-    'Isotropic': np.array([[0.7, 1, 0.7], [1, 0, 1], [0.7, 1, 0.7]]),
-    'Diagonal': np.array([[1, 0.7, 1], [0.7, 0, 0.7], [1, 0.7, 1]]),
-    'Cross': np.array([[0.3, 1, 0.3], [1, 0, 1], [0.3, 1, 0.3]]),
-    'Cross4': np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]]),
-    'Cross4Diag': np.array([[1, 0, 1], [0, 0, 0], [1, 0, 1]]),
-    'Hex0': np.array([[1, 0, 1], [1, 0, 1], [1, 0, 1]]),
-    'Hex1': np.array([[0.75, 0.5, 0.75], [1, 0, 1], [0.75, 0.5, 0.75]]),
-    'Hex2': np.array([[1, 0.75, 0.5], [0.75, 0, 0.75], [0.5, 0.75, 1]])
-}
-print("Available masks:\n", end ="")
-print("Standard, Isotropic, Diagonal\n", end ="")
-print("Cross, Cross4, Cross4Diag\n", end ="")
-print("Hex0, Hex1, Hex2\n",end ="")
-
-#input for the mask
-current_mask_name = input("Please input mask name: ")
-
-#validating the mask name from user input
-if current_mask_name in masks:
+# the mask and probability are asked for when the game is started,
+# the defaults play the standard rules where every doomed cell dies
+current_mask_name = 'Standard'
+current_mask = masks[current_mask_name]
+Pdeath = 1.0
+
+# seed of the random deaths, None draws a fresh seed for every run
+SEED = None
+rng = CounterRNG(SEED)
+
+# the parameters of the game, saved with every checkpoint
+def parameters():
+    return {'mask': current_mask_name, 'Pdeath': Pdeath}
+
+# restoring the parameters a checkpoint was saved with
+def apply_parameters(params):
+    global current_mask_name, current_mask, Pdeath
+    current_mask_name, Pdeath = params['mask'], params['Pdeath']
     current_mask = masks[current_mask_name]
-else:
-    print("Invalid mask name. Please select from the available masks.")
-# Define the specific probability of cell death
-Pdeath = float(input("Please input the probability (0-1): "))  # Specific probability
 
 # Creating the grid
 def initialize_grid():
     return np.zeros((ROWS, COLS))
 
+# the renderer is created on the first frame, once pygame is initialised
+renderer = None
+
 # Drawing the grid with different colors and texts
-def draw_grid(screen, grid, generation, alive_cells):
-    screen.fill(BLACK)
-    for row in range(ROWS):
-        for col in range(COLS):
-            if grid[row][col] == 1:
-                pygame.draw.rect(screen, GREEN, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-            else:
-                pygame.draw.rect(screen, GRAY, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
-
-    font = pygame.font.Font(None, 36)
-    text = font.render(f"Generation: {generation}", True, WHITE)
-    mask_text = font.render(f"Mask/Probability: {current_mask_name}/{Pdeath}", True, WHITE)
-    alive_cells_text = font.render(f"Alive Cells: {alive_cells}", True, WHITE)
-    titletext = font.render(f"CONWAY'S GAME OF LIFE", True, WHITE)
-    screen.blit(text, (10, 10))
-    screen.blit(alive_cells_text, (10, 40))
-    screen.blit(mask_text, (10, 70))
-    screen.blit(titletext, (450, 10))
-    pygame.display.update()
+def draw_grid(screen, grid, generation, alive_cells, overlay=()):
+    global renderer
+    if renderer is None:
+        if VIEWPORT:
+            renderer = Viewport(ROWS, COLS, WIDTH, HEIGHT, CELL_SIZE, alive_color=GREEN, line_color=GRAY)
+        else:
+            renderer = GridRenderer(ROWS, COLS, CELL_SIZE, alive_color=GREEN, line_color=GRAY)
+    texts = [(f"Generation: {generation}", (10, 10)),
+             (f"Alive Cells: {alive_cells}", (10, 40)),
+             (f"Mask/Probability: {current_mask_name}/{Pdeath}", (10, 70))]
+    renderer.draw(screen, grid, texts + list(overlay))
+
+# the board cell under a point of the window, through the viewport when there is one
+def cell_at(x, y):
+    if VIEWPORT and renderer is not None:
+        return renderer.screen_to_cell(x, y)
+    return y // CELL_SIZE, x // CELL_SIZE
     
+# the board without edges behind the window when UNBOUNDED is set
+universe = None
+
 # Upgrading the grid for each generation
 def update_grid(grid, generation, alive_cells):
-    new_grid = grid.copy()
-    alive_cells = 0
-    cells_to_die = []
-
-    #Checking the cells which will die and appending to a list
-    for row in range(ROWS):
-        for col in range(COLS):
-            neighbors = count_neighbors(grid, row, col, current_mask)
-            if grid[row][col] == 1 and (neighbors < 2 or neighbors > 3):
-                cells_to_die.append((row, col))
-
-    #number of cells to die
-    num_cells_to_die = len(cells_to_die)
-    
-    # mutiplying with the probability
-    expected_deaths = int(round(Pdeath * num_cells_to_die))
-    
-    # assigns numbers (1 to total number of expected deaths) to death cells randomly 
-    # Assigns to death, the ones below expected deaths
-    if expected_deaths < num_cells_to_die:
-        deaths = random.sample(cells_to_die, expected_deaths) 
-    else:
-        deaths = cells_to_die
-
-    for row, col in np.ndindex(grid.shape):
-        neighbors = count_neighbors(grid, row, col,current_mask)
-        # If cell is in death, it dies
-        if (row, col) in deaths:
-            new_grid[row, col] = 0
-        # If the cell is dead and it has 3 neighbours, birth takes place
-        elif grid[row, col] == 0 and neighbors == 3:
-            new_grid[row, col] = 1
-
+    if UNBOUNDED:
+        return update_universe(grid, generation)
+    # stochastic deaths and births applied to the whole grid, the outcome of every cell is read
+    # from the table compiled for the mask
+    new_grid = table_step(grid, compile_rule(current_mask), Pdeath, rng.at(generation))
     generation += 1
     alive_cells = np.sum(new_grid)
     return new_grid, generation, alive_cells
 
+# stepping the unbounded universe, the window shows the ROWS x COLS cells from (0, 0)
+def update_universe(grid, generation):
+    global universe
+    if universe is None or universe.generation != generation:
+        # first step, or the game was reset
+        universe = TiledUniverse.from_grid(grid, generation=generation, rule='death_probability',
+                                           mask=current_mask, Pdeath=Pdeath, rng=rng)
+    else:
+        # forwarding the cells edited with the mouse since the last step
+        shown = universe.window(0, 0, ROWS, COLS)
+        universe.set_cells(*np.nonzero((grid == 1) & (shown == 0)), 1)
+        universe.set_cells(*np.nonzero((grid == 0) & (shown == 1)), 0)
+    universe.step()
+    return universe.window(0, 0, ROWS, COLS), universe.generation, universe.population
+
 # counting the neighbours of the particular cell
 def count_neighbors(grid, row, col, mask):
     ROWS, COLS = grid.shape
@@ -170,12 +190,40 @@ def main():
     update_interval = 0.1  # in seconds
     generation = 0
     alive_cells = 0
-    alive_cells_array = []
+    recorder = PopulationRecorder(POPULATION_FILE)
+    history = HistoryWriter(HISTORY_FILE, ROWS, COLS) if HISTORY_FILE else None
+    checkpoints = None
+    if CHECKPOINT_FILE:
+        checkpoints = CheckpointWriter(CHECKPOINT_FILE, CHECKPOINT_INTERVAL, rng, parameters(),
+                                       recorder=recorder)
+        if checkpoints.exists():
+            # carrying on from the checkpoint of an interrupted game
+            state = checkpoints.resume()
+            apply_parameters(state['params'])
+            grid, generation, alive_cells = state['grid'], state['generation'], state['alive_cells']
+    profiler = PhaseTimer(PROFILE, profile_path=PROFILE_FILE)
+    plot = None
+    if LIVE_PLOT:
+        plot = LivePlot()
+        if checkpoints is not None and checkpoints.exists():
+            plot.extend(np.column_stack([state['generations'], state['populations']]))
+    worker = None  # background stepping thread, see GameOfLife_Worker.py
+    if BACKGROUND:
+        worker = SimulationWorker(update_grid, grid, rate=None if TURBO else 1 / update_interval,
+                                  generation=generation, recorder=recorder, history=history,
+                                  checkpoints=checkpoints, plot=plot)
 
 
     while running:
         current_time = time.time()
+        if worker is not None:
+            # editing a copy of the latest generation, the changes are forwarded to the worker
+            shown, generation, alive_cells = worker.latest()
+            grid = shown.copy()
+        frame_generation = generation
         for event in pygame.event.get():
+            if VIEWPORT and renderer is not None and renderer.handle_event(event):
+                continue  # panning and zooming
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -184,47 +232,72 @@ def main():
                 elif event.button == 3:  # Right mouse button
                     placing_cells = False  # Disable placing cells, prepare for clearing if held
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     if 0 <= row < ROWS and 0 <= col < COLS:
                         grid[row][col] = 0  # Clear cell on single right-click
+                    profiler.lap('events')
                     alive_cells = np.sum(grid)  # Update alive cells count after modification
+                    profiler.lap('recount')
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1 or event.button == 3:
                     placing_cells = False  # Disable placing or clearing on any button release
             elif event.type == pygame.MOUSEMOTION:
                 if event.buttons[0]:  # Check if left button is held during motion
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     if 0 <= row < ROWS and 0 <= col < COLS:
                         grid[row][col] = 1  # Set cell to alive
                 elif event.buttons[2]:  # Check if right button is held during motion
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     if 0 <= row < ROWS and 0 <= col < COLS:
                         grid[row][col] = 0  # Clear cells while right mouse button is held
+                profiler.lap('events')
                 alive_cells = np.sum(grid)  # Update alive cells count after modification
+                profiler.lap('recount')
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_SPACE:
                     simulation_running = not simulation_running
                 elif event.key == pygame.K_r:
                     grid = initialize_grid()
+                    if worker is not None:
+                        worker.reset(grid)
                     generation = 0
                     alive_cells = 0
 
+        if worker is not None:
+            worker.edit(grid, shown)
+            worker.set_running(simulation_running)
+        profiler.lap('events')
          # Upgrading the grid and alive cells count
-        if simulation_running and current_time - last_update_time > update_interval:
+        if worker is None and simulation_running and current_time - last_update_time > update_interval:
             grid, generation, alive_cells = update_grid(grid, generation, alive_cells)
-            alive_cells_array.append(alive_cells)
+            recorder.append(generation, alive_cells)
+            if plot is not None:
+                plot.append(generation, alive_cells)
+            if checkpoints is not None:
+                checkpoints.append(grid, generation, alive_cells)
+            if history is not None:
+                history.append(grid, generation)
             last_update_time = current_time
 
-        draw_grid(screen, grid, generation, alive_cells)
+        profiler.lap('sim')
+        draw_grid(screen, grid, generation, alive_cells, profiler.overlay_texts())
+        if plot is not None:
+            plot.redraw()
+        profiler.lap('render')
+        profiler.end_frame(max(generation - frame_generation, 0))
 
         if not running:
-            # Plot generations vs. alive_cells_array after the simulation loop
-            plt.plot(range(generation), alive_cells_array)
+            # Plot generations vs. alive cells after the simulation loop
+            if worker is not None:
+                worker.close()
+            recorder.flush()
+            if plot is not None:
+                plot.close()
+            plt.plot(*read_population(POPULATION_FILE))
             plt.xlabel('Generation')
             plt.ylabel('Alive Cells')
             plt.title('Game of Life: Alive Cells Over Generations')
@@ -232,11 +305,28 @@ def main():
             plt.show()
 
     pygame.quit()
-    
-    with open('AliveCells.csv', 'w', newline = '') as csvfile:
-        my_writer = csv.writer(csvfile, delimiter = ' ')
-        my_writer.writerow(alive_cells_array)
+    if checkpoints is not None:
+        checkpoints.close()
+    profiler.close(POPULATION_FILE)
+    recorder.close()
+    if history is not None:
+        history.close()
 
 
 if __name__ == "__main__":
+    print("Available masks:\n", end ="")
+    print("Standard, Isotropic, Diagonal\n", end ="")
+    print("Cross, Cross4, Cross4Diag\n", end ="")
+    print("Hex0, Hex1, Hex2\n",end ="")
+
+    #input for the mask
+    current_mask_name = input("Please input mask name: ")
+
+    #validating the mask name from user input, asking again until it is one of the masks
+    while current_mask_name not in masks:
+        print("Invalid mask name. Please select from the available masks.")
+        current_mask_name = input("Please input mask name: ")
+    current_mask = masks[current_mask_name]
+    # Define the specific probability of cell death
+    Pdeath = float(input("Please input the probability (0-1): "))  # Specific probability
     main()
\ No newline at end of file
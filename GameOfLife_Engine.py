@@ -0,0 +1,243 @@
+'''
+
+Title: Vectorized Stepping Engine for Conway's Game of Life
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file holds the NumPy stepping engine shared by every variant of the game.
+Instead of walking the grid cell by cell and calling count_neighbors for each one, the
+neighbours of all cells are counted at once by summing the eight shifted copies of a
+zero-padded grid. The padding keeps the bounded edges of the original implementation:
+cells outside the board are always dead.
+
+The counting functions work on the last two axes, so a stack of grids can be counted in one call.
+The stochastic rules take their random numbers from draws, the CounterStream of the generation being
+stepped (GameOfLife_CounterRNG.py): every cell has its own numbers, so a board stepped in parts
+makes the same draws as the whole board. The steps which follow a visit order (the sequential
+sacrifice pre-game and the sequential Selfish kills) run on the backend chosen with backend, see
+GameOfLife_Kernels.py.
+
+'''
+
+# importing all the dependencies
+import numpy as np
+from GameOfLife_CounterRNG import DEATH, ORDER, SELFISH, SELFISHNESS
+from GameOfLife_Kernels import BACKEND, kernel
+
+
+#masks as weighted sum
+masks = {
+    'Standard': np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]]),
+    'Isotropic': np.array([[0.7, 1, 0.7], [1, 0, 1], [0.7, 1, 0.7]]),
+    'Diagonal': np.array([[1, 0.7, 1], [0.7, 0, 0.7], [1, 0.7, 1]]),
+    'Cross': np.array([[0.3, 1, 0.3], [1, 0, 1], [0.3, 1, 0.3]]),
+    'Cross4': np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]]),
+    'Cross4Diag': np.array([[1, 0, 1], [0, 0, 0], [1, 0, 1]]),
+    'Hex0': np.array([[1, 0, 1], [1, 0, 1], [1, 0, 1]]),
+    'Hex1': np.array([[0.75, 0.5, 0.75], [1, 0, 1], [0.75, 0.5, 0.75]]),
+    'Hex2': np.array([[1, 0.75, 0.5], [0.75, 0, 0.75], [0.5, 0.75, 1]])
+}
+
+# the eight neighbour offsets, in the same order as the count_neighbors loops
+OFFSETS = [(i, j) for i in range(-1, 2) for j in range(-1, 2) if not (i == 0 and j == 0)]
+
+
+# padding the last two axes of the grid with a ring of dead cells
+def pad_grid(grid):
+    pad_width = [(0, 0)] * (grid.ndim - 2) + [(1, 1), (1, 1)]
+    return np.pad(grid, pad_width)
+
+
+# taking the view of the padded grid shifted by (i, j)
+def shifted(padded, i, j):
+    rows, cols = padded.shape[-2] - 2, padded.shape[-1] - 2
+    return padded[..., 1 + i:1 + i + rows, 1 + j:1 + j + cols]
+
+
+# counting the neighbours of every cell at once
+def count_neighbors_grid(grid):
+    if grid.dtype == bool:
+        grid = grid.astype(np.uint8)
+    padded = pad_grid(grid)
+    counts = np.zeros(grid.shape, dtype=grid.dtype)
+    for i, j in OFFSETS:
+        counts += shifted(padded, i, j)
+    return counts
+
+
+# weighted neighbour count of every cell, rounded up like the per-cell version
+def weighted_neighbors_grid(grid, mask):
+    padded = pad_grid(grid)
+    total = np.zeros(grid.shape)
+    # the weights are added in the same order as the per-cell loop so the
+    # floating point sums, and therefore the ceil rounding, are identical
+    for i, j in OFFSETS:
+        total += shifted(padded, i, j) * mask[i + 1, j + 1]
+    return np.ceil(total).astype(int)
+
+
+# Conway's nature rules applied to the whole grid
+def life_step(grid):
+    counts = count_neighbors_grid(grid)
+    alive = grid == 1
+    # rule Death: If neighbors are less than 2 or greater than 3
+    survive = alive & (counts >= 2) & (counts <= 3)
+    # rule Birth: If there are 3 neighbours for a dead cell birth takes place
+    born = ~alive & (counts == 3)
+    return (survive | born).astype(grid.dtype)
+
+
+# sacrificial pre-game and nature rules from one neighbour count, n=None plays without the pre-game
+# with sequential=True the pre-game is played cell by cell in a random order drawn from draws
+def sacrifice_step(grid, n, sequential=False, draws=None, backend=BACKEND):
+    if sequential and n is not None:
+        grid, counts = sequential_sacrifice(grid, n, draws, backend)
+    else:
+        counts = count_neighbors_grid(grid)
+    alive = grid == 1
+    survive = alive & (counts >= 2) & (counts <= 3)
+    if n is not None and not sequential:
+        # every cell reads the grid before the step, so the pre-game is a mask
+        survive &= counts != n
+    born = ~alive & (counts == 3)
+    return (survive | born).astype(grid.dtype)
+
+
+# playing the pre-game one alive cell at a time, each sacrifice is seen by the cells visited after it
+# returns the grid after the pre-game and its neighbour counts
+def sequential_sacrifice(grid, n, draws, backend=BACKEND):
+    rows, cols = grid.shape
+    width = cols + 2
+    counts = count_neighbors_grid(grid)
+    # bytes keep the cells visited in a random order in the cache
+    padded = pad_grid((grid == 1).astype(np.uint8))
+    padded_counts = pad_grid(counts).astype(np.int8)
+    flat_offsets = np.array([i * width + j for i, j in OFFSETS])
+
+    # counts only go down during the pre-game, so only cells starting with n or more can be sacrificed
+    row, col = np.nonzero((grid == 1) & (counts >= n))
+    # the cells play in the order of their keys, a uniform random order
+    order = np.argsort(draws.keys(row, col, ORDER), kind='stable')
+    cells = ((row + 1) * width + col + 1)[order]
+    kernel('sacrifice', backend)(padded.reshape(-1), padded_counts.reshape(-1), cells, n, flat_offsets)
+    return padded[1:-1, 1:-1].astype(grid.dtype), padded_counts[1:-1, 1:-1].astype(counts.dtype)
+
+
+# stochastic deaths with a weighted neighbourhood mask, drawn from the CounterStream draws
+def death_probability_step(grid, mask, Pdeath, draws):
+    counts = weighted_neighbors_grid(grid, mask)
+    alive = grid == 1
+    # rule Death candidates and rule Birth as boolean masks
+    doomed = alive & ((counts < 2) | (counts > 3))
+    born = ~alive & (counts == 3)
+
+    # exactly round(Pdeath * candidates) of the candidates die, chosen uniformly
+    rows, cols = np.nonzero(doomed)
+    expected_deaths = int(round(Pdeath * len(rows)))
+    die = draws.choose(rows, cols, expected_deaths, DEATH)
+
+    new_grid = grid.copy()
+    new_grid[born] = 1
+    new_grid[rows[die], cols[die]] = 0
+    return new_grid
+
+
+# the orthogonal directions a selfish cell kills in as (dy, dx), clockwise: up, right, down, left,
+# the order kill_neighbors walks in (its directions are unpacked as dx, dy)
+KILL_ORDER = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+# giving int(alive cells * level) random alive cells one unit of selfishness
+def initialize_selfishness(grid, level, draws):
+    rows, cols = np.nonzero(grid == 1)
+    selfishness = np.zeros(grid.shape, dtype=int)
+    chosen = draws.choose(rows, cols, int(len(rows) * level), SELFISHNESS)
+    selfishness[rows[chosen], cols[chosen]] = 1
+    return selfishness
+
+
+# one uniform draw for every True cell of mask, in C order; when the first axis of mask stacks
+# replicas every replica draws with its own seed
+def uniform_draws(draws, mask, stream):
+    cells = np.nonzero(mask)
+    if mask.ndim == 2:
+        return draws.uniform(*cells, stream)
+    return draws.uniform(*cells[1:], stream, replicas=cells[0])
+
+
+# cells killed by the selfish cells, resolved from the grid before the step: every killer walks
+# like kill_neighbors, up, right, down and left, killing the alive cell ahead and moving onto it,
+# but it only sees its own kills, and a cell targeted by several killers dies once; a stack of grids
+# is walked as one flat array, the padding of every grid keeping the walks apart
+def kill_targets(grid, killers, counts):
+    padded_alive = pad_grid(grid == 1)
+    padded_shape, width = padded_alive.shape, padded_alive.shape[-1]
+    padded_alive = padded_alive.reshape(-1)
+    index = np.nonzero(killers)
+    cells = np.ravel_multi_index(index[:-2] + (index[-2] + 1, index[-1] + 1), padded_shape)
+    # a killer keeps killing until fewer than 3 neighbours are left
+    quota = counts[index].astype(int) - 2
+    made = np.zeros(len(cells), dtype=int)
+    # the cells every killer has killed so far, -1 for the kills not made
+    killed = np.full((len(cells), max(quota.max(initial=0), 1)), -1)
+    walkers = np.arange(len(cells))
+    for dy, dx in KILL_ORDER:
+        walking = walkers
+        while len(walking):
+            ahead = cells[walking] + dy * width + dx
+            # the padding is dead, so a walk stops at the edge of the board
+            kill = ((made[walking] < quota[walking]) & padded_alive[ahead]
+                    & ~(killed[walking] == ahead[:, None]).any(axis=1))
+            walking, ahead = walking[kill], ahead[kill]
+            killed[walking, made[walking]] = ahead
+            made[walking] += 1
+            cells[walking] = ahead
+    targets = np.zeros(len(padded_alive), dtype=bool)
+    targets[killed[killed >= 0]] = True
+    return targets.reshape(padded_shape)[..., 1:-1, 1:-1]
+
+
+# the kills made one killer at a time in row-major order on the alive cells, each killer seeing the
+# kills made before it, like kill_neighbors
+def scan_kills(alive, killers, backend=BACKEND):
+    width = alive.shape[1] + 2
+    padded = pad_grid(alive.astype(np.uint8))
+    row, col = np.nonzero(killers)
+    flat_offsets = np.array([i * width + j for i, j in OFFSETS])
+    steps = np.array([dy * width + dx for dy, dx in KILL_ORDER])
+    kernel('kill_sweep', backend)(padded.reshape(-1), (row + 1) * width + col + 1, flat_offsets, steps)
+    return padded[1:-1, 1:-1] == 1
+
+
+# selfish rules and nature rules for the whole grid, returns the new grid and selfishness plane
+# with sequential=True the kills are made in row-major order by scan_kills
+def selfish_step(grid, selfishness, level, draws, sequential=False, backend=BACKEND):
+    counts = count_neighbors_grid(grid)
+    alive = grid == 1
+    selfish = selfishness >= 1
+    new_selfishness = selfishness.copy()
+
+    # nature rules for the cells which are not selfish
+    survive = alive & (counts >= 2) & (counts <= 3)
+    born = ~alive & ~selfish & (counts == 3)
+
+    # Rule 1: a crowded selfish cell gains selfishness and kills its neighbours
+    killers = alive & selfish & (counts >= 4)
+    new_selfishness[killers] += 1
+    # Rule 2: a lonely selfish cell spends selfishness to survive
+    lonely = alive & selfish & (counts <= 1)
+    new_selfishness[lonely] -= 1
+    survive |= killers | lonely
+    # Rule 3: a selfish site is reclaimed with 3 or 4 neighbours
+    reclaimed = ~alive & selfish & ((counts == 3) | (counts == 4))
+    # Rule 4: the new cell is selfish with the selfishness level as probability
+    new_selfishness[reclaimed] = uniform_draws(draws, reclaimed, SELFISH) < level
+    born |= reclaimed
+
+    # the kills are resolved last, every targeted cell dies even if it is a killer itself
+    if sequential:
+        new_alive = scan_kills(survive | born, killers, backend)
+    else:
+        new_alive = (survive | born) & ~kill_targets(grid, killers, counts)
+    return new_alive.astype(grid.dtype), new_selfishness
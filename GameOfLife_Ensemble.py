@@ -0,0 +1,174 @@
+'''
+
+Title: Monte Carlo Ensembles of the Stochastic Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: A single DeathProbability or Selfish run (Hex1-0.1, Healing03, ...) is one noisy
+realisation. This file runs K replicas of the same settings at once: the grids are stacked into
+one (K, ROWS, COLS) array and all of them are advanced by one vectorized step, since the engine
+counts neighbours over the last two axes. Every replica has its own seed of the counter-based
+generator (GameOfLife_CounterRNG.py), spawned from one seed, so the replicas are independent and the
+ensemble is reproducible.
+
+The neighbour counts, the rules and the random numbers are evaluated for the whole stack at once,
+each cell drawing with the key of its replica. Only the DeathProbability deaths are chosen per
+replica, among the replica's own candidates. A replica therefore evolves exactly like a separate
+run with its seed, whichever chunk it is stepped in. The stack is stepped in chunks of about
+CHUNK_CELLS cells: small grids are then stepped with a fraction of the per-call overhead, while the
+temporaries of each step still fit in the cache.
+
+The mean, variance and quantiles of the population over the replicas are written for every
+generation with the PopulationRecorder while the ensemble runs, and with --live the mean and the
+quantiles are drawn in a live chart (GameOfLife_LivePlot.py). The deterministic OG and Sacrifice rules
+can be run the same way, the replicas then only differ by their random starting grids.
+
+Example:
+python GameOfLife_Ensemble.py --rule death_probability --mask Hex1 --pdeath 0.1 --replicas 256 --generations 500 --out ensemble_Hex1-0.1.csv
+
+'''
+
+# importing all the dependencies
+import argparse
+import time
+import numpy as np
+from GameOfLife_CounterRNG import DEATH, GRID, CounterRNG, smallest
+from GameOfLife_Engine import initialize_selfishness, life_step, masks, sacrifice_step, selfish_step
+from GameOfLife_RuleTable import BORN, DOOMED, compile_rule, outcomes
+from GameOfLife_Recorder import PopulationRecorder
+
+
+QUANTILES = (5, 25, 50, 75, 95)
+COLUMNS = ('Generation Count', 'Mean', 'Variance') + tuple(f'q{q}' for q in QUANTILES)
+# replicas are stepped in chunks of about this many cells, so the temporaries of a step stay in cache
+CHUNK_CELLS = 80000
+
+
+# one independent 64-bit seed per replica, all spawned from seed
+def replica_seeds(seed, replicas):
+    return [int(child.generate_state(1, np.uint64)[0]) for child in np.random.SeedSequence(seed).spawn(replicas)]
+
+
+# DeathProbability rules for a (K, ROWS, COLS) stack of grids, draws has one seed per replica
+def ensemble_death_probability_step(grids, mask, Pdeath, draws):
+    outcome = outcomes(grids, compile_rule(mask))
+    doomed = outcome == DOOMED
+    born = outcome == BORN
+
+    # the candidates are listed replica by replica, and every replica picks its own deaths from
+    # its own keys exactly like death_probability_step does for a single grid
+    replicas, rows, cols = np.nonzero(doomed)
+    keys = draws.keys(rows, cols, DEATH, replicas)
+    bounds = np.searchsorted(replicas, np.arange(len(grids) + 1))
+    die = np.zeros(len(rows), dtype=bool)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        die[start:stop] = smallest(keys[start:stop], int(round(Pdeath * (stop - start))))
+
+    new_grids = grids.copy()
+    new_grids[born] = 1
+    new_grids[replicas[die], rows[die], cols[die]] = 0
+    return new_grids
+
+
+class Ensemble:
+
+    # rule is 'death_probability' (with mask and Pdeath), 'selfish' (with level), 'og' or 'sacrifice' (with n)
+    def __init__(self, rule, replicas, rows, cols, density=0.3, seed=0, shared_start=False,
+                 mask='Standard', Pdeath=0.5, level=0.25, n=2):
+        self.rule = rule
+        self.n = n
+        self.mask = masks[mask]
+        self.Pdeath = Pdeath
+        self.level = level
+        seeds = replica_seeds(seed, replicas)
+        self.rng = CounterRNG(seeds)
+        if shared_start:
+            # every replica starts from the same grid and only their random draws differ
+            start = CounterRNG(seed).at(0).field((rows, cols), GRID) < density
+            self.grids = np.repeat(start[None], replicas, axis=0).astype(float)
+        else:
+            self.grids = np.stack([CounterRNG(replica_seed).at(0).field((rows, cols), GRID) < density
+                                   for replica_seed in seeds]).astype(float)
+        self.selfishness = None
+        if rule == 'selfish':
+            self.selfishness = np.stack([initialize_selfishness(grid, level, CounterRNG(replica_seed).at(0))
+                                         for grid, replica_seed in zip(self.grids, seeds)])
+        self.generation = 0
+
+    def step(self):
+        replicas, rows, cols = self.grids.shape
+        chunk = max(1, CHUNK_CELLS // (rows * cols))
+        for start in range(0, replicas, chunk):
+            part = slice(start, start + chunk)
+            draws = self.rng.replicas(part).at(self.generation)
+            if self.rule == 'selfish':
+                self.grids[part], self.selfishness[part] = selfish_step(self.grids[part], self.selfishness[part],
+                                                                        self.level, draws)
+            elif self.rule == 'og':
+                self.grids[part] = life_step(self.grids[part])
+            elif self.rule == 'sacrifice':
+                self.grids[part] = sacrifice_step(self.grids[part], self.n)
+            else:
+                self.grids[part] = ensemble_death_probability_step(self.grids[part], self.mask, self.Pdeath, draws)
+        self.generation += 1
+
+    # alive cells of every replica
+    def populations(self):
+        return self.grids.reshape(len(self.grids), -1).sum(axis=1)
+
+    # mean, variance and quantiles of the population over the replicas
+    def statistics(self):
+        populations = self.populations()
+        variance = populations.var(ddof=1) if len(populations) > 1 else 0.0
+        return [populations.mean(), variance] + list(np.percentile(populations, QUANTILES))
+
+    # stepping a number of generations and streaming the statistics of each one, the plot shows the
+    # mean and the quantiles
+    def run(self, generations, recorder=None, plot=None):
+        series = np.zeros((generations, len(COLUMNS) - 1))
+        for generation in range(generations):
+            self.step()
+            series[generation] = self.statistics()
+            if recorder is not None:
+                recorder.append(self.generation, *series[generation])
+            if plot is not None:
+                plot.append(self.generation, series[generation][0], *series[generation][2:])
+                plot.redraw()
+        return series
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run K replicas of a stochastic variant in one vectorized ensemble.")
+    parser.add_argument('--rule', choices=['death_probability', 'selfish', 'og', 'sacrifice'], default='death_probability')
+    parser.add_argument('--replicas', type=int, default=256)
+    parser.add_argument('--rows', type=int, default=60)
+    parser.add_argument('--cols', type=int, default=80)
+    parser.add_argument('--generations', type=int, default=500)
+    parser.add_argument('--density', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shared-start', action='store_true', help="start every replica from the same grid")
+    parser.add_argument('--mask', choices=list(masks), default='Standard')
+    parser.add_argument('--pdeath', type=float, default=0.5)
+    parser.add_argument('--selfishness', type=float, default=0.25, help="selfishness level from 0 to 1")
+    parser.add_argument('--n', type=int, default=2, help="number of neighbours for the sacrifice")
+    parser.add_argument('--out', default='ensemble.csv', help="file for the per-generation statistics")
+    parser.add_argument('--live', action='store_true', help="plot the mean and quantiles while running")
+    args = parser.parse_args(argv)
+
+    ensemble = Ensemble(args.rule, args.replicas, args.rows, args.cols, args.density, args.seed,
+                        args.shared_start, args.mask, args.pdeath, args.selfishness, args.n)
+    plot = None
+    if args.live:
+        from GameOfLife_LivePlot import LivePlot
+
+        plot = LivePlot(('Mean',) + COLUMNS[3:], title=f'{args.replicas} replicas')
+    start = time.perf_counter()
+    with PopulationRecorder(args.out, columns=COLUMNS) as recorder:
+        ensemble.run(args.generations, recorder, plot)
+    print(f"{args.replicas} replicas x {args.generations} generations written to {args.out} "
+          f"in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+'''
+
+Title: HashLife Engine for Conway's Game of Life
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file implements Gosper's HashLife algorithm for the deterministic rules of GameOfLife_OG.
+The universe is a quadtree whose nodes are hash-consed: two squares with the same content are the
+same node, so repeated structure (still lifes, oscillators, empty space) is stored once. Every node
+remembers its population and the result of advancing its centre, so the work done for one region
+is reused everywhere the same region appears, and a single call can advance 2^k generations.
+
+The node table is evicted when it grows past CACHE_LIMIT: only the nodes reachable from the
+current universe are kept and the memoized results are dropped.
+
+Unlike the grid of GameOfLife_OG, the HashLife universe has no edges. The two agree as long as the
+pattern stays clear of the board edges; to_grid gives the part of the universe under the board.
+
+'''
+
+# importing all the dependencies
+import numpy as np
+
+
+CACHE_LIMIT = 1000000  # number of nodes kept before the node table is evicted
+
+
+# a square of the universe with side 2^level
+class Node:
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population', 'results')
+
+    def __init__(self, level, nw, ne, sw, se, population):
+        self.level = level
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.population = population
+        self.results = {}  # j -> centre of the node advanced by 2^j generations
+
+
+# the two single cells
+OFF = Node(0, None, None, None, None, 0)
+ON = Node(0, None, None, None, None, 1)
+
+
+class HashLifeUniverse:
+
+    def __init__(self, cache_limit=CACHE_LIMIT):
+        self.cache_limit = cache_limit
+        self.table = {}
+        self.empty_nodes = [OFF]
+        self.root = self.empty(3)
+        # world coordinates of the top left cell of the root
+        self.top, self.left = 0, 0
+        self.generation = 0
+
+    # building the universe from a grid, with the grid's top left cell at (0, 0)
+    @classmethod
+    def from_grid(cls, grid, generation=0, cache_limit=CACHE_LIMIT):
+        universe = cls(cache_limit)
+        rows, cols = grid.shape
+        level = max(3, int(np.ceil(np.log2(max(rows, cols, 1)))))
+        size = 2 ** level
+        cells = np.zeros((size, size), dtype=bool)
+        cells[:rows, :cols] = grid == 1
+        universe.root = universe.build(cells, level, 0, 0)
+        universe.generation = generation
+        return universe
+
+    @property
+    def population(self):
+        return self.root.population
+
+    # getting the canonical node with the given quadrants
+    def join(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        node = self.table.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw.level + 1, nw, ne, sw, se, population)
+            self.table[key] = node
+        return node
+
+    # getting the empty node of a level
+    def empty(self, level):
+        while len(self.empty_nodes) <= level:
+            e = self.empty_nodes[-1]
+            self.empty_nodes.append(self.join(e, e, e, e))
+        return self.empty_nodes[level]
+
+    def build(self, cells, level, row, col):
+        if level == 0:
+            return ON if cells[row, col] else OFF
+        size = 2 ** level
+        if not cells[row:row + size, col:col + size].any():
+            return self.empty(level)
+        half = size // 2
+        return self.join(self.build(cells, level - 1, row, col),
+                         self.build(cells, level - 1, row, col + half),
+                         self.build(cells, level - 1, row + half, col),
+                         self.build(cells, level - 1, row + half, col + half))
+
+    # surrounding the node with empty space, keeping it in the centre
+    def expand(self, node):
+        e = self.empty(node.level - 1)
+        return self.join(self.join(e, e, e, node.nw), self.join(e, e, node.ne, e),
+                         self.join(e, node.sw, e, e), self.join(node.se, e, e, e))
+
+    # the centre of the node, one level down
+    def centre(self, node):
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    # the square straddling two nodes side by side
+    def centre_horizontal(self, west, east):
+        return self.join(west.ne, east.nw, west.se, east.sw)
+
+    # the square straddling two nodes on top of each other
+    def centre_vertical(self, north, south):
+        return self.join(north.sw, north.se, south.nw, south.ne)
+
+    # one generation of the centre 2x2 of a 4x4 node with the nature rules
+    def base_step(self, node):
+        cells = [[node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+                 [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+                 [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+                 [node.sw.sw, node.sw.se, node.se.sw, node.se.se]]
+        result = []
+        for row in (1, 2):
+            for col in (1, 2):
+                neighbors = sum(cells[row + i][col + j].population
+                                for i in range(-1, 2) for j in range(-1, 2) if not (i == 0 and j == 0))
+                alive = cells[row][col].population == 1
+                # rule Death and rule Birth of the nature rules
+                result.append(ON if neighbors == 3 or (alive and neighbors == 2) else OFF)
+        return self.join(*result)
+
+    # the centre of the node advanced by 2^j generations, with j <= level - 2
+    def successor(self, node, j):
+        result = node.results.get(j)
+        if result is not None:
+            return result
+        if node.population == 0:
+            result = self.empty(node.level - 1)
+        elif node.level == 2:
+            result = self.base_step(node)
+        else:
+            # nine overlapping squares one level down
+            squares = [node.nw, self.centre_horizontal(node.nw, node.ne), node.ne,
+                       self.centre_vertical(node.nw, node.sw), self.centre(node),
+                       self.centre_vertical(node.ne, node.se),
+                       node.sw, self.centre_horizontal(node.sw, node.se), node.se]
+            if j == node.level - 2:
+                # two half steps at full speed
+                c = [self.successor(square, j - 1) for square in squares]
+                result = self.join(self.successor(self.join(c[0], c[1], c[3], c[4]), j - 1),
+                                   self.successor(self.join(c[1], c[2], c[4], c[5]), j - 1),
+                                   self.successor(self.join(c[3], c[4], c[6], c[7]), j - 1),
+                                   self.successor(self.join(c[4], c[5], c[7], c[8]), j - 1))
+            else:
+                # the whole step is taken by the nine squares, then the centre is cut out
+                c = [self.successor(square, j) for square in squares]
+                result = self.join(self.join(c[0].se, c[1].sw, c[3].ne, c[4].nw),
+                                   self.join(c[1].se, c[2].sw, c[4].ne, c[5].nw),
+                                   self.join(c[3].se, c[4].sw, c[6].ne, c[7].nw),
+                                   self.join(c[4].se, c[5].sw, c[7].ne, c[8].nw))
+        node.results[j] = result
+        return result
+
+    # checking that all live cells are in the inner half of the root
+    def is_padded(self, node):
+        return (node.nw.population == node.nw.se.se.population and
+                node.ne.population == node.ne.sw.sw.population and
+                node.sw.population == node.sw.ne.ne.population and
+                node.se.population == node.se.nw.nw.population)
+
+    # advancing the universe by 2^k generations in one call
+    def step(self, k=0):
+        root = self.root
+        # with the pattern in the inner half nothing can leave the centre in 2^k generations,
+        # since no pattern grows faster than c/2 into empty space
+        while root.level < k + 2 or not self.is_padded(root):
+            shift = 2 ** (root.level - 1)
+            root = self.expand(root)
+            self.top -= shift
+            self.left -= shift
+        shift = 2 ** (root.level - 2)
+        self.root = self.successor(root, k)
+        self.top += shift
+        self.left += shift
+        self.generation += 2 ** k
+        if len(self.table) > self.cache_limit:
+            self.collect()
+
+    # advancing the universe by any number of generations
+    def advance(self, generations):
+        k = 0
+        while generations:
+            if generations & 1:
+                self.step(k)
+            generations >>= 1
+            k += 1
+
+    # evicting the node table down to the nodes reachable from the root
+    def collect(self):
+        self.table = {}
+        self.empty_nodes = [OFF]
+        stack = [self.root]
+        seen = set()
+        order = []
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in seen:
+                continue
+            seen.add(id(node))
+            node.results = {}
+            order.append(node)
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+        for node in order:
+            self.table[(node.nw, node.ne, node.sw, node.se)] = node
+
+    # the part of the universe under a board of rows x cols with its top left cell at (0, 0)
+    def to_grid(self, rows, cols):
+        grid = np.zeros((rows, cols))
+        stack = [(self.root, self.top, self.left)]
+        while stack:
+            node, top, left = stack.pop()
+            size = 2 ** node.level
+            if node.population == 0 or top >= rows or left >= cols or top + size <= 0 or left + size <= 0:
+                continue
+            if node.level == 0:
+                grid[top][left] = 1
+                continue
+            half = size // 2
+            stack.append((node.nw, top, left))
+            stack.append((node.ne, top, left + half))
+            stack.append((node.sw, top + half, left))
+            stack.append((node.se, top + half, left + half))
+        return grid
@@ -0,0 +1,185 @@
+'''
+
+Title: Run History Recording and Replay for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file records every generation of a run compactly so it can be replayed and scrubbed
+without simulating it again, which matters most for the stochastic DeathProbability and Selfish runs.
+Every KEYFRAME_INTERVAL generations the whole grid is stored as packed bits; the generations in between
+store only the cells that changed since the one before, either as the list of their indices or as a
+packed XOR of the two grids, whichever is smaller. Records are appended to the file as they come.
+A generation not after the one before (the game was reset) starts a new segment with a keyframe.
+
+The reader memory-maps the file, indexes the records once, and rebuilds any generation from the
+keyframe before it plus at most KEYFRAME_INTERVAL - 1 deltas. A generation is looked up in one
+segment, the last one by default.
+
+Running the file opens a recorded run in the pygame viewer:
+python GameOfLife_History.py run.golh
+Left/Right step one generation, Page Up/Page Down jump a keyframe, Home/End go to the start/end and
+space plays or pauses.
+
+'''
+
+# importing all the dependencies
+import sys
+import numpy as np
+
+
+KEYFRAME_INTERVAL = 64
+MAGIC = b'GOLHIST1'
+KEYFRAME, INDICES, XOR = 0, 1, 2
+# record header: kind, generation, payload length
+RECORD_HEADER = np.dtype([('kind', '<u1'), ('generation', '<u4'), ('length', '<u4')])
+
+
+class HistoryWriter:
+
+    def __init__(self, path, rows, cols, keyframe_interval=KEYFRAME_INTERVAL):
+        self.rows, self.cols = rows, cols
+        self.keyframe_interval = keyframe_interval
+        self.previous = None
+        self.generation = None
+        self.count = 0  # records since the last keyframe
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC + np.array([rows, cols, keyframe_interval], dtype='<u4').tobytes())
+
+    # appending one generation of the grid
+    def append(self, grid, generation):
+        cells = (grid == 1).reshape(-1)
+        if self.generation is not None and generation <= self.generation:
+            self.count = 0  # a reset starts a new segment
+        if self.count % self.keyframe_interval == 0:
+            self.count = 0
+            self.write_record(KEYFRAME, generation, np.packbits(cells).tobytes())
+        else:
+            changed = np.flatnonzero(cells != self.previous)
+            packed_size = (len(cells) + 7) // 8
+            if 4 * len(changed) < packed_size:
+                self.write_record(INDICES, generation, changed.astype('<u4').tobytes())
+            else:
+                self.write_record(XOR, generation, np.packbits(cells != self.previous).tobytes())
+        self.previous = cells
+        self.generation = generation
+        self.count += 1
+
+    def write_record(self, kind, generation, payload):
+        header = np.array([(kind, generation, len(payload))], dtype=RECORD_HEADER)
+        self.file.write(header.tobytes() + payload)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HistoryReader:
+
+    def __init__(self, path):
+        self.data = np.memmap(path, dtype=np.uint8, mode='r')
+        if bytes(self.data[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a recorded history")
+        self.rows, self.cols, self.keyframe_interval = (
+            int(value) for value in self.data[len(MAGIC):len(MAGIC) + 12].view('<u4'))
+        self.size = self.rows * self.cols
+        # indexing the records once: kind, generation and where the payload starts and ends
+        kinds, generations, offsets, lengths = [], [], [], []
+        position = len(MAGIC) + 12
+        while position + RECORD_HEADER.itemsize <= len(self.data):
+            header = self.data[position:position + RECORD_HEADER.itemsize].view(RECORD_HEADER)[0]
+            start = position + RECORD_HEADER.itemsize
+            if start + int(header['length']) > len(self.data):
+                break  # a record cut short by a crash
+            kinds.append(int(header['kind']))
+            generations.append(int(header['generation']))
+            offsets.append(start)
+            lengths.append(int(header['length']))
+            position = start + int(header['length'])
+        self.kinds = np.array(kinds, dtype=int)
+        self.generations = np.array(generations, dtype=int)
+        self.offsets = np.array(offsets, dtype=int)
+        self.lengths = np.array(lengths, dtype=int)
+        self.keyframes = np.flatnonzero(self.kinds == KEYFRAME)
+        # the first record of every segment, a segment starts again after a reset
+        self.segments = np.concatenate([[0], np.flatnonzero(np.diff(self.generations) <= 0) + 1])
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def payload(self, index):
+        return self.data[self.offsets[index]:self.offsets[index] + self.lengths[index]]
+
+    # rebuilding the grid of the record at index from the keyframe before it
+    def frame(self, index):
+        keyframe = self.keyframes[np.searchsorted(self.keyframes, index, side='right') - 1]
+        cells = np.unpackbits(self.payload(keyframe), count=self.size).astype(bool)
+        for record in range(keyframe + 1, index + 1):
+            if self.kinds[record] == INDICES:
+                cells[self.payload(record).view('<u4')] ^= True
+            else:
+                cells ^= np.unpackbits(self.payload(record), count=self.size).astype(bool)
+        return cells.reshape(self.rows, self.cols).astype(float)
+
+    # the grid of a generation in a segment, the closest recorded one at or before it
+    def grid_at(self, generation, segment=-1):
+        start, end = self.segments[segment], np.append(self.segments[1:], len(self))[segment]
+        index = max(np.searchsorted(self.generations[start:end], generation, side='right') - 1, 0)
+        return self.frame(start + index)
+
+
+# pygame viewer for seeking back and forth through a recorded run
+def replay(path, cell_size=10):
+    import pygame
+    from GameOfLife_Renderer import GridRenderer
+
+    reader = HistoryReader(path)
+    pygame.init()
+    screen = pygame.display.set_mode((reader.cols * cell_size, reader.rows * cell_size))
+    pygame.display.set_caption("Conway's Game of Life - Replay")
+    renderer = GridRenderer(reader.rows, reader.cols, cell_size)
+    clock = pygame.time.Clock()
+    index = 0
+    playing = False
+    running = len(reader) > 0
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    playing = not playing
+                elif event.key == pygame.K_RIGHT:
+                    index += 1
+                elif event.key == pygame.K_LEFT:
+                    index -= 1
+                elif event.key == pygame.K_PAGEDOWN:
+                    index += reader.keyframe_interval
+                elif event.key == pygame.K_PAGEUP:
+                    index -= reader.keyframe_interval
+                elif event.key == pygame.K_HOME:
+                    index = 0
+                elif event.key == pygame.K_END:
+                    index = len(reader) - 1
+        if playing:
+            index += 1
+        index = min(max(index, 0), len(reader) - 1)
+        grid = reader.frame(index)
+        texts = [(f"Generation: {reader.generations[index]}", (10, 10)),
+                 (f"Alive Cells: {int(np.sum(grid))}", (10, 50))]
+        renderer.draw(screen, grid, texts)
+        clock.tick(30)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    replay(sys.argv[1])
@@ -0,0 +1,153 @@
+'''
+
+Title: Backends for the Order-dependent Steps of the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: Two steps of the variants cannot be written as a few whole-grid NumPy operations,
+because every cell sees the changes made by the cells visited before it:
+sacrifice   -> the sequential sacrifice pre-game, the alive cells play one at a time in a random order
+kill_sweep  -> the sequential Selfish kills, the crowded selfish cells kill one after the other in
+               row-major order, each walking up, right, down and left like kill_neighbors does
+
+Every kernel is registered under up to three backends:
+python  -> a plain loop over Python lists
+numpy   -> whole-array operations that still follow the order exactly; the sacrifice cells are played
+           in waves, a cell playing once every neighbour visited before it has played
+jit     -> the same loop as python compiled by Numba, only registered when Numba is installed
+
+kernel(name, backend) returns the implementation of a backend, falling back from jit to numpy and
+from numpy to python when a backend is not there, so a variant can always ask for BACKEND. The kill
+sweep has no numpy backend: a walk can reach any cell the previous killers changed, so it falls back
+to python. Every backend gives the same grid for the same visit order.
+
+The kernels work in place on the flattened grid padded with a ring of dead cells, the neighbours of
+a cell being at the flat offsets given by the caller (see sequential_sacrifice in the engine).
+
+'''
+
+# importing all the dependencies
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None  # the jit backend is left out
+
+
+BACKENDS = ('python', 'numpy', 'jit')
+BACKEND = 'jit'  # the backend the variants use unless they are given one
+FALLBACK = {'jit': 'numpy', 'numpy': 'python'}  # the backend tried when one is not registered
+KERNELS = {}  # kernel name -> {backend: function}
+
+
+# registering a function as the backend of a kernel
+def register(name, backend):
+    def decorator(function):
+        KERNELS.setdefault(name, {})[backend] = function
+        return function
+    return decorator
+
+
+# the backend actually used when backend is asked for
+def resolve_backend(name, backend=BACKEND):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    while backend not in KERNELS[name]:
+        backend = FALLBACK[backend]
+    return backend
+
+
+def kernel(name, backend=BACKEND):
+    return KERNELS[name][resolve_backend(name, backend)]
+
+
+# the sacrifice pre-game: the cells play in the order given, a cell with exactly n alive neighbours
+# dies and its neighbours lose one
+@register('sacrifice', 'python')
+def sacrifice_lists(flat_grid, flat_counts, cells, n, offsets):
+    counts = flat_counts.tolist()
+    offsets = offsets.tolist()
+    for cell in cells.tolist():
+        if counts[cell] == n:
+            flat_grid[cell] = 0
+            for offset in offsets:
+                counts[cell + offset] -= 1
+    flat_counts[:] = counts
+
+
+# the same loop on the arrays, for Numba
+def sacrifice_loop(flat_grid, flat_counts, cells, n, offsets):
+    for index in range(len(cells)):
+        cell = cells[index]
+        if flat_counts[cell] == n:
+            flat_grid[cell] = 0
+            for offset in offsets:
+                flat_counts[cell + offset] -= 1
+
+
+# playing the cells in waves: a cell is ready once its neighbours visited before it have played,
+# and neither its count nor its decision can change after that; the ready cells of a wave are never
+# neighbours, so they all play at once
+@register('sacrifice', 'numpy')
+def sacrifice_waves(flat_grid, flat_counts, cells, n, offsets):
+    order = np.arange(len(cells))
+    position = np.full(len(flat_grid), -1, dtype=np.int64)
+    position[cells] = order
+    # the place in the visit order of the eight neighbours of every cell, -1 when they do not play
+    neighbours = position[cells[:, None] + offsets[None, :]]
+    earlier = (neighbours >= 0) & (neighbours < order[:, None])
+    neighbours = np.maximum(neighbours, 0)
+    played = np.zeros(len(cells), dtype=bool)
+    waiting = order
+    while len(waiting):
+        blocked = (earlier[waiting] & ~played[neighbours[waiting]]).any(axis=1)
+        ready = waiting[~blocked]
+        sacrificed = cells[ready][flat_counts[cells[ready]] == n]
+        flat_grid[sacrificed] = 0
+        flat_counts -= np.bincount((sacrificed[:, None] + offsets[None, :]).ravel(),
+                                   minlength=len(flat_counts)).astype(flat_counts.dtype)
+        played[ready] = True
+        waiting = waiting[blocked]
+
+
+# the Selfish kills: every killer counts its alive neighbours and, while 3 or more are left, kills
+# the next alive cell in the current direction and moves onto it, turning to the next direction
+# when the cell ahead is dead
+@register('kill_sweep', 'python')
+def kill_sweep_lists(flat_alive, killers, offsets, steps):
+    alive = flat_alive.tolist()
+    offsets, steps = offsets.tolist(), steps.tolist()
+    for killer in killers.tolist():
+        neighbors = 0
+        for offset in offsets:
+            neighbors += alive[killer + offset]
+        cell = killer
+        for step in steps:
+            while neighbors >= 3 and alive[cell + step]:
+                cell += step
+                alive[cell] = 0
+                neighbors -= 1
+    flat_alive[:] = alive
+
+
+# the same loop on the arrays, for Numba
+def kill_sweep_loop(flat_alive, killers, offsets, steps):
+    for index in range(len(killers)):
+        killer = killers[index]
+        neighbors = 0
+        for offset in offsets:
+            neighbors += flat_alive[killer + offset]
+        cell = killer
+        for step in steps:
+            while neighbors >= 3 and flat_alive[cell + step]:
+                cell += step
+                flat_alive[cell] = 0
+                neighbors -= 1
+
+
+if numba is not None:
+    # compiled on the first call, and cached next to the file for the next runs
+    register('sacrifice', 'jit')(numba.njit(cache=True)(sacrifice_loop))
+    register('kill_sweep', 'jit')(numba.njit(cache=True)(kill_sweep_loop))
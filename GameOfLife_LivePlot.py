@@ -0,0 +1,295 @@
+'''
+
+Title: Live Population Chart with Blitting and Min/Max Decimation
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file draws the population in a matplotlib figure next to the pygame window while
+the game runs, instead of only once the window is closed. Two things keep it cheap:
+
+Decimation -> every series is kept as at most BINS buckets holding the min and max of the
+              generations in them. When the buckets are full, pairs of neighbouring buckets are
+              merged and each bucket covers twice as many generations, so appending is O(1) on
+              average and a redraw draws at most 2 * BINS points however long the run is. The
+              min/max envelope keeps the spikes a plain subsample would lose.
+Blitting   -> the axes, ticks and grid are drawn once and saved; a redraw restores them and draws
+              only the lines. The axes are redrawn in full only when the data goes past their
+              limits, which then grow by a factor, so this happens a few times per run.
+
+Several series can be overlaid, one line each, for the quantiles of an ensemble or the files of a
+batch sweep. append() may be called from the stepping thread of GameOfLife_Worker.py, redraw() is
+called from the pygame loop and draws at most every REDRAW_INTERVAL seconds.
+
+Running this file follows population files as they are written (the files of a batch run):
+python GameOfLife_LivePlot.py runs --follow
+
+'''
+
+# importing all the dependencies
+import argparse
+import glob
+import json
+import os
+import threading
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from GameOfLife_Recorder import MAGIC
+from GameOfLife_Analysis import detect_layout, parse_series
+
+
+BINS = 1024  # min/max buckets kept per series
+REDRAW_INTERVAL = 0.25  # seconds between redraws
+GROWTH = 1.5  # the axis limits grow by this factor when the data goes past them
+LEGEND_MAX = 10  # series shown in the legend
+FOLLOW_INTERVAL = 1.0  # seconds between reads of the followed files
+
+
+class MinMaxSeries:
+
+    # bucket k holds the min and max of generations start + k * width to start + (k + 1) * width - 1
+    def __init__(self, bins=BINS):
+        bins += bins % 2  # the buckets are merged in pairs
+        self.low = np.full(bins, np.nan)
+        self.high = np.full(bins, np.nan)
+        self.clear()
+
+    def clear(self):
+        self.low[:] = np.nan
+        self.high[:] = np.nan
+        self.start = None
+        self.width = 1
+        self.count = 0  # buckets in use
+        self.last = None  # the latest generation
+
+    # merging neighbouring buckets until the bucket of generation fits
+    def make_room(self, generation):
+        while (generation - self.start) // self.width >= len(self.low):
+            pairs = len(self.low) // 2
+            self.low[:pairs] = np.fmin(self.low[0::2], self.low[1::2])
+            self.high[:pairs] = np.fmax(self.high[0::2], self.high[1::2])
+            self.low[pairs:] = np.nan
+            self.high[pairs:] = np.nan
+            self.width *= 2
+            self.count = -(-self.count // 2)
+
+    def append(self, generation, value):
+        if self.last is not None and generation <= self.last:
+            self.clear()
+        if self.start is None:
+            self.start = generation
+        self.make_room(generation)
+        bucket = (generation - self.start) // self.width
+        # an empty bucket is NaN, which no comparison is true for
+        if not self.low[bucket] <= value:
+            self.low[bucket] = value
+        if not self.high[bucket] >= value:
+            self.high[bucket] = value
+        self.count = max(self.count, bucket + 1)
+        self.last = generation
+
+    # adding many generations at once, a generation before the latest one starts the series again
+    def extend(self, generations, values):
+        if not len(generations):
+            return
+        if self.last is not None and generations[0] <= self.last:
+            self.clear()
+        if self.start is None:
+            self.start = generations[0]
+        self.make_room(generations[-1])
+        buckets = (generations - self.start) // self.width
+        np.fmin.at(self.low, buckets, values)
+        np.fmax.at(self.high, buckets, values)
+        self.count = max(self.count, int(buckets[-1]) + 1)
+        self.last = generations[-1]
+
+    # the min/max envelope as x and y arrays of at most 2 * BINS points, empty buckets are skipped
+    def envelope(self):
+        filled = np.flatnonzero(~np.isnan(self.low[:self.count]))
+        if not len(filled):
+            return np.zeros(0), np.zeros(0)
+        x = self.start + filled * self.width
+        if self.width == 1:
+            return x.astype(float), self.low[filled]
+        x = np.column_stack([x, x + self.width - 1]).ravel().astype(float)
+        y = np.column_stack([self.low[filled], self.high[filled]]).ravel()
+        return x, y
+
+
+class LivePlot:
+
+    # one line per label, appended with append(generation, *values) like the PopulationRecorder
+    def __init__(self, labels=('Alive Cells',), bins=BINS, interval=REDRAW_INTERVAL,
+                 title='Game of Life: Alive Cells Over Generations'):
+        self.series = [MinMaxSeries(bins) for label in labels]
+        self.interval = interval
+        self.last_redraw = 0.0
+        self.lock = threading.Lock()
+        self.figure, self.axes = plt.subplots()
+        self.lines = [self.axes.plot([], [], label=label, animated=True)[0] for label in labels]
+        self.axes.set_xlabel('Generation')
+        self.axes.set_ylabel('Alive Cells')
+        self.axes.set_title(title)
+        self.axes.grid(True)
+        if 1 < len(labels) <= LEGEND_MAX:
+            self.axes.legend(loc='upper right')
+        self.axes.set_xlim(0, 100)
+        self.axes.set_ylim(0, 100)
+        self.background = None
+        # the saved background is taken again whenever the figure is drawn in full (e.g. resized)
+        self.figure.canvas.mpl_connect('draw_event', self.on_draw)
+        plt.show(block=False)
+
+    # adding one generation, with one value per series
+    def append(self, generation, *values):
+        with self.lock:
+            for series, value in zip(self.series, values):
+                series.append(generation, value)
+
+    # adding many generations at once, one row per generation with the generation first
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=float).reshape(-1, len(self.series) + 1)
+        with self.lock:
+            for index, series in enumerate(self.series):
+                series.extend(rows[:, 0].astype(np.int64), rows[:, index + 1])
+
+    # adding many generations to one series
+    def extend_series(self, index, generations, values):
+        with self.lock:
+            self.series[index].extend(generations, values)
+
+    def on_draw(self, event):
+        self.background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_lines()
+
+    def draw_lines(self):
+        for line in self.lines:
+            self.axes.draw_artist(line)
+
+    # growing the axis limits when the data is past them, returns True when they changed
+    def update_limits(self, envelopes):
+        x_max = max((x[-1] for x, y in envelopes if len(x)), default=0)
+        y_min = min((y.min() for x, y in envelopes if len(y)), default=0)
+        y_max = max((y.max() for x, y in envelopes if len(y)), default=0)
+        (left, right), (bottom, top) = self.axes.get_xlim(), self.axes.get_ylim()
+        changed = False
+        if x_max > right:
+            right = max(x_max * GROWTH, right * GROWTH)
+            changed = True
+        if y_max > top or y_min < bottom:
+            bottom, top = min(bottom, y_min), max(top, y_max * GROWTH)
+            changed = True
+        if changed:
+            self.axes.set_xlim(left, right)
+            self.axes.set_ylim(bottom, top)
+        return changed
+
+    # drawing the lines, at most every interval seconds unless forced
+    def redraw(self, force=False):
+        now = time.perf_counter()
+        if not force and now - self.last_redraw < self.interval:
+            return
+        self.last_redraw = now
+        with self.lock:
+            envelopes = [series.envelope() for series in self.series]
+        for line, (x, y) in zip(self.lines, envelopes):
+            line.set_data(x, y)
+        canvas = self.figure.canvas
+        if self.update_limits(envelopes) or self.background is None:
+            canvas.draw()  # the axes changed, on_draw saves the new background and draws the lines
+        else:
+            canvas.restore_region(self.background)
+            self.draw_lines()
+            canvas.blit(self.figure.bbox)
+        canvas.flush_events()
+
+    def is_open(self):
+        return plt.fignum_exists(self.figure.number)
+
+    def close(self):
+        plt.close(self.figure)
+
+
+class FileTail:
+
+    # reading the rows added to a population file since the last read; the recorder files (csv or
+    # binary) are read from where the last read stopped, the older row and column layouts of Data/
+    # are read once
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.columns = None
+        self.layout = None
+
+    def read(self):
+        if self.layout is None:
+            layout = detect_layout(self.path)
+            if layout in ('row', 'column'):
+                self.layout = layout
+                return np.column_stack(parse_series(self.path, layout))
+            if layout == 'empty':
+                return np.zeros((0, 2))
+            self.layout = layout
+        if self.layout in ('row', 'column'):
+            return np.zeros((0, 2))
+        with open(self.path, 'rb') as file:
+            if self.columns is None:
+                if self.layout == 'binary':
+                    file.seek(len(MAGIC))
+                    header_length = int(np.frombuffer(file.read(4), dtype='<u4')[0])
+                    self.columns = json.loads(file.read(header_length))
+                else:
+                    header = file.readline()
+                    if not header.endswith(b'\n'):
+                        self.layout = None
+                        return np.zeros((0, 2))
+                    self.columns = header.decode().strip().split(',')
+                self.offset = file.tell()
+            file.seek(self.offset)
+            data = file.read()
+        if self.layout == 'binary':
+            record = 8 * len(self.columns)
+            data = data[:len(data) - len(data) % record]
+            rows = np.frombuffer(data, dtype='<f8').reshape(-1, len(self.columns))
+        else:
+            # only the complete lines, a line being written is read next time
+            data = data[:data.rfind(b'\n') + 1]
+            rows = np.array(data.decode().replace(',', ' ').split(), dtype=float).reshape(-1, len(self.columns))
+        self.offset += len(data)
+        return rows[:, :2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plot population files, following them as they are written.")
+    parser.add_argument('paths', nargs='+', help="population files or directories of them")
+    parser.add_argument('--follow', action='store_true', help="keep reading the files until the figure is closed")
+    parser.add_argument('--interval', type=float, default=FOLLOW_INTERVAL, help="seconds between reads")
+    parser.add_argument('--bins', type=int, default=BINS)
+    args = parser.parse_args(argv)
+
+    paths = []
+    for path in args.paths:
+        paths += sorted(glob.glob(os.path.join(path, '*.csv'))) if os.path.isdir(path) else [path]
+    tails = [FileTail(path) for path in paths]
+    plot = LivePlot([os.path.splitext(os.path.basename(path))[0] for path in paths], args.bins)
+
+    def read_all():
+        for index, tail in enumerate(tails):
+            rows = tail.read()
+            if len(rows):
+                plot.extend_series(index, rows[:, 0].astype(np.int64), rows[:, 1])
+
+    read_all()
+    plot.redraw(force=True)
+    if not args.follow:
+        plt.show()
+        return
+    while plot.is_open():
+        plt.pause(args.interval)
+        read_all()
+        plot.redraw(force=True)
+
+
+if __name__ == "__main__":
+    main()
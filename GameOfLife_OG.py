@@ -18,7 +18,17 @@ import pygame
 import numpy as np
 import time
 import matplotlib.pyplot as plt
-import csv
+from GameOfLife_Engine import life_step
+from GameOfLife_Renderer import GridRenderer
+from GameOfLife_Viewport import Viewport
+from GameOfLife_Profiler import PhaseTimer
+from GameOfLife_Worker import SimulationWorker
+from GameOfLife_Checkpoint import CheckpointWriter
+from GameOfLife_LivePlot import LivePlot
+from GameOfLife_Recorder import PopulationRecorder, read_population
+from GameOfLife_History import HistoryWriter
+from GameOfLife_HashLife import HashLifeUniverse
+from GameOfLife_ActiveSet import ActiveSetStepper
 
 
 # Constants
@@ -26,54 +36,97 @@ WIDTH, HEIGHT = 800, 600
 CELL_SIZE = 10
 ROWS = HEIGHT // CELL_SIZE
 COLS = WIDTH // CELL_SIZE
+# set to True to play on a WORLD_ROWS x WORLD_COLS board larger than the window, seen through
+# a pan and zoom viewport (mouse wheel or +/- to zoom, arrows or middle drag to pan, 0 to fit)
+VIEWPORT = False
+WORLD_ROWS, WORLD_COLS = 1000, 1000
+if VIEWPORT:
+    ROWS, COLS = WORLD_ROWS, WORLD_COLS
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
 GRAY = (169, 169, 169)
+# the alive cells of every generation are streamed to this file
+POPULATION_FILE = 'AliveCells_OG.csv'
+# set to a file name to record every generation for replay with GameOfLife_History.py
+HISTORY_FILE = None
+# set to True to time every phase of the loop from the start, F3 turns the timings on and off
+PROFILE = False
+# set to a file name to also run cProfile while the timings are on, the stats are written there on close
+PROFILE_FILE = None
+# set to True to step in a background thread, the window then draws the latest generation
+BACKGROUND = False
+# with BACKGROUND, step as fast as possible instead of every update_interval (every generation is still recorded)
+TURBO = False
+# set to a file name to save a checkpoint every CHECKPOINT_INTERVAL generations,
+# the game carries on from it when it is started again
+CHECKPOINT_FILE = None
+CHECKPOINT_INTERVAL = 100
+# set to True to draw the population in a live chart while the game runs
+LIVE_PLOT = False
+# set to k to advance 2^k generations per update with the HashLife engine, the board then has no edges:
+# the window shows the ROWS x COLS cells from (0, 0) and counts only those, the cells which leave it
+# carry on outside and can come back
+HASHLIFE_STEP = None
+# set to True to evaluate only the cells next to last generation's changes
+ACTIVE_SET = False
 # Creating the grid
 def initialize_grid():
     return np.zeros((ROWS, COLS))
 
+# the renderer is created on the first frame, once pygame is initialised
+renderer = None
+
 # Drawing the grid with different colors and texts
-def draw_grid(screen, grid, generation, alive_cells):
-    screen.fill(BLACK)
-    for row in range(ROWS):
-        for col in range(COLS):
-            if grid[row][col] == 1:
-                pygame.draw.rect(screen, GREEN, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-            else:
-                pygame.draw.rect(screen, GRAY, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
-    font = pygame.font.Font(None, 36)
-    text = font.render(f"Generation: {generation}", True, WHITE)
-    titletext = font.render(f"CONWAY'S GAME OF LIFE", True, WHITE)
-    alive_cells_text = font.render(f"Alive Cells: {alive_cells}", True, WHITE) 
-    screen.blit(text, (10, 10))
-    screen.blit(titletext, (450, 10))
-    screen.blit(alive_cells_text, (10, 50))
-    pygame.display.update()
+def draw_grid(screen, grid, generation, alive_cells, overlay=()):
+    global renderer
+    if renderer is None:
+        if VIEWPORT:
+            renderer = Viewport(ROWS, COLS, WIDTH, HEIGHT, CELL_SIZE, alive_color=GREEN, line_color=GRAY)
+        else:
+            renderer = GridRenderer(ROWS, COLS, CELL_SIZE, alive_color=GREEN, line_color=GRAY)
+    texts = [(f"Generation: {generation}", (10, 10)),
+             (f"Alive Cells: {alive_cells}", (10, 50))]
+    renderer.draw(screen, grid, texts + list(overlay))
+
+# the board cell under a point of the window, through the viewport when there is one
+def cell_at(x, y):
+    if VIEWPORT and renderer is not None:
+        return renderer.screen_to_cell(x, y)
+    return y // CELL_SIZE, x // CELL_SIZE
 
 # Upgrading the grid for each generation
 def update_grid(grid, generation, alive_cells):
-    new_grid = grid.copy()
-    alive_cells = 0
-     # nature rules
-    for row in range(ROWS):
-        for col in range(COLS):
-            neighbors = count_neighbors(grid, row, col)
-            if grid[row][col] == 1:
-                alive_cells += 1
-            # rule  Death: If neighbors are less than 2 or greater than 3 
-                if neighbors < 2 or neighbors > 3:
-                    new_grid[row][col] = 0
-            else:
-            # rule Birth: If there are 3 neighbours for a dead cell birth takes place
-                if neighbors == 3:
-                    new_grid[row][col] = 1
-                    alive_cells += 1
+    # nature rules applied to the whole grid by the vectorized engine
+    new_grid = life_step(grid)
     generation += 1
     alive_cells = np.sum(new_grid)
     return new_grid, generation, alive_cells
 
+# the update function of the background worker, stepping with HashLife or the active set when they are chosen;
+# the worker edits and resets a copy of the grid, so a grid the stepper did not return means it starts again
+def worker_update():
+    if not ACTIVE_SET and HASHLIFE_STEP is None:
+        return update_grid
+    last = {'grid': None, 'stepper': None}
+
+    def update(grid, generation, alive_cells):
+        if grid is not last['grid']:
+            last['stepper'] = ActiveSetStepper(grid) if ACTIVE_SET else HashLifeUniverse.from_grid(grid, generation)
+        stepper = last['stepper']
+        if ACTIVE_SET:
+            grid = stepper.step()
+            generation += 1
+            alive_cells = stepper.alive_cells
+        else:
+            stepper.step(HASHLIFE_STEP)
+            grid = stepper.to_grid(ROWS, COLS)
+            generation = stepper.generation
+            alive_cells = np.sum(grid)
+        last['grid'] = grid
+        return grid, generation, alive_cells
+    return update
+
 # counting the neighbours of the particular cell
 def count_neighbors(grid, row, col):
     count = 0
@@ -102,12 +155,40 @@ def main():
     update_interval = 0.1  # in seconds
     generation = 0
     alive_cells = 0
-    alive_cells_array = []
+    recorder = PopulationRecorder(POPULATION_FILE)
+    history = HistoryWriter(HISTORY_FILE, ROWS, COLS) if HISTORY_FILE else None
+    checkpoints = None
+    if CHECKPOINT_FILE:
+        checkpoints = CheckpointWriter(CHECKPOINT_FILE, CHECKPOINT_INTERVAL, recorder=recorder)
+        if checkpoints.exists():
+            # carrying on from the checkpoint of an interrupted game
+            state = checkpoints.resume()
+            grid, generation, alive_cells = state['grid'], state['generation'], state['alive_cells']
+    profiler = PhaseTimer(PROFILE, profile_path=PROFILE_FILE)
+    plot = None
+    if LIVE_PLOT:
+        plot = LivePlot()
+        if checkpoints is not None and checkpoints.exists():
+            plot.extend(np.column_stack([state['generations'], state['populations']]))
+    worker = None  # background stepping thread, see GameOfLife_Worker.py
+    if BACKGROUND:
+        worker = SimulationWorker(worker_update(), grid, rate=None if TURBO else 1 / update_interval,
+                                  generation=generation, recorder=recorder, history=history,
+                                  checkpoints=checkpoints, plot=plot)
+    universe = None  # HashLife universe, rebuilt from the grid after every edit
+    stepper = None  # active-set stepper, rebuilt from the grid after every edit
 
     while running:
         current_time = time.time()
+        if worker is not None:
+            # editing a copy of the latest generation, the changes are forwarded to the worker
+            shown, generation, alive_cells = worker.latest()
+            grid = shown.copy()
+        frame_generation = generation
         # interacting with the game
         for event in pygame.event.get():
+            if VIEWPORT and renderer is not None and renderer.handle_event(event):
+                continue  # panning and zooming
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -116,46 +197,90 @@ def main():
                 elif event.button == 3:  # Right mouse button
                     placing_cells = False  # Disable placing cells, prepare for clearing if held
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     if 0 <= row < ROWS and 0 <= col < COLS:
                         grid[row][col] = 0  # Clear cell on single right-click
+                    profiler.lap('events')
                     alive_cells = np.sum(grid)  # Update alive cells count after modification
+                    profiler.lap('recount')
+                    universe = stepper = None
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1 or event.button == 3:
                     placing_cells = False  # Disable placing or clearing on any button release
             elif event.type == pygame.MOUSEMOTION:
                 if event.buttons[0]:  # Check if left button is held during motion
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     if 0 <= row < ROWS and 0 <= col < COLS:
                         grid[row][col] = 1  # Set cell to alive
+                        universe = stepper = None
                 elif event.buttons[2]:  # Check if right button is held during motion
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     if 0 <= row < ROWS and 0 <= col < COLS:
                         grid[row][col] = 0  # Clear cells while right mouse button is held
+                        universe = stepper = None
+                profiler.lap('events')
                 alive_cells = np.sum(grid)  # Update alive cells count after modification
+                profiler.lap('recount')
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_SPACE:
                     simulation_running = not simulation_running
                 elif event.key == pygame.K_r:
                     grid = initialize_grid()
+                    if worker is not None:
+                        worker.reset(grid)
                     generation = 0
                     alive_cells = 0
+                    universe = stepper = None
 
-        if simulation_running and current_time - last_update_time > update_interval:
-            grid, generation, alive_cells = update_grid(grid, generation, alive_cells)
-            alive_cells_array.append(alive_cells)
+        if worker is not None:
+            worker.edit(grid, shown)
+            worker.set_running(simulation_running)
+        profiler.lap('events')
+        if worker is None and simulation_running and current_time - last_update_time > update_interval:
+            if ACTIVE_SET:
+                if stepper is None:
+                    stepper = ActiveSetStepper(grid)
+                grid = stepper.step()
+                generation += 1
+                alive_cells = stepper.alive_cells
+            elif HASHLIFE_STEP is None:
+                grid, generation, alive_cells = update_grid(grid, generation, alive_cells)
+            else:
+                if universe is None:
+                    universe = HashLifeUniverse.from_grid(grid, generation)
+                universe.step(HASHLIFE_STEP)
+                grid = universe.to_grid(ROWS, COLS)
+                generation = universe.generation
+                # the universe is unbounded, the population is the one of the window
+                alive_cells = np.sum(grid)
+            recorder.append(generation, alive_cells)
+            if plot is not None:
+                plot.append(generation, alive_cells)
+            if checkpoints is not None:
+                checkpoints.append(grid, generation, alive_cells)
+            if history is not None:
+                history.append(grid, generation)
             last_update_time = current_time
 
-        draw_grid(screen, grid, generation, alive_cells)
+        profiler.lap('sim')
+        draw_grid(screen, grid, generation, alive_cells, profiler.overlay_texts())
+        if plot is not None:
+            plot.redraw()
+        profiler.lap('render')
+        profiler.end_frame(max(generation - frame_generation, 0))
 
         if not running:
-            # Plot generations vs. alive_cells_array after the simulation loop
-            plt.plot(range(generation), alive_cells_array)
+            # Plot generations vs. alive cells after the simulation loop
+            if worker is not None:
+                worker.close()
+            recorder.flush()
+            if plot is not None:
+                plot.close()
+            plt.plot(*read_population(POPULATION_FILE))
             plt.xlabel('Generation')
             plt.ylabel('Alive Cells')
             plt.title('Game of Life: Alive Cells Over Generations')
@@ -163,10 +288,12 @@ def main():
             plt.show()
 
     pygame.quit()
-
-    with open('AliveCells_OG.csv', 'w', newline = '') as csvfile:
-        my_writer = csv.writer(csvfile, delimiter = ' ')
-        my_writer.writerow(alive_cells_array)
+    if checkpoints is not None:
+        checkpoints.close()
+    profiler.close(POPULATION_FILE)
+    recorder.close()
+    if history is not None:
+        history.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
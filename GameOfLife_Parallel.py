@@ -0,0 +1,228 @@
+'''
+
+Title: Multi-core Tiled Stepping for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file steps one large board on several cores. The board is split into bands of rows
+and every worker process steps its own band. The board lives in two multiprocessing.shared_memory
+buffers used as a double buffer: in every generation all the workers read the current buffer and
+write the other one, then meet at a barrier and swap. A worker reads the row above and below its
+band (its halo) straight from the current buffer, so the halos are exchanged without any copies.
+
+The OG and Sacrifice rules only need the halo. For DeathProbability the number of deaths is decided
+for the whole board: the workers publish their candidate counts and meet at a barrier. Every
+candidate has a 64-bit key from the counter-based generator (GameOfLife_CounterRNG.py) at its board
+coordinates, and the round(Pdeath * candidates) candidates with the smallest keys die. The workers
+find the largest of those keys together with a radix select: in each of 64 / RADIX_BITS rounds they
+publish a histogram of the next digit of their keys, meet at a barrier and narrow the key down by
+that digit. The deaths are therefore exactly those of death_probability_step on the whole board,
+whatever the number of workers.
+
+Running the file benchmarks generations/sec against the number of workers:
+python GameOfLife_Parallel.py --size 20000 --workers 1 2 4 8 --generations 10
+
+'''
+
+# importing all the dependencies
+import argparse
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from GameOfLife_CounterRNG import DEATH, RADIX_BITS, CounterRNG, radix_digit, radix_histogram
+from GameOfLife_Engine import life_step, masks, sacrifice_step, weighted_neighbors_grid
+
+
+FILL_ROWS = 256  # rows of a random board drawn at once, bounds the temporary memory
+
+
+# worker process stepping the rows [start, stop) of the board
+def band_worker(index, start, stop, shape, names, control, stats, histograms, rule, params, start_barrier,
+                step_barrier):
+    buffers = [shared_memory.SharedMemory(name=name) for name in names]
+    boards = [np.ndarray(shape, dtype=np.uint8, buffer=buffer.buf) for buffer in buffers]
+    # two sets of one histogram per worker, used in turn by the rounds of the radix select
+    histograms = np.frombuffer(histograms, dtype=np.int64).reshape(2, -1, 1 << RADIX_BITS)
+    rng = CounterRNG(params['seed'])
+    rows = shape[0]
+    try:
+        while True:
+            start_barrier.wait()
+            generations, stop_flag, current, first_generation = control[:4]
+            if stop_flag:
+                break
+            for generation in range(first_generation, first_generation + generations):
+                src, dst = boards[current], boards[1 - current]
+                # the band with its halo rows, the edges of the board have none
+                top, bottom = max(start - 1, 0), min(stop + 1, rows)
+                band = src[top:bottom]
+                inner = slice(start - top, start - top + stop - start)
+                if rule == 'og':
+                    dst[start:stop] = life_step(band)[inner]
+                elif rule == 'sacrifice':
+                    dst[start:stop] = sacrifice_step(band, params['n'])[inner]
+                else:
+                    dst[start:stop] = death_probability_band(band, inner, index, rng.at(generation, start),
+                                                             stats, histograms, params, step_barrier)
+                stats[index * 2 + 1] = int(np.count_nonzero(dst[start:stop]))
+                step_barrier.wait()
+                current = 1 - current
+            start_barrier.wait()
+    finally:
+        for buffer in buffers:
+            buffer.close()
+
+
+# DeathProbability rules for one band, draws holds the random numbers at the board coordinates
+def death_probability_band(band, inner, index, draws, stats, histograms, params, step_barrier):
+    counts = weighted_neighbors_grid(band, params['mask'])[inner]
+    cells = band[inner]
+    alive = cells == 1
+    rows, cols = np.nonzero(alive & ((counts < 2) | (counts > 3)))
+    born = ~alive & (counts == 3)
+
+    stats[index * 2] = len(rows)
+    step_barrier.wait()
+    candidates = int(sum(stats[0::2]))
+    expected_deaths = int(round(params['Pdeath'] * candidates))
+    if expected_deaths >= candidates:
+        die = np.ones(len(rows), dtype=bool)
+    elif expected_deaths <= 0:
+        die = np.zeros(len(rows), dtype=bool)
+    else:
+        keys = draws.keys(rows, cols, DEATH)
+        die = keys <= band_threshold(keys, expected_deaths, index, histograms, step_barrier)
+
+    new_cells = cells.copy()
+    new_cells[born] = 1
+    new_cells[rows[die], cols[die]] = 0
+    return new_cells
+
+
+# the k-th smallest key of the whole board, found by all the workers with one histogram per round
+def band_threshold(keys, k, index, histograms, step_barrier):
+    prefix = 0
+    for turn, shift in enumerate(range(64 - RADIX_BITS, -1, -RADIX_BITS)):
+        # a set is written again two rounds later, when every worker has passed the barrier after reading it
+        histograms[turn % 2, index] = radix_histogram(keys, prefix, shift)
+        step_barrier.wait()
+        prefix, k = radix_digit(histograms[turn % 2].sum(axis=0), prefix, k)
+    return np.uint64(prefix)
+
+
+# drawing a random board straight into board, FILL_ROWS rows at a time; the generator fills the rows in
+# order, so the board is the same as thresholding one rng.random((rows, cols)) array
+def fill_random(board, density, seed=0):
+    rng = np.random.default_rng(seed)
+    for start in range(0, len(board), FILL_ROWS):
+        stop = min(start + FILL_ROWS, len(board))
+        board[start:stop] = rng.random((stop - start, board.shape[1])) < density
+
+
+class ParallelEngine:
+
+    # rule is 'og', 'sacrifice' (with n) or 'death_probability' (with mask name, Pdeath and seed);
+    # grid is the starting board, or (rows, cols) for a random board with density drawn with fill_random
+    def __init__(self, grid, rule='og', workers=None, n=None, mask='Standard', Pdeath=1.0, seed=0, density=None):
+        rows, cols = grid if isinstance(grid, tuple) else grid.shape
+        self.shape = (rows, cols)
+        workers = min(workers or os.cpu_count(), rows)
+        self.buffers = [shared_memory.SharedMemory(create=True, size=max(rows * cols, 1)) for _ in range(2)]
+        self.boards = [np.ndarray(self.shape, dtype=np.uint8, buffer=buffer.buf) for buffer in self.buffers]
+        if isinstance(grid, tuple):
+            fill_random(self.boards[0], density, seed)
+        else:
+            self.boards[0][:] = grid == 1
+        self.current = 0
+        self.generation = 0
+
+        context = mp.get_context()
+        # generations, stop flag, current buffer, first generation
+        self.control = context.RawArray('q', 4)
+        # candidates and population of every band
+        self.stats = context.RawArray('q', 2 * workers)
+        # digit histograms of the radix select, two sets of one per worker
+        self.histograms = context.RawArray('q', 2 * workers << RADIX_BITS)
+        self.start_barrier = context.Barrier(workers + 1)
+        step_barrier = context.Barrier(workers)
+        params = {'n': n, 'mask': masks[mask], 'Pdeath': Pdeath, 'seed': seed}
+        bounds = np.linspace(0, rows, workers + 1).astype(int)
+        for index in range(workers):
+            self.stats[index * 2 + 1] = int(np.count_nonzero(self.boards[0][bounds[index]:bounds[index + 1]]))
+        names = [buffer.name for buffer in self.buffers]
+        self.processes = []
+        for index in range(workers):
+            process = context.Process(target=band_worker, daemon=True,
+                                      args=(index, bounds[index], bounds[index + 1], self.shape, names,
+                                            self.control, self.stats, self.histograms, rule, params,
+                                            self.start_barrier, step_barrier))
+            process.start()
+            self.processes.append(process)
+
+    # advancing the board by a number of generations
+    def step(self, generations=1):
+        self.control[:4] = [generations, 0, self.current, self.generation]
+        self.start_barrier.wait()
+        self.start_barrier.wait()
+        self.current = (self.current + generations) % 2
+        self.generation += generations
+
+    @property
+    def grid(self):
+        return self.boards[self.current].astype(float)
+
+    @property
+    def population(self):
+        return int(sum(self.stats[1::2]))
+
+    def close(self):
+        if not self.processes:
+            return
+        self.control[1] = 1
+        self.start_barrier.wait()
+        for process in self.processes:
+            process.join()
+        self.processes = []
+        self.boards = []
+        for buffer in self.buffers:
+            buffer.close()
+            buffer.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# measuring generations/sec for every number of workers on a random board
+# the board is drawn into the shared memory by every engine, a 20000x20000 board never exists as floats
+def benchmark_scaling(size, worker_counts, generations, rule='og', density=0.3):
+    results = {}
+    for workers in worker_counts:
+        with ParallelEngine((size, size), rule, workers, n=2, mask='Hex1', Pdeath=0.5, density=density) as engine:
+            engine.step(1)  # warm up the workers
+            start = time.perf_counter()
+            engine.step(generations)
+            elapsed = time.perf_counter() - start
+        results[workers] = generations / elapsed
+        print(f"{workers:3d} workers: {results[workers]:8.2f} generations/sec "
+              f"(x{results[workers] / results[worker_counts[0]]:.2f})")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the multi-core engine against the number of workers.")
+    parser.add_argument('--size', type=int, default=20000, help="the board is size x size")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--rule', choices=['og', 'sacrifice', 'death_probability'], default='og')
+    args = parser.parse_args(argv)
+    benchmark_scaling(args.size, args.workers, args.generations, args.rule)
+
+
+if __name__ == "__main__":
+    main()
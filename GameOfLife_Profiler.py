@@ -0,0 +1,151 @@
+'''
+
+Title: Per-phase Profiling for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file times the phases of the main() loops so it is clear where a frame goes:
+events  -> handling the pygame events
+recount -> the np.sum(grid) recounts after the grid is edited with the mouse
+sim     -> stepping the grid and recording the generation
+render  -> drawing the frame
+
+The loop calls lap(phase) after each phase; the time since the previous lap is added to that phase,
+so the phases of a frame add up to the whole frame. The last WINDOW samples of every phase are kept
+for rolling percentiles, and end_frame() also tracks FPS and generations/sec. Pressing F3 in a
+window turns the timer on and off and shows the timings over the grid.
+
+When the timer is off every call returns straight away, so leaving the calls in the loop costs
+nothing noticeable. With profile_path set, cProfile also runs while the timer is on and its stats
+are written to that file on close. The timings are exported next to the population file as
+<name>_timings.csv.
+
+'''
+
+# importing all the dependencies
+import cProfile
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import numpy as np
+
+
+WINDOW = 300  # samples kept per phase for the rolling percentiles
+PERCENTILES = (50, 95, 99)
+OVERLAY_INTERVAL = 0.5  # seconds between refreshes of the overlay texts
+NULL_PHASE = nullcontext()
+
+
+class PhaseTimer:
+
+    def __init__(self, enabled=False, window=WINDOW, profile_path=None):
+        self.window = window
+        self.samples = {}  # phase -> deque of the last durations in seconds
+        self.totals = {}  # phase -> [count, total seconds]
+        self.frames = deque(maxlen=window)  # (duration, generations) of the last frames
+        self.profile_path = profile_path
+        self.profiler = cProfile.Profile() if profile_path else None
+        self.overlay = []
+        self.last_overlay = 0.0
+        self.enabled = False
+        if enabled:
+            self.toggle()
+
+    # turning the timer on or off
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.last_lap = self.frame_start = time.perf_counter()
+        if self.profiler is not None:
+            if self.enabled:
+                self.profiler.enable()
+            else:
+                self.profiler.disable()
+
+    def record(self, phase, duration):
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = deque(maxlen=self.window)
+            self.totals[phase] = [0, 0.0]
+        samples.append(duration)
+        totals = self.totals[phase]
+        totals[0] += 1
+        totals[1] += duration
+
+    # adding the time since the previous lap to a phase
+    def lap(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record(phase, now - self.last_lap)
+        self.last_lap = now
+
+    # timing a block on its own, outside the laps
+    def phase(self, phase):
+        if not self.enabled:
+            return NULL_PHASE
+        return self.timed(phase)
+
+    @contextmanager
+    def timed(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    # closing a frame in which a number of generations were stepped
+    def end_frame(self, generations=0):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frames.append((now - self.frame_start, generations))
+        self.frame_start = self.last_lap = now
+
+    # rolling percentiles of a phase in milliseconds
+    def percentiles(self, phase, percentiles=PERCENTILES):
+        samples = self.samples.get(phase)
+        if not samples:
+            return [0.0] * len(percentiles)
+        return list(np.percentile(np.asarray(samples) * 1e3, percentiles))
+
+    def fps(self):
+        duration = sum(frame[0] for frame in self.frames)
+        return len(self.frames) / duration if duration > 0 else 0.0
+
+    def generations_per_sec(self):
+        duration = sum(frame[0] for frame in self.frames)
+        return sum(frame[1] for frame in self.frames) / duration if duration > 0 else 0.0
+
+    # HUD texts from the top-left position pos, refreshed every OVERLAY_INTERVAL seconds
+    def overlay_texts(self, pos=(10, 460)):
+        if not self.enabled:
+            return []
+        now = time.perf_counter()
+        if now - self.last_overlay > OVERLAY_INTERVAL:
+            x, y = pos
+            sim = self.percentiles('sim', (50, 95))
+            render = self.percentiles('render', (50, 95))
+            self.overlay = [(f"Sim: {sim[0]:.2f} ms (p95 {sim[1]:.2f})", (x, y)),
+                            (f"Render: {render[0]:.2f} ms (p95 {render[1]:.2f})", (x, y + 30)),
+                            (f"FPS: {self.fps():.1f}", (x, y + 60)),
+                            (f"Gens/sec: {self.generations_per_sec():.1f}", (x, y + 90))]
+            self.last_overlay = now
+        return self.overlay
+
+    # writing the timings of every phase to a CSV file
+    def export(self, path):
+        with open(path, 'w') as csvfile:
+            csvfile.write('Phase,Count,Total s,Mean ms,' + ','.join(f'p{p} ms' for p in PERCENTILES) + '\n')
+            for phase, (count, total) in self.totals.items():
+                values = [count, total, total / count * 1e3] + self.percentiles(phase)
+                csvfile.write(phase + ',' + ','.join('%.6g' % value for value in values) + '\n')
+
+    # exporting the timings next to the population file, if anything was timed
+    def close(self, population_file=None):
+        if self.enabled:
+            self.toggle()
+        if population_file and self.totals:
+            self.export(population_file.rsplit('.', 1)[0] + '_timings.csv')
+        if self.profiler is not None and self.totals:
+            self.profiler.dump_stats(self.profile_path)
@@ -0,0 +1,116 @@
+'''
+
+Title: Streaming Population Recorder for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file writes the per-generation metrics of a run while the run is going, instead of
+keeping them all in memory and writing one row when the window is closed. Rows are collected in a
+fixed-size buffer and appended to the file when the buffer is full or FLUSH_INTERVAL seconds have
+passed, so memory stays bounded and a crash loses at most one batch.
+
+Two formats are supported:
+csv    -> a "Generation Count,Population Count" header and one row per generation (like AliveCells_OG.csv)
+binary -> a small header followed by float64 records, read back with a single np.fromfile
+
+The format is taken from the file extension (.csv or anything else for binary) unless given.
+
+'''
+
+# importing all the dependencies
+import json
+import time
+import numpy as np
+
+
+COLUMNS = ('Generation Count', 'Population Count')
+BATCH_SIZE = 1024  # rows kept in memory before they are written
+FLUSH_INTERVAL = 5.0  # seconds between writes when the batch is not full
+MAGIC = b'GOLPOP1\n'
+
+
+class PopulationRecorder:
+
+    def __init__(self, path, mode=None, columns=COLUMNS, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.mode = mode or ('csv' if path.endswith('.csv') else 'binary')
+        self.columns = tuple(columns)
+        self.buffer = np.empty((batch_size, len(self.columns)))
+        self.size = 0
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+        self.file = open(path, 'w' if self.mode == 'csv' else 'wb')
+        if self.mode == 'csv':
+            self.file.write(','.join(self.columns) + '\n')
+        else:
+            header = json.dumps(self.columns).encode()
+            self.file.write(MAGIC + np.array([len(header)], dtype='<u4').tobytes() + header)
+        self.file.flush()
+
+    # adding the metrics of one generation, in the order of the columns
+    def append(self, *values):
+        self.buffer[self.size] = values
+        self.size += 1
+        if self.size == len(self.buffer) or time.monotonic() - self.last_flush > self.flush_interval:
+            self.flush()
+
+    # adding many generations at once, one row per generation
+    def extend(self, rows):
+        self.flush()
+        self.write_rows(np.asarray(rows, dtype=float).reshape(-1, len(self.columns)))
+
+    # writing the buffered rows to the file
+    def flush(self):
+        self.write_rows(self.buffer[:self.size])
+        self.size = 0
+        self.last_flush = time.monotonic()
+
+    def write_rows(self, rows):
+        if self.mode == 'csv':
+            # the counts are whole numbers, written without a trailing .0
+            self.file.write(''.join(','.join('%.10g' % value for value in row) + '\n' for row in rows))
+        else:
+            self.file.write(rows.astype('<f8').tobytes())
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# loading every column of a recorded file as NumPy arrays
+def read_metrics(path):
+    with open(path, 'rb') as file:
+        start = file.read(len(MAGIC))
+    if start == MAGIC:
+        with open(path, 'rb') as file:
+            file.seek(len(MAGIC))
+            header_length = int(np.frombuffer(file.read(4), dtype='<u4')[0])
+            columns = json.loads(file.read(header_length))
+            offset = file.tell()
+        data = np.fromfile(path, dtype='<f8', offset=offset)
+        # a record cut short by a crash is dropped
+        data = data[:len(data) - len(data) % len(columns)].reshape(-1, len(columns))
+    else:
+        with open(path) as file:
+            columns = file.readline().strip().split(',')
+            empty = file.readline() == ''
+        if empty:
+            data = np.empty((0, len(columns)))
+        else:
+            data = np.loadtxt(path, delimiter=',', skiprows=1, ndmin=2)
+    return {column: data[:, index] for index, column in enumerate(columns)}
+
+
+# loading the generations and the alive cells of a recorded file
+def read_population(path):
+    metrics = read_metrics(path)
+    return metrics[COLUMNS[0]], metrics[COLUMNS[1]]
@@ -0,0 +1,73 @@
+'''
+
+Title: Surfarray Renderer for Conway's Game of Life
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file draws the grid with a fixed amount of work per frame instead of one
+pygame.draw.rect per cell. The grid is written into a one-pixel-per-cell surface through
+pygame.surfarray and scaled up to the cell size with nearest-neighbour scaling. The empty board
+with its gray cell outlines is drawn once and reused as the background, and the font, the title
+and the HUD texts are rendered once and only re-rendered when their values change.
+
+The frame looks the same as the per-cell drawing: live cells are filled, dead cells show
+their gray outline.
+
+'''
+
+# importing all the dependencies
+import pygame
+import numpy as np
+
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+GRAY = (169, 169, 169)
+
+
+class GridRenderer:
+
+    def __init__(self, rows, cols, cell_size, title="CONWAY'S GAME OF LIFE", title_pos=(450, 10),
+                 alive_color=GREEN, line_color=GRAY):
+        self.rows, self.cols, self.cell_size = rows, cols, cell_size
+        size = (cols * cell_size, rows * cell_size)
+
+        # the empty board with the outlines of every cell, drawn once
+        self.board = pygame.Surface(size)
+        self.board.fill(BLACK)
+        for row in range(rows):
+            for col in range(cols):
+                pygame.draw.rect(self.board, line_color, (col * cell_size, row * cell_size, cell_size, cell_size), 1)
+
+        # one pixel per cell, scaled into a surface where black is transparent
+        self.cells = pygame.Surface((cols, rows))
+        self.scaled = pygame.Surface(size)
+        self.scaled.set_colorkey(BLACK)
+        self.alive_color = self.cells.map_rgb(alive_color)
+
+        self.font = pygame.font.Font(None, 36)
+        self.title = self.font.render(title, True, WHITE)
+        self.title_pos = title_pos
+        self.texts = {}  # position -> (text, rendered surface)
+
+    # rendering a HUD text, reusing the last surface at this position if the text is the same
+    def text_surface(self, text, pos):
+        cached = self.texts.get(pos)
+        if cached is None or cached[0] != text:
+            cached = (text, self.font.render(text, True, WHITE))
+            self.texts[pos] = cached
+        return cached[1]
+
+    # drawing the grid and the HUD texts, given as (text, position) pairs
+    def draw(self, screen, grid, texts):
+        screen.blit(self.board, (0, 0))
+        # surfarray is indexed (x, y), so the grid is transposed
+        pygame.surfarray.blit_array(self.cells, np.where(grid.T == 1, self.alive_color, 0))
+        pygame.transform.scale(self.cells, self.scaled.get_size(), self.scaled)
+        screen.blit(self.scaled, (0, 0))
+        for text, pos in texts:
+            screen.blit(self.text_surface(text, pos), pos)
+        screen.blit(self.title, self.title_pos)
+        pygame.display.update()
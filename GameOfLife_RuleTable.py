@@ -0,0 +1,94 @@
+'''
+
+Title: Lookup-table Rule Compiler for the Weighted Neighbourhood Masks
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: A 3x3 neighbourhood has only 512 configurations, so the outcome of a mask and a
+birth/survive rule can be worked out once for all of them. compile_rule() builds a 512-entry table
+indexed by the 9-bit code of the neighbourhood: bit 3 * (i + 1) + (j + 1) is the cell at offset
+(i, j), so bit 4 is the cell itself. Each entry is one of
+DEAD    -> a dead cell that stays dead
+SURVIVE -> an alive cell that lives on
+BORN    -> a dead cell that comes alive
+DOOMED  -> an alive cell that dies, with probability Pdeath in DeathProbability
+
+The weighted sums of the table are added in the same order as count_neighbors, so the ceil
+rounding of every entry is the same as the per-cell count, user-defined masks included
+(GameOfLife_test.py checks all 512 configurations of every mask).
+
+Stepping a grid is then: build the 9-bit code of every cell with shifts of the padded grid and
+read its outcome from the table with one gather, with no floating-point maths in the step.
+
+'''
+
+# importing all the dependencies
+import numpy as np
+from GameOfLife_CounterRNG import DEATH
+from GameOfLife_Engine import OFFSETS, masks, pad_grid, shifted
+
+
+DEAD, SURVIVE, BORN, DOOMED = 0, 1, 2, 3
+CONWAY_BIRTH = (3,)
+CONWAY_SURVIVE = (2, 3)
+# bit of every offset of the 3x3 neighbourhood, the cell itself is bit 4
+BITS = {(i, j): 3 * (i + 1) + (j + 1) for i in range(-1, 2) for j in range(-1, 2)}
+
+# compiled tables, keyed by the mask and the rule
+compiled_rules = {}
+
+
+# the 3x3 neighbourhood of a 9-bit code
+def neighborhood(code):
+    return np.array([(code >> bit) & 1 for bit in range(9)], dtype=float).reshape(3, 3)
+
+
+# the 512-entry outcome table of a mask with the birth and survive neighbour counts
+def compile_rule(mask, birth=CONWAY_BIRTH, survive=CONWAY_SURVIVE):
+    mask = np.asarray(mask, dtype=float)
+    key = (mask.tobytes(), tuple(birth), tuple(survive))
+    table = compiled_rules.get(key)
+    if table is not None:
+        return table
+    table = np.zeros(512, dtype=np.uint8)
+    for code in range(512):
+        cells = neighborhood(code)
+        # the same summation as count_neighbors, so the rounding is the same
+        total = 0
+        for i, j in OFFSETS:
+            total += cells[i + 1, j + 1] * mask[i + 1, j + 1]
+        count = int(np.ceil(total))
+        if cells[1, 1] == 1:
+            table[code] = SURVIVE if count in survive else DOOMED
+        else:
+            table[code] = BORN if count in birth else DEAD
+    compiled_rules[key] = table
+    return table
+
+
+# the 9-bit neighbourhood code of every cell, cells outside the board are dead
+def neighborhood_codes(grid):
+    padded = pad_grid((grid == 1).astype(np.uint16))
+    codes = np.zeros(grid.shape, dtype=np.uint16)
+    for (i, j), bit in BITS.items():
+        codes |= shifted(padded, i, j) << bit
+    return codes
+
+
+# the outcome of every cell
+def outcomes(grid, table):
+    return table[neighborhood_codes(grid)]
+
+
+# one generation from a compiled table, exactly round(Pdeath * doomed cells) of the doomed cells die
+def table_step(grid, table, Pdeath=1.0, draws=None):
+    outcome = outcomes(grid, table)
+    new_grid = ((outcome == SURVIVE) | (outcome == BORN)).astype(grid.dtype)
+    rows, cols = np.nonzero(outcome == DOOMED)
+    expected_deaths = int(round(Pdeath * len(rows)))
+    if expected_deaths < len(rows):
+        # the doomed cells which are spared stay alive, picked like death_probability_step does
+        spared = ~draws.choose(rows, cols, expected_deaths, DEATH)
+        new_grid[rows[spared], cols[spared]] = 1
+    return new_grid
@@ -4,6 +4,16 @@ Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
 Place: University of Leeds
 Date: 05/05/2024
 Description: The code allots an alive cell with a percentage of selfish behaviour 
+The selfishness of every cell is kept in a plane which is set up once and then updated by the rules:
+Rule 1: A selfish cell with 4 or more neighbours gains selfishness and kills its neighbours clockwise
+(up, right, down, left), moving onto every cell it kills, until fewer than 3 are left.
+Rule 2: A selfish cell with 0 or 1 neighbours spends one unit of selfishness to survive.
+Rule 3: A dead cell on a selfish site with 3 or 4 neighbours is reborn.
+Rule 4: The reborn cell is selfish with the level of selfishness as probability.
+The other cells follow the nature rules. All the kills are decided from the grid before the step,
+each selfish cell walking as if it were the only one, and every cell targeted by a selfish cell dies. With SEQUENTIAL the selfish cells kill one after the
+other in row-major order, each walking onto the cells it kills like kill_neighbors, so a cell sees
+the kills made before it.
 
 Input: SELFISHNESS_LEVEL in range of 0 to 100
 
@@ -11,20 +21,71 @@ Input: SELFISHNESS_LEVEL in range of 0 to 100
 import pygame
 import numpy as np
 import time
-import random
 import matplotlib.pyplot as plt
-import csv
+from GameOfLife_Engine import selfish_step
+from GameOfLife_Engine import initialize_selfishness as engine_initialize_selfishness
+from GameOfLife_CounterRNG import CounterRNG
+from GameOfLife_Renderer import GridRenderer
+from GameOfLife_Viewport import Viewport
+from GameOfLife_Profiler import PhaseTimer
+from GameOfLife_Worker import SimulationWorker
+from GameOfLife_Checkpoint import CheckpointWriter
+from GameOfLife_LivePlot import LivePlot
+from GameOfLife_Recorder import PopulationRecorder, read_population
+from GameOfLife_History import HistoryWriter
 
 # Constants
 WIDTH, HEIGHT = 800, 600
 CELL_SIZE = 10
 ROWS = HEIGHT // CELL_SIZE
 COLS = WIDTH // CELL_SIZE
+# set to True to play on a WORLD_ROWS x WORLD_COLS board larger than the window, seen through
+# a pan and zoom viewport (mouse wheel or +/- to zoom, arrows or middle drag to pan, 0 to fit)
+VIEWPORT = False
+WORLD_ROWS, WORLD_COLS = 1000, 1000
+if VIEWPORT:
+    ROWS, COLS = WORLD_ROWS, WORLD_COLS
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GREEN = (0, 255, 0)
 GRAY = (169, 169, 169)
-SELFISHNESS_LEVEL = float(input("Please enter level of selfishness(0-100): "))/100  # Adjust the level of selfishness as needed
+# the alive cells of every generation are streamed to this file
+POPULATION_FILE = 'AliveCells.csv'
+# set to a file name to record every generation for replay with GameOfLife_History.py
+HISTORY_FILE = None
+# set to True to time every phase of the loop from the start, F3 turns the timings on and off
+PROFILE = False
+# set to a file name to also run cProfile while the timings are on, the stats are written there on close
+PROFILE_FILE = None
+# set to True to step in a background thread, the window then draws the latest generation
+BACKGROUND = False
+# with BACKGROUND, step as fast as possible instead of every update_interval (every generation is still recorded)
+TURBO = False
+# set to a file name to save a checkpoint every CHECKPOINT_INTERVAL generations,
+# the game carries on from it when it is started again
+CHECKPOINT_FILE = None
+CHECKPOINT_INTERVAL = 100
+# set to True to draw the population in a live chart while the game runs
+LIVE_PLOT = False
+SELFISHNESS_LEVEL = 0.0  # asked for when the game is started
+# set to True to make the kills one selfish cell at a time in row-major order
+SEQUENTIAL = False
+# the backend of the sequential kills: 'python', 'numpy' or 'jit' (compiled with Numba when it is installed)
+BACKEND = 'jit'
+# seed of the random selfishness, None draws a fresh seed for every run
+SEED = None
+rng = CounterRNG(SEED)
+
+# the parameters of the game, saved with every checkpoint
+def parameters():
+    return {'selfishness_level': SELFISHNESS_LEVEL, 'sequential': SEQUENTIAL}
+
+# restoring the parameters a checkpoint was saved with
+def apply_parameters(params):
+    global SELFISHNESS_LEVEL, SEQUENTIAL
+    SELFISHNESS_LEVEL = params['selfishness_level']
+    SEQUENTIAL = params.get('sequential', False)
+
 # Creating the grid
 def initialize_grid():
     return np.zeros((ROWS, COLS))
@@ -32,78 +93,42 @@ def initialize_grid():
 
 # Giving some percentage of selfishness to the alive cells
 def initialize_selfishness(grid, SELFISHNESS_LEVEL):
-    num_alive_cells = int(np.sum(grid))  # Count the number of alive cells
-    alive_indices = np.argwhere(grid == 1)  # Get indices of alive cells
-    num_cells_to_set_selfish = int(num_alive_cells * SELFISHNESS_LEVEL)  # Determine the number of cells to set selfishness for
-
-    # Randomly select indices to set selfishness for
-    indices_to_set_selfish = np.random.choice(len(alive_indices), num_cells_to_set_selfish, replace=False)
-
-    selfishness = np.zeros_like(grid)  # Initialize selfishness matrix
-    # Set selfishness to 1 for selected indices
-    for idx in indices_to_set_selfish:
-        row, col = alive_indices[idx]
-        selfishness[row][col] = 1
-
-    return selfishness
+    # the selfishness plane is set up once and then updated by the rules every generation
+    return engine_initialize_selfishness(grid, SELFISHNESS_LEVEL, rng.at(0))
 
 #Checking if the particular cell is selfish and getting the vitality
 def is_selfish(cell_row, cell_col, selfishness):
-    return selfishness[cell_row][cell_col] == 1
+    return selfishness[cell_row][cell_col] >= 1
+
 
 
+# the renderer is created on the first frame, once pygame is initialised
+renderer = None
 
 # Drawing the grid with different colors and texts
-def draw_grid(screen, grid, generation, alive_cells):
-    screen.fill(BLACK)
-    for row in range(ROWS):
-        for col in range(COLS):
-            if grid[row][col] == 1:
-                pygame.draw.rect(screen, GREEN, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-            else:
-                pygame.draw.rect(screen, GRAY, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
-    font = pygame.font.Font(None, 36)
-    text = font.render(f"Generation: {generation}", True, WHITE) 
-    titletext = font.render(f"CONWAY'S GAME OF LIFE", True, WHITE)
-    alive_cells_text = font.render(f"Alive Cells: {alive_cells}", True, WHITE) 
-    screen.blit(text, (10, 10))
-    screen.blit(alive_cells_text, (10, 50))
-    screen.blit(titletext, (450, 10))
-    pygame.display.update()
+def draw_grid(screen, grid, generation, alive_cells, overlay=()):
+    global renderer
+    if renderer is None:
+        if VIEWPORT:
+            renderer = Viewport(ROWS, COLS, WIDTH, HEIGHT, CELL_SIZE, alive_color=GREEN, line_color=GRAY)
+        else:
+            renderer = GridRenderer(ROWS, COLS, CELL_SIZE, alive_color=GREEN, line_color=GRAY)
+    texts = [(f"Generation: {generation}", (10, 10)),
+             (f"Alive Cells: {alive_cells}", (10, 50))]
+    renderer.draw(screen, grid, texts + list(overlay))
+
+# the board cell under a point of the window, through the viewport when there is one
+def cell_at(x, y):
+    if VIEWPORT and renderer is not None:
+        return renderer.screen_to_cell(x, y)
+    return y // CELL_SIZE, x // CELL_SIZE
 
 # Upgrading the grid for each generation
 def update_grid(grid, generation, selfishness, alive_cells):
-    new_grid = grid.copy()
-    alive_cells = 0
-    for row in range(ROWS):
-        for col in range(COLS):
-            neighbors = count_neighbors(grid, row, col)
-            if is_selfish(row, col, initialize_selfishness(grid, SELFISHNESS_LEVEL)):  # cell is selfish
-                if grid[row][col] == 1:
-                    if neighbors >= 4:  # Rule 1
-                        selfishness[row][col] += 1
-                        kill_neighbors(new_grid, row, col)
-                    elif neighbors <= 1:
-                        if selfishness[row][col] >= 1:  # Rule 2
-                            selfishness[row][col] -= 1
-                        else:
-                            grid[row][col] = 0
-                else:  # Cell is dead
-                    if neighbors == 3 or neighbors == 4:  # Rule 3
-                        new_grid[row][col] = 1
-                         # Assign selfishness randomly with a 25% chance to be 1
-                        selfishness[row][col] = 1 if random.random() < SELFISHNESS_LEVEL else 0  # Rule 4
-            
-            # Applying nature rules to non selfish cells
-            else:
-                if grid[row][col] == 1:
-                    alive_cells += 1
-                    if neighbors < 2 or neighbors > 3:
-                        new_grid[row][col] = 0
-                else:
-                    if neighbors == 3:
-                        new_grid[row][col] = 1
-                        alive_cells += 1
+    # rules 1-4 and the nature rules applied to the whole grid by the vectorized engine,
+    # the selfishness plane is updated in place
+    new_grid, selfishness[:] = selfish_step(grid, selfishness, SELFISHNESS_LEVEL, rng.at(generation),
+                                           SEQUENTIAL, BACKEND)
     generation += 1
     alive_cells = np.sum(new_grid)
     return new_grid, generation, alive_cells
@@ -146,6 +171,8 @@ def main():
 
     grid = initialize_grid()
     selfishness = initialize_selfishness(grid, SELFISHNESS_LEVEL)
+    # the plane being stepped, with BACKGROUND it is only replaced on the worker thread
+    stepped = {'selfishness': selfishness}
     running = True
     placing_cells = False
     simulation_running = False
@@ -153,12 +180,50 @@ def main():
     update_interval = 0.1  # in seconds
     generation = 0
     alive_cells = 0
-    alive_cells_array = []
+    recorder = PopulationRecorder(POPULATION_FILE)
+    history = HistoryWriter(HISTORY_FILE, ROWS, COLS) if HISTORY_FILE else None
+    checkpoints = None
+    if CHECKPOINT_FILE:
+        checkpoints = CheckpointWriter(CHECKPOINT_FILE, CHECKPOINT_INTERVAL, rng, parameters(),
+                                       lambda: {'selfishness': stepped['selfishness']}, recorder)
+        if checkpoints.exists():
+            # carrying on from the checkpoint of an interrupted game
+            state = checkpoints.resume()
+            apply_parameters(state['params'])
+            grid, generation, alive_cells = state['grid'], state['generation'], state['alive_cells']
+            selfishness = state['extra']['selfishness']
+            stepped['selfishness'] = selfishness
+    profiler = PhaseTimer(PROFILE, profile_path=PROFILE_FILE)
+    plot = None
+    if LIVE_PLOT:
+        plot = LivePlot()
+        if checkpoints is not None and checkpoints.exists():
+            plot.extend(np.column_stack([state['generations'], state['populations']]))
+    worker = None  # background stepping thread, see GameOfLife_Worker.py
+
+    # the worker steps the selfishness plane along with the grid
+    def update_with_selfishness(grid, generation, alive_cells):
+        return update_grid(grid, generation, stepped['selfishness'], alive_cells)
+
+    def set_selfishness(plane):
+        stepped['selfishness'] = plane
+
+    if BACKGROUND:
+        worker = SimulationWorker(update_with_selfishness, grid, rate=None if TURBO else 1 / update_interval,
+                                  generation=generation, recorder=recorder, history=history,
+                                  checkpoints=checkpoints, plot=plot)
 
     while running:
         current_time = time.time()
+        if worker is not None:
+            # editing a copy of the latest generation, the changes are forwarded to the worker
+            shown, generation, alive_cells = worker.latest()
+            grid = shown.copy()
+        frame_generation = generation
         # interacting with the game
         for event in pygame.event.get():
+            if VIEWPORT and renderer is not None and renderer.handle_event(event):
+                continue  # panning and zooming
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -169,30 +234,63 @@ def main():
             elif event.type == pygame.MOUSEMOTION:
                 if placing_cells:
                     x, y = event.pos
-                    row = y // CELL_SIZE
-                    col = x // CELL_SIZE
+                    row, col = cell_at(x, y)
                     update_initial_config(grid, row, col)
+                    profiler.lap('events')
                     alive_cells = np.sum(grid)  # Update alive cells count
+                    profiler.lap('recount')
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+                if event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_SPACE:
                     simulation_running = not simulation_running
+                    if generation == 0:
+                        # the cells placed before the start get their selfishness once
+                        selfishness = initialize_selfishness(grid, SELFISHNESS_LEVEL)
+                        if worker is None:
+                            set_selfishness(selfishness)
+                        else:
+                            # handed over with the edits of this frame, before the worker starts
+                            worker.hand_over(set_selfishness, selfishness)
                 elif event.key == pygame.K_c:
                     placing_cells = not placing_cells
                 elif event.key == pygame.K_r:
                     grid = initialize_grid()
+                    if worker is not None:
+                        worker.reset(grid)
                     generation = 0
                     alive_cells = 0
+        if worker is not None:
+            worker.edit(grid, shown)
+            worker.set_running(simulation_running)
+        profiler.lap('events')
         # Upgrading the grid and alive cells count
-        if simulation_running and current_time - last_update_time > update_interval:
+        if worker is None and simulation_running and current_time - last_update_time > update_interval:
             grid, generation, alive_cells = update_grid(grid, generation, selfishness, alive_cells)
-            alive_cells_array.append(alive_cells)
+            recorder.append(generation, alive_cells)
+            if plot is not None:
+                plot.append(generation, alive_cells)
+            if checkpoints is not None:
+                checkpoints.append(grid, generation, alive_cells)
+            if history is not None:
+                history.append(grid, generation)
             last_update_time = current_time
 
-        draw_grid(screen, grid, generation, alive_cells)
+        profiler.lap('sim')
+        draw_grid(screen, grid, generation, alive_cells, profiler.overlay_texts())
+        if plot is not None:
+            plot.redraw()
+        profiler.lap('render')
+        profiler.end_frame(max(generation - frame_generation, 0))
         
         if not running:
-            # Plot generations vs. alive_cells_array after the simulation loop
-            plt.plot(range(generation), alive_cells_array)
+            # Plot generations vs. alive cells after the simulation loop
+            if worker is not None:
+                worker.close()
+            recorder.flush()
+            if plot is not None:
+                plot.close()
+            plt.plot(*read_population(POPULATION_FILE))
             plt.xlabel('Generation')
             plt.ylabel('Alive Cells')
             plt.title('Game of Life: Alive Cells Over Generations')
@@ -200,10 +298,13 @@ def main():
             plt.show()
 
     pygame.quit()
-
-    with open('AliveCells.csv', 'w', newline = '') as csvfile:
-        my_writer = csv.writer(csvfile, delimiter = ' ')
-        my_writer.writerow(alive_cells_array)
+    if checkpoints is not None:
+        checkpoints.close()
+    profiler.close(POPULATION_FILE)
+    recorder.close()
+    if history is not None:
+        history.close()
 
 if __name__ == "__main__":
+    SELFISHNESS_LEVEL = float(input("Please enter level of selfishness(0-100): "))/100  # Adjust the level of selfishness as needed
     main()
\ No newline at end of file
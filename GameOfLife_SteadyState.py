@@ -0,0 +1,107 @@
+'''
+
+Title: Cycle and Steady-state Detection for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: Many runs become static or periodic within a few generations and are then stepped for
+nothing. This file detects that so a run can be stopped, or its population series filled in without
+stepping.
+
+Deterministic rules (OG, Sacrifice): the grid is packed into bits every generation, and the packed
+grids of the last MAX_PERIOD generations are kept, looked up by their bytes so two grids are only
+taken for the same when every cell matches. A grid seen before means the run has entered a cycle whose
+period is the distance between the two generations (1 for a still board). From then on the population
+series simply repeats, so it can be extended analytically.
+
+Stochastic rules (DeathProbability, Selfish): the grid rarely repeats, so the population is tested
+instead. The means of the last two windows of WINDOW generations are compared: when they differ by
+less than REL_TOLERANCE of the level and by less than Z_LIMIT standard errors the population is
+flagged as stationary. A stationary population only fluctuates around its level and is never filled in,
+the run is stopped there. With absorbing=True an unchanged grid also counts as final; this is exact for
+DeathProbability, where a grid without deaths or births can never change again.
+
+'''
+
+# importing all the dependencies
+from collections import deque
+import numpy as np
+
+
+MAX_PERIOD = 256  # longest cycle looked for
+WINDOW = 50  # generations in each window of the stationarity test
+REL_TOLERANCE = 0.01
+Z_LIMIT = 3.0
+
+
+class SteadyStateDetector:
+
+    def __init__(self, deterministic=True, absorbing=False, max_period=MAX_PERIOD, window=WINDOW,
+                 rel_tolerance=REL_TOLERANCE, z_limit=Z_LIMIT):
+        self.deterministic = deterministic
+        self.absorbing = absorbing
+        self.max_period = max_period
+        self.window = window
+        self.rel_tolerance = rel_tolerance
+        self.z_limit = z_limit
+        self.seen = {}  # packed grid -> last generation it was seen
+        self.order = deque()  # (generation, packed grid) in the order they were seen
+        self.populations = deque(maxlen=2 * window)
+        self.kind = None  # 'cycle', 'absorbing' or 'stationary' once detected
+        self.period = None
+        self.generation = None
+
+    # the packed bits of the grid, an eighth of a byte per cell
+    def grid_key(self, grid):
+        return np.packbits(grid == 1).tobytes()
+
+    # feeding one generation, returns True once a steady state is found
+    def update(self, grid, generation, alive_cells):
+        if self.kind is not None:
+            return True
+        if self.deterministic or self.absorbing:
+            key = self.grid_key(grid)
+            seen = self.seen.get(key)
+            if seen is not None and (self.deterministic or generation - seen == 1):
+                self.kind = 'cycle' if self.deterministic else 'absorbing'
+                self.period = generation - seen
+                self.generation = generation
+                return True
+            self.seen[key] = generation
+            self.order.append((generation, key))
+            # forgetting the grids older than the longest period looked for
+            while self.order and generation - self.order[0][0] >= self.max_period:
+                old_generation, old_key = self.order.popleft()
+                if self.seen.get(old_key) == old_generation:
+                    del self.seen[old_key]
+        if not self.deterministic:
+            self.populations.append(alive_cells)
+            if len(self.populations) == 2 * self.window and self.is_stationary():
+                self.kind = 'stationary'
+                self.generation = generation
+                return True
+        return False
+
+    # comparing the means of the last two windows of the population
+    def is_stationary(self):
+        values = np.asarray(self.populations, dtype=float)
+        first, second = values[:self.window], values[self.window:]
+        difference = abs(first.mean() - second.mean())
+        standard_error = np.sqrt((first.var() + second.var()) / self.window)
+        level = max(abs(second.mean()), 1.0)
+        return difference <= self.rel_tolerance * level and difference <= self.z_limit * standard_error + 1e-12
+
+    # True when the rest of the series is known: a cycle or an absorbing grid, not a stationary population
+    def repeats(self):
+        return self.kind in ('cycle', 'absorbing')
+
+    # extending a population series to length generations by repeating the detected cycle,
+    # a stationary series is left as it is
+    def extrapolate(self, series, length):
+        series = np.asarray(series, dtype=float)
+        if not self.repeats() or len(series) >= length:
+            return series
+        cycle = series[len(series) - self.period:]
+        missing = length - len(series)
+        return np.concatenate([series, np.resize(cycle, missing)])
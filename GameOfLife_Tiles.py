@@ -0,0 +1,171 @@
+'''
+
+Title: Chunked Unbounded Universe for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: The scripts play on a fixed 80x60 grid whose edges count as dead cells, so patterns
+that keep growing (the DeathProbability Healing runs, for example) are cut off at the wall. This
+file plays on a board without edges made of TILE x TILE tiles kept in a dictionary keyed by the
+tile coordinate (tile_row, tile_col). Only tiles with alive cells are stored:
+- a step evaluates the stored tiles and the neighbours of the tiles with alive cells on their
+  border, which is where activity can spread to, so new tiles are allocated when they are reached
+- tiles left without alive cells after a step are freed
+so memory and step time follow the occupied area and not a bounding box.
+
+The tiles to evaluate are stacked into one (tiles, TILE + 2, TILE + 2) array, each with a one-cell
+halo copied from its neighbours, and stepped at once over the last two axes like the engine does.
+For DeathProbability exactly round(Pdeath * candidates) of the candidates of the whole universe die,
+as in death_probability_step. The deaths are drawn from the counter-based generator at the unbounded
+coordinates of the cells, so a universe started from a grid at (0, 0) makes the same deaths as the
+grid stepped whole with the same seed.
+
+The cells are addressed with unbounded (row, col) coordinates, negative ones included. window()
+returns any rectangle of the universe as a normal grid for the GridRenderer, and population is kept
+up to date by step().
+
+'''
+
+# importing all the dependencies
+import numpy as np
+from GameOfLife_CounterRNG import DEATH, CounterRNG
+from GameOfLife_Engine import OFFSETS, masks, shifted
+
+
+TILE = 64  # cells along each side of a tile
+
+# the tiles around a tile, and the slices of a neighbour and of the halo block they fill
+HALO = [((-1, -1), (slice(-1, None), slice(-1, None)), (slice(0, 1), slice(0, 1))),
+        ((-1, 0), (slice(-1, None), slice(None)), (slice(0, 1), slice(1, -1))),
+        ((-1, 1), (slice(-1, None), slice(0, 1)), (slice(0, 1), slice(-1, None))),
+        ((0, -1), (slice(None), slice(-1, None)), (slice(1, -1), slice(0, 1))),
+        ((0, 1), (slice(None), slice(0, 1)), (slice(1, -1), slice(-1, None))),
+        ((1, -1), (slice(0, 1), slice(-1, None)), (slice(-1, None), slice(0, 1))),
+        ((1, 0), (slice(0, 1), slice(None)), (slice(-1, None), slice(1, -1))),
+        ((1, 1), (slice(0, 1), slice(0, 1)), (slice(-1, None), slice(-1, None)))]
+
+
+class TiledUniverse:
+
+    # rule is 'og' or 'death_probability' (with the mask array, Pdeath and a CounterRNG)
+    def __init__(self, rule='og', mask=None, Pdeath=1.0, rng=None, tile=TILE):
+        self.rule = rule
+        self.mask = masks['Standard'] if mask is None else mask
+        self.Pdeath = Pdeath
+        self.rng = rng if rng is not None else CounterRNG()
+        self.tile = tile
+        self.tiles = {}  # (tile_row, tile_col) -> tile x tile array of cells
+        self.population = 0
+        self.generation = 0
+
+    # universe holding grid with its top-left cell at (top, left)
+    @classmethod
+    def from_grid(cls, grid, top=0, left=0, generation=0, **kwargs):
+        universe = cls(**kwargs)
+        rows, cols = np.nonzero(grid == 1)
+        universe.set_cells(rows + top, cols + left, 1)
+        universe.generation = generation
+        return universe
+
+    # setting the cells at the given coordinates to value
+    def set_cells(self, rows, cols, value):
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        tile_rows, tile_cols = rows // self.tile, cols // self.tile
+        for key in set(zip(tile_rows.tolist(), tile_cols.tolist())):
+            inside = (tile_rows == key[0]) & (tile_cols == key[1])
+            cells = self.tiles.get(key)
+            if cells is None:
+                if not value:
+                    continue
+                cells = self.tiles[key] = np.zeros((self.tile, self.tile))
+            cells[rows[inside] % self.tile, cols[inside] % self.tile] = value
+            if not cells.any():
+                del self.tiles[key]
+        self.population = sum(int(np.count_nonzero(cells)) for cells in self.tiles.values())
+
+    # the stored tiles and every neighbour that alive cells on a border can reach
+    def active_tiles(self):
+        active = set(self.tiles)
+        for (tile_row, tile_col), cells in self.tiles.items():
+            top, bottom = cells[0].any(), cells[-1].any()
+            left, right = cells[:, 0].any(), cells[:, -1].any()
+            for (dy, dx), edge in (((-1, 0), top), ((1, 0), bottom), ((0, -1), left), ((0, 1), right),
+                                   ((-1, -1), top or left), ((-1, 1), top or right),
+                                   ((1, -1), bottom or left), ((1, 1), bottom or right)):
+                if edge:
+                    active.add((tile_row + dy, tile_col + dx))
+        return sorted(active)
+
+    # the tile with a one-cell ring copied from its neighbours
+    def halo_block(self, key, block):
+        cells = self.tiles.get(key)
+        if cells is not None:
+            block[1:-1, 1:-1] = cells
+        for (dy, dx), source, target in HALO:
+            neighbor = self.tiles.get((key[0] + dy, key[1] + dx))
+            if neighbor is not None:
+                block[target] = neighbor[source]
+
+    def step(self):
+        keys = self.active_tiles()
+        if not keys:
+            self.generation += 1
+            return
+        blocks = np.zeros((len(keys), self.tile + 2, self.tile + 2))
+        for index, key in enumerate(keys):
+            self.halo_block(key, blocks[index])
+        cells = blocks[:, 1:-1, 1:-1]
+        alive = cells == 1
+
+        if self.rule == 'og':
+            counts = np.zeros(cells.shape)
+            for i, j in OFFSETS:
+                counts += shifted(blocks, i, j)
+            new_alive = (alive & (counts >= 2) & (counts <= 3)) | (~alive & (counts == 3))
+        else:
+            # weights added in the same order as weighted_neighbors_grid
+            total = np.zeros(cells.shape)
+            for i, j in OFFSETS:
+                total += shifted(blocks, i, j) * self.mask[i + 1, j + 1]
+            counts = np.ceil(total)
+            doomed = alive & ((counts < 2) | (counts > 3))
+            born = ~alive & (counts == 3)
+            # exactly round(Pdeath * candidates) of the candidates of the whole universe die
+            index, rows, cols = np.nonzero(doomed)
+            origins = np.array(keys, dtype=np.int64)[index] * self.tile
+            expected_deaths = int(round(self.Pdeath * len(rows)))
+            die = self.rng.at(self.generation).choose(origins[:, 0] + rows, origins[:, 1] + cols,
+                                                      expected_deaths, DEATH)
+            new_alive = alive | born
+            new_alive[index[die], rows[die], cols[die]] = False
+
+        # keeping the tiles with alive cells only
+        populations = np.count_nonzero(new_alive.reshape(len(keys), -1), axis=1)
+        self.tiles = {key: new_alive[index].astype(float)
+                      for index, key in enumerate(keys) if populations[index]}
+        self.population = int(populations.sum())
+        self.generation += 1
+
+    # the cells of the rectangle starting at (top, left) as a rows x cols grid
+    def window(self, top, left, rows, cols):
+        grid = np.zeros((rows, cols))
+        for tile_row in range(top // self.tile, (top + rows - 1) // self.tile + 1):
+            for tile_col in range(left // self.tile, (left + cols - 1) // self.tile + 1):
+                cells = self.tiles.get((tile_row, tile_col))
+                if cells is None:
+                    continue
+                row0, col0 = tile_row * self.tile, tile_col * self.tile
+                r0, r1 = max(top, row0), min(top + rows, row0 + self.tile)
+                c0, c1 = max(left, col0), min(left + cols, col0 + self.tile)
+                grid[r0 - top:r1 - top, c0 - left:c1 - left] = cells[r0 - row0:r1 - row0, c0 - col0:c1 - col0]
+        return grid
+
+    # (top, left, bottom, right) of the stored tiles in cell coordinates, None when empty
+    def bounding_box(self):
+        if not self.tiles:
+            return None
+        tile_rows = [key[0] for key in self.tiles]
+        tile_cols = [key[1] for key in self.tiles]
+        return (min(tile_rows) * self.tile, min(tile_cols) * self.tile,
+                (max(tile_rows) + 1) * self.tile, (max(tile_cols) + 1) * self.tile)
@@ -0,0 +1,237 @@
+'''
+
+Title: Pan and Zoom Viewport for Boards Larger than the Window
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: The GridRenderer draws the whole board at CELL_SIZE pixels per cell, so the board can
+be no larger than the window. The Viewport draws only the part of the board in the window:
+zoom >= 1  -> every cell is zoom x zoom pixels, with the gray cell outlines from OUTLINE_ZOOM on
+zoom < 1   -> every pixel covers a block of 1 / zoom x 1 / zoom cells and is shaded by the fraction
+              of alive cells in it (the density view), so a whole large board fits in the window
+
+The visible cells are turned into one small colour array, written with pygame.surfarray and scaled
+up to the window like the GridRenderer does. The array of the last frame is kept, and when the view
+has not moved only the TILE x TILE pixel squares that changed (and the HUD texts) are pushed to the
+display with pygame.display.update(rects).
+
+Controls, handled by handle_event():
+mouse wheel or +/-   -> zoom in and out around the mouse
+arrow keys           -> pan by a quarter of the window
+middle button drag   -> pan
+0                    -> fit the whole board in the window
+
+screen_to_cell() maps a window position to its board cell, for painting with the mouse.
+
+'''
+
+# importing all the dependencies
+import pygame
+import numpy as np
+
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+GRAY = (169, 169, 169)
+OUTSIDE = (40, 40, 40)  # the area beyond the edges of the board
+ZOOM_LEVELS = [1 / 32, 1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 3, 5, 10, 20]
+OUTLINE_ZOOM = 5  # the cell outlines are drawn from this zoom on
+TILE = 32  # pixels along each side of a dirty rectangle
+MAX_RECTS = 200  # above this many changed tiles the whole window is updated
+
+
+class Viewport:
+
+    def __init__(self, rows, cols, width, height, zoom=10, title="CONWAY'S GAME OF LIFE", title_pos=(450, 10),
+                 alive_color=GREEN, line_color=GRAY):
+        self.rows, self.cols = rows, cols
+        self.width, self.height = width, height
+        self.zoom = zoom if zoom in ZOOM_LEVELS else 1
+        self.top, self.left = 0, 0  # board cell at the top-left corner of the window
+        # colours mapped to the pixel format once, the density view uses 256 shades of the alive colour
+        surface = pygame.Surface((1, 1))
+        self.alive_color = surface.map_rgb(alive_color)
+        self.outside_color = surface.map_rgb(OUTSIDE)
+        self.shades = np.array([surface.map_rgb([round(c * level / 255) for c in alive_color])
+                                for level in range(256)], dtype=np.uint32)
+        self.line_color = line_color
+        self.font = pygame.font.Font(None, 36)
+        self.title = self.font.render(title, True, WHITE)
+        self.title_pos = title_pos
+        self.texts = {}  # position -> (text, rendered surface)
+        self.outlines = {}  # zoom -> surface with the cell outlines of the window
+        self.previous = None  # colour array and view of the last frame
+        self.dragging = False
+
+    # cells of the board per pixel along each side when zoomed out, 1 otherwise
+    @property
+    def block(self):
+        return max(1, int(round(1 / self.zoom)))
+
+    # pixels per cell along each side when zoomed in, 1 otherwise
+    @property
+    def scale(self):
+        return max(1, int(self.zoom))
+
+    # board rows and columns covered by the window
+    def view_shape(self):
+        if self.zoom >= 1:
+            return -(-self.height // self.scale), -(-self.width // self.scale)
+        return self.height * self.block, self.width * self.block
+
+    def screen_to_cell(self, x, y):
+        if self.zoom >= 1:
+            return self.top + y // self.scale, self.left + x // self.scale
+        return self.top + y * self.block, self.left + x * self.block
+
+    def clamp(self):
+        view_rows, view_cols = self.view_shape()
+        self.top = min(max(self.top, -view_rows + 1), self.rows - 1)
+        self.left = min(max(self.left, -view_cols + 1), self.cols - 1)
+
+    # zooming to the level index, keeping the cell under (x, y) in place
+    def zoom_to(self, level, x, y):
+        level = min(max(level, 0), len(ZOOM_LEVELS) - 1)
+        row, col = self.screen_to_cell(x, y)
+        self.zoom = ZOOM_LEVELS[level]
+        if self.zoom >= 1:
+            self.top, self.left = row - y // self.scale, col - x // self.scale
+        else:
+            self.top, self.left = row - y * self.block, col - x * self.block
+        self.clamp()
+
+    # the largest zoom showing the whole board
+    def fit(self):
+        for zoom in reversed(ZOOM_LEVELS):
+            self.zoom = zoom
+            view_rows, view_cols = self.view_shape()
+            if view_rows >= self.rows and view_cols >= self.cols:
+                break
+        self.top, self.left = 0, 0
+
+    # handling the pan and zoom events, returns True when the event was used
+    def handle_event(self, event):
+        level = ZOOM_LEVELS.index(self.zoom)
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom_to(level + event.y, *pygame.mouse.get_pos())
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_MINUS):
+            step = -1 if event.key == pygame.K_MINUS else 1
+            self.zoom_to(level + step, self.width // 2, self.height // 2)
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT):
+            view_rows, view_cols = self.view_shape()
+            self.top += {pygame.K_UP: -1, pygame.K_DOWN: 1}.get(event.key, 0) * max(view_rows // 4, 1)
+            self.left += {pygame.K_LEFT: -1, pygame.K_RIGHT: 1}.get(event.key, 0) * max(view_cols // 4, 1)
+            self.clamp()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_0:
+            self.fit()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 2:
+            self.dragging = True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 2:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            dx, dy = event.rel
+            if self.zoom >= 1:
+                self.top -= dy // self.scale
+                self.left -= dx // self.scale
+            else:
+                self.top -= dy * self.block
+                self.left -= dx * self.block
+            self.clamp()
+        else:
+            return False
+        return True
+
+    # one colour per cell (zoomed in) or per pixel (zoomed out), indexed (x, y) for surfarray; only the
+    # blocks of the window over the board are computed, the rest is the outside colour
+    def colours(self, grid):
+        block = self.block
+        if self.zoom >= 1:
+            shape = (-(-self.height // self.scale), -(-self.width // self.scale))
+        else:
+            shape = (self.height, self.width)
+        colours = np.full(shape, self.outside_color, dtype=np.uint32)
+        # the range of blocks which overlap the board
+        i0, j0 = max(0, -((self.top + block - 1) // block)), max(0, -((self.left + block - 1) // block))
+        i1 = max(i0, min(shape[0], -(-(self.rows - self.top) // block)))
+        j1 = max(j0, min(shape[1], -(-(self.cols - self.left) // block)))
+        if i0 < i1 and j0 < j1:
+            top, left = self.top + i0 * block, self.left + j0 * block
+            r0, c0 = max(top, 0), max(left, 0)
+            r1, c1 = min(self.top + i1 * block, self.rows), min(self.left + j1 * block, self.cols)
+            cells = np.zeros(((i1 - i0) * block, (j1 - j0) * block), dtype=bool)
+            cells[r0 - top:r1 - top, c0 - left:c1 - left] = grid[r0:r1, c0:c1] == 1
+            if block == 1:
+                colours[i0:i1, j0:j1] = np.where(cells, self.alive_color, 0)
+            else:
+                # shaded by the fraction of alive cells in every block
+                counts = cells.view(np.uint8).reshape(i1 - i0, block, -1).sum(axis=1, dtype=np.uint16)
+                counts = counts.reshape(i1 - i0, j1 - j0, block).sum(axis=2, dtype=np.uint32)
+                colours[i0:i1, j0:j1] = self.shades[counts * 255 // (block * block)]
+        return colours.T
+
+    # surface of the cell outlines for the current zoom, drawn once per zoom
+    def outline_surface(self):
+        surface = self.outlines.get(self.zoom)
+        if surface is None:
+            surface = pygame.Surface((self.width, self.height))
+            surface.fill(BLACK)
+            for y in range(0, self.height, self.scale):
+                for x in range(0, self.width, self.scale):
+                    pygame.draw.rect(surface, self.line_color, (x, y, self.scale, self.scale), 1)
+            self.outlines[self.zoom] = surface
+        return surface
+
+    # rendering a HUD text, reusing the last surface at this position if the text is the same
+    def text_surface(self, text, pos):
+        cached = self.texts.get(pos)
+        if cached is None or cached[0] != text:
+            cached = (text, self.font.render(text, True, WHITE))
+            self.texts[pos] = cached
+        return cached[1]
+
+    # the TILE x TILE squares of the window where the colours changed since the last frame
+    def dirty_rects(self, colours, view):
+        if self.previous is None or self.previous[1] != view or self.previous[0].shape != colours.shape:
+            return None
+        changed = colours != self.previous[0]
+        tile = max(TILE // self.scale, 1) if self.zoom >= 1 else TILE
+        width, height = changed.shape
+        padded = np.zeros((-(-width // tile) * tile, -(-height // tile) * tile), dtype=bool)
+        padded[:width, :height] = changed
+        tiles = padded.reshape(padded.shape[0] // tile, tile, padded.shape[1] // tile, tile).any(axis=(1, 3))
+        xs, ys = np.nonzero(tiles)
+        if len(xs) > MAX_RECTS:
+            return None
+        size = tile * self.scale if self.zoom >= 1 else tile
+        return [pygame.Rect(int(x) * size, int(y) * size, size, size) for x, y in zip(xs, ys)]
+
+    # drawing the visible cells and the HUD texts, given as (text, position) pairs
+    def draw(self, screen, grid, texts):
+        colours = self.colours(grid)
+        view = (self.zoom, self.top, self.left)
+        rects = self.dirty_rects(colours, view)
+        self.previous = (colours, view)
+
+        cells = pygame.Surface(colours.shape)
+        pygame.surfarray.blit_array(cells, colours)
+        if self.zoom >= 1:
+            cells = pygame.transform.scale(cells, (colours.shape[0] * self.scale, colours.shape[1] * self.scale))
+        if self.zoom >= OUTLINE_ZOOM:
+            # the outlines show through the dead cells, like on the GridRenderer board
+            screen.blit(self.outline_surface(), (0, 0))
+            cells.set_colorkey(BLACK)
+        else:
+            screen.fill(BLACK)
+        screen.blit(cells, (0, 0))
+        for text, pos in texts:
+            surface = self.text_surface(text, pos)
+            screen.blit(surface, pos)
+            if rects is not None:
+                rects.append(surface.get_rect(topleft=pos).inflate(80, 0))
+        screen.blit(self.title, self.title_pos)
+        if rects is None:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
@@ -0,0 +1,124 @@
+'''
+
+Title: Background Stepping Worker for the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: This file moves the stepping out of the pygame loop. A worker thread owns the grid and
+advances it with the update_grid function of a script, either at a target rate or, in turbo mode,
+as fast as it can. The pygame loop only draws the latest completed generation and forwards the
+mouse edits, reset and start/stop through a command queue, so a slow update_grid no longer
+freezes the window and the speed of the simulation no longer depends on the frame rate.
+
+The grids work as a double buffer: the worker computes the next generation in a new array while
+the window draws the last published one, and publishing is a single reference swap. A published
+grid is never written again; edits are applied to a copy.
+
+The worker records every generation with the recorder, history, checkpoint writers and live plot
+it is given, so the population series is complete even when the window skips generations in turbo
+mode. NumPy releases the GIL while it steps, which is what lets a thread (rather than a process)
+keep the window responsive. Other state the update function reads, like the selfishness plane of the
+Selfish variant, is handed over through the command queue with hand_over, so it is only ever
+replaced on the worker thread between two generations.
+
+'''
+
+# importing all the dependencies
+import queue
+import threading
+import time
+import numpy as np
+
+
+class SimulationWorker:
+
+    # update(grid, generation, alive_cells) -> (grid, generation, alive_cells), rate is in
+    # generations/sec and None steps as fast as possible
+    def __init__(self, update, grid, generation=0, rate=None, recorder=None, history=None, checkpoints=None,
+                 plot=None):
+        self.update = update
+        self.interval = 1 / rate if rate else 0.0
+        self.recorder = recorder
+        self.history = history
+        self.checkpoints = checkpoints
+        self.plot = plot
+        self.commands = queue.Queue()
+        self.running = False  # read and written by the worker thread only
+        self.requested_running = False
+        self.next_time = 0.0
+        self.state = (np.array(grid, dtype=float), generation, np.sum(grid))
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    # the latest completed generation as (grid, generation, alive_cells), the grid must not be written
+    def latest(self):
+        return self.state
+
+    # forwarding the cells where edited differs from the shown grid
+    def edit(self, edited, shown):
+        rows, cols = np.nonzero(edited != shown)
+        if len(rows):
+            self.commands.put(('edit', rows, cols, edited[rows, cols]))
+
+    # replacing the grid and starting again from generation 0
+    def reset(self, grid):
+        self.commands.put(('reset', np.array(grid, dtype=float)))
+
+    # replacing other state the update function reads, setter(value) is called on the worker thread
+    def hand_over(self, setter, value):
+        self.commands.put(('hand_over', setter, value))
+
+    def set_running(self, running):
+        if running != self.requested_running:
+            self.requested_running = running
+            self.commands.put(('run', running))
+
+    def close(self):
+        if self.thread.is_alive():
+            self.commands.put(('stop',))
+            self.thread.join()
+
+    def run(self):
+        while True:
+            try:
+                if not self.running:
+                    command = self.commands.get()
+                else:
+                    wait = self.next_time - time.perf_counter()
+                    command = self.commands.get(timeout=wait) if wait > 0 else self.commands.get_nowait()
+            except queue.Empty:
+                self.step()
+                continue
+            if command[0] == 'stop':
+                break
+            self.handle(command)
+
+    def handle(self, command):
+        grid, generation, alive_cells = self.state
+        if command[0] == 'edit':
+            rows, cols, values = command[1:]
+            grid = grid.copy()
+            grid[rows, cols] = values
+            self.state = (grid, generation, np.sum(grid))
+        elif command[0] == 'reset':
+            self.state = (command[1], 0, np.sum(command[1]))
+        elif command[0] == 'hand_over':
+            command[1](command[2])
+        elif command[0] == 'run':
+            self.running = command[1]
+            self.next_time = time.perf_counter()
+
+    # advancing one generation, recording it and publishing it
+    def step(self):
+        grid, generation, alive_cells = self.update(*self.state)
+        if self.recorder is not None:
+            self.recorder.append(generation, alive_cells)
+        if self.history is not None:
+            self.history.append(grid, generation)
+        if self.checkpoints is not None:
+            self.checkpoints.append(grid, generation, alive_cells)
+        if self.plot is not None:
+            self.plot.append(generation, alive_cells)
+        self.state = (grid, generation, alive_cells)
+        self.next_time = max(self.next_time + self.interval, time.perf_counter())
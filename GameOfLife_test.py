@@ -0,0 +1,443 @@
+'''
+
+Title: Tests of the Engine and the Backends of the Game of Life Variants
+Authors: Krishna Pavani Munta, Abulfat Asadov, Ruth Onoba
+Place: University of Leeds
+Date: 18/10/2026
+
+Description: Checks that the vectorized engine and its backends make the same moves as the cell by
+cell code of the variants. Run with: python -m pytest -q
+
+'''
+
+# importing all the dependencies
+import numpy as np
+import pytest
+import GameOfLife_DeathProbability
+import GameOfLife_Kernels
+import GameOfLife_OG
+import GameOfLife_SacrificeRules
+import GameOfLife_SelfishRules
+from GameOfLife_ActiveSet import ActiveSetStepper, verify_active_set
+from GameOfLife_Batch import expand_sweep, run_single
+from GameOfLife_Benchmark import script_sacrifice_step
+from GameOfLife_Bitboard import pack_grid, population, step_packed, unpack_grid
+from GameOfLife_CounterRNG import CounterRNG, GRID, KNOWN_ANSWERS, philox
+from GameOfLife_Engine import (count_neighbors_grid, death_probability_step, kill_targets, life_step, masks,
+                               sacrifice_step, scan_kills, selfish_step, sequential_sacrifice)
+from GameOfLife_Ensemble import Ensemble, replica_seeds
+from GameOfLife_History import HistoryReader, HistoryWriter
+from GameOfLife_LivePlot import MinMaxSeries
+from GameOfLife_Parallel import fill_random
+from GameOfLife_Recorder import PopulationRecorder, read_population
+from GameOfLife_RuleTable import BORN, DEAD, DOOMED, SURVIVE, compile_rule, outcomes
+from GameOfLife_SteadyState import SteadyStateDetector
+from GameOfLife_Tiles import TiledUniverse
+
+ROWS, COLS = GameOfLife_SelfishRules.ROWS, GameOfLife_SelfishRules.COLS
+SEEDS = range(5)
+
+
+# a random board of the size of the variants with about density of the cells alive
+def random_grid(seed, density=0.45, generation=0):
+    return (CounterRNG(seed).at(generation).field((ROWS, COLS), GRID) < density).astype(float)
+
+
+# the selfish kills made by kill_neighbors of the Selfish variant, one killer at a time in row-major order
+def kill_neighbors_kills(alive, killers):
+    grid = alive.astype(float)
+    for row, col in zip(*np.nonzero(killers)):
+        GameOfLife_SelfishRules.kill_neighbors(grid, row, col)
+    return grid == 1
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('backend', GameOfLife_Kernels.BACKENDS)
+def test_scan_kills_matches_kill_neighbors(seed, backend):
+    alive = random_grid(seed, 0.6) == 1
+    killers = alive & (random_grid(seed, 0.5, 1) == 1) & (count_neighbors_grid(alive) >= 4)
+    assert np.array_equal(scan_kills(alive, killers, backend), kill_neighbors_kills(alive, killers))
+
+
+# every killer of kill_targets walks like kill_neighbors on its own copy of the grid before the step
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('density', [0.3, 0.6])
+def test_kill_targets_matches_kill_neighbors(seed, density):
+    grid = random_grid(seed, density)
+    counts = count_neighbors_grid(grid)
+    killers = (grid == 1) & (random_grid(seed, 0.5, 1) == 1) & (counts >= 4)
+    targets = np.zeros(grid.shape, dtype=bool)
+    for row, col in zip(*np.nonzero(killers)):
+        alone = grid.copy()
+        GameOfLife_SelfishRules.kill_neighbors(alone, row, col)
+        targets |= (grid == 1) & (alone == 0)
+    assert np.array_equal(kill_targets(grid, killers, counts), targets)
+
+
+# a stack of grids is killed like each grid on its own, so a selfish ensemble can be stepped
+def test_kill_targets_on_a_stack():
+    grids = np.stack([random_grid(seed, 0.6) for seed in SEEDS])
+    counts = count_neighbors_grid(grids)
+    killers = (grids == 1) & (counts >= 4)
+    expected = np.stack([kill_targets(grid, killer, count) for grid, killer, count in zip(grids, killers, counts)])
+    assert np.array_equal(kill_targets(grids, killers, counts), expected)
+    ensemble = Ensemble('selfish', 4, 30, 40, density=0.45, level=0.5)
+    for generation in range(5):
+        ensemble.step()
+    assert ensemble.generation == 5
+
+
+# a killer with four neighbours in a plus kills up first, then walks back down onto itself
+def test_single_killer_walks_up_first():
+    alive = np.zeros((ROWS, COLS), dtype=bool)
+    alive[4:7, 5] = alive[5, 4:7] = True
+    killers = np.zeros((ROWS, COLS), dtype=bool)
+    killers[5, 5] = True
+    kills = alive & ~scan_kills(alive, killers)
+    assert np.array_equal(kills, alive & ~kill_neighbors_kills(alive, killers))
+    assert [tuple(cell) for cell in np.argwhere(kills)] == [(4, 5), (5, 5)]
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('n', [1, 2, 3, 4])
+def test_sacrifice_backends_agree(seed, n):
+    grid = random_grid(seed)
+    results = [sequential_sacrifice(grid, n, CounterRNG(seed).at(1), backend)
+               for backend in GameOfLife_Kernels.BACKENDS]
+    for new_grid, counts in results[1:]:
+        assert np.array_equal(new_grid, results[0][0])
+        assert np.array_equal(counts, results[0][1])
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_kill_sweep_backends_agree(seed):
+    alive = random_grid(seed, 0.6) == 1
+    killers = alive & (count_neighbors_grid(alive) >= 4)
+    results = [scan_kills(alive, killers, backend) for backend in GameOfLife_Kernels.BACKENDS]
+    for result in results[1:]:
+        assert np.array_equal(result, results[0])
+
+
+# the cell by cell update_grid of the original OG and Sacrifice scripts, n=None plays without the pre-game
+def baseline_sacrifice(grid, n, count_neighbors):
+    new_grid = grid.copy()
+    for row, col in zip(*np.nonzero(grid == 1)):
+        if count_neighbors(grid, row, col) == n:
+            new_grid[row][col] = 0
+    for row in range(ROWS):
+        for col in range(COLS):
+            neighbors = count_neighbors(grid, row, col)
+            if grid[row][col] == 1:
+                if neighbors < 2 or neighbors > 3:
+                    new_grid[row][col] = 0
+            elif neighbors == 3:
+                new_grid[row][col] = 1
+    return new_grid
+
+
+# the cell by cell update_grid of the original DeathProbability script, for Pdeath 0 or 1 where
+# the deaths are not random
+def baseline_death_probability(grid, mask, Pdeath, count_neighbors):
+    new_grid = grid.copy()
+    for row, col in np.ndindex(grid.shape):
+        neighbors = count_neighbors(grid, row, col, mask)
+        if Pdeath == 1 and grid[row, col] == 1 and (neighbors < 2 or neighbors > 3):
+            new_grid[row, col] = 0
+        elif grid[row, col] == 0 and neighbors == 3:
+            new_grid[row, col] = 1
+    return new_grid
+
+
+@pytest.mark.parametrize('seed', SEEDS[:2])
+def test_og_matches_baseline(seed):
+    grid = random_grid(seed)
+    for generation in range(3):
+        expected = baseline_sacrifice(grid, None, GameOfLife_OG.count_neighbors)
+        grid, _, alive_cells = GameOfLife_OG.update_grid(grid, generation, 0)
+        assert np.array_equal(grid, expected)
+        assert alive_cells == np.sum(expected)
+
+
+@pytest.mark.parametrize('n', [None, 1, 2, 3, 4])
+def test_sacrifice_matches_baseline(monkeypatch, n):
+    monkeypatch.setattr(GameOfLife_SacrificeRules, 'n', n)
+    monkeypatch.setattr(GameOfLife_SacrificeRules, 'SEQUENTIAL', False)
+    grid = random_grid(n or 0)
+    for generation in range(3):
+        expected = baseline_sacrifice(grid, n, GameOfLife_SacrificeRules.count_neighbors)
+        grid, _, alive_cells = GameOfLife_SacrificeRules.update_grid(grid, generation, 0)
+        assert np.array_equal(grid, expected)
+        assert alive_cells == np.sum(expected)
+
+
+@pytest.mark.parametrize('mask_name', sorted(masks))
+@pytest.mark.parametrize('Pdeath', [0.0, 1.0])
+def test_death_probability_matches_baseline(monkeypatch, mask_name, Pdeath):
+    monkeypatch.setattr(GameOfLife_DeathProbability, 'current_mask', masks[mask_name])
+    monkeypatch.setattr(GameOfLife_DeathProbability, 'Pdeath', Pdeath)
+    monkeypatch.setattr(GameOfLife_DeathProbability, 'UNBOUNDED', False)
+    grid = random_grid(1)
+    for generation in range(2):
+        expected = baseline_death_probability(grid, masks[mask_name], Pdeath,
+                                              GameOfLife_DeathProbability.count_neighbors)
+        grid, _, alive_cells = GameOfLife_DeathProbability.update_grid(grid, generation, 0)
+        assert np.array_equal(grid, expected)
+        assert alive_cells == np.sum(expected)
+
+
+@pytest.mark.parametrize('counter, key, expected', KNOWN_ANSWERS)
+def test_philox_known_answers(counter, key, expected):
+    result = philox([np.array([word], dtype=np.uint64) for word in counter], [np.uint64(word) for word in key])
+    assert tuple(int(word[0]) for word in result) == expected
+
+
+# a run interrupted after its checkpoint and started again gives the series of the uninterrupted run,
+# in the returned array and in the recorded file the checkpoint reads its series back from
+@pytest.mark.parametrize('spec', [{'rule': 'og'},
+                                  {'rule': 'sacrifice', 'sequential': True},
+                                  {'rule': 'death_probability', 'masks': ['Hex1'], 'pdeath': [0.3]},
+                                  {'rule': 'selfish', 'selfishness': [0.5], 'sequential': True}])
+def test_checkpoint_resume(tmp_path, spec):
+    run = expand_sweep({**spec, 'rows': 40, 'cols': 50, 'generations': 60, 'densities': [0.4]})[0]
+    expected = run_single(run)
+    path, population_file = str(tmp_path / 'run.ckpt.npz'), str(tmp_path / 'run.csv')
+    with PopulationRecorder(population_file) as recorder:
+        run_single({**run, 'generations': 25, 'checkpoint': 7}, recorder, checkpoint_path=path)
+    with PopulationRecorder(population_file) as recorder:
+        assert np.array_equal(run_single({**run, 'checkpoint': 7}, recorder, checkpoint_path=path), expected)
+    generations, populations = read_population(population_file)
+    assert np.array_equal(generations, np.arange(1, 61)) and np.array_equal(populations, expected)
+
+
+# every replica of an ensemble evolves like a single run of the engine with the seed of the replica
+@pytest.mark.parametrize('rule', ['og', 'sacrifice', 'selfish', 'death_probability'])
+def test_ensemble_replicas_match_single_runs(monkeypatch, rule):
+    # chunks of 3 replicas, so the replicas are also stepped away from the start of their chunk
+    monkeypatch.setattr('GameOfLife_Ensemble.CHUNK_CELLS', 3 * 30 * 40)
+    ensemble = Ensemble(rule, 7, 30, 40, density=0.45, seed=3, mask='Hex1', Pdeath=0.3, level=0.5, n=2)
+    grids = ensemble.grids.copy()
+    selfishness = None if ensemble.selfishness is None else ensemble.selfishness.copy()
+    for generation in range(6):
+        ensemble.step()
+    for replica, seed in enumerate(replica_seeds(3, 7)):
+        grid, rng = grids[replica], CounterRNG(seed)
+        for generation in range(6):
+            if rule == 'og':
+                grid = life_step(grid)
+            elif rule == 'sacrifice':
+                grid = sacrifice_step(grid, 2)
+            elif rule == 'selfish':
+                grid, selfishness[replica] = selfish_step(grid, selfishness[replica], 0.5, rng.at(generation))
+            else:
+                grid = death_probability_step(grid, masks['Hex1'], 0.3, rng.at(generation))
+        assert np.array_equal(ensemble.grids[replica], grid)
+
+
+# widths which are not multiples of 64 leave unused bits in the last word of every row
+@pytest.mark.parametrize('cols', [1, 63, 64, 65, 101, 200])
+def test_bitboard_round_trip(cols):
+    grid = (CounterRNG(cols).at(0).field((37, cols), GRID) < 0.5).astype(float)
+    words = pack_grid(grid)
+    assert np.array_equal(unpack_grid(words, cols), grid)
+    assert population(words) == np.sum(grid)
+
+
+@pytest.mark.parametrize('cols', [63, 65, 101, 200])
+@pytest.mark.parametrize('n', [None, 1, 2, 3, 4])
+def test_bitboard_matches_engine(cols, n):
+    grid = (CounterRNG(cols).at(0).field((37, cols), GRID) < 0.45).astype(float)
+    words = pack_grid(grid)
+    for generation in range(5):
+        grid = life_step(grid) if n is None else sacrifice_step(grid, n)
+        words = step_packed(words, cols, n)
+        assert np.array_equal(unpack_grid(words, cols), grid)
+
+
+def test_batch_bitboard_backend():
+    run = expand_sweep({'rule': 'sacrifice', 'rows': 40, 'cols': 101, 'generations': 30, 'densities': [0.4]})[0]
+    assert np.array_equal(run_single({**run, 'backend': 'bitboard'}), run_single(run))
+    with pytest.raises(ValueError):
+        expand_sweep({'rule': 'selfish', 'backend': 'bitboard'})
+
+
+@pytest.mark.parametrize('n', [None, 1, 2, 3, 4])
+@pytest.mark.parametrize('density', [0.05, 0.45])
+def test_active_set_matches_engine(n, density):
+    assert verify_active_set(random_grid(2, density), 30, n)
+
+
+# editing the grid returned by a step leaves the board of the stepper as it was
+def test_active_set_step_returns_a_copy():
+    stepper = ActiveSetStepper(random_grid(3))
+    grid = stepper.step()
+    grid[:] = 0
+    assert np.sum(stepper.grid) == stepper.alive_cells > 0
+
+
+# every 3x3 neighbourhood, bit 3 * row + col of the code being the cell at (row, col)
+def all_neighborhoods():
+    return ((np.arange(512)[:, None] >> np.arange(9)) & 1).reshape(512, 3, 3).astype(float)
+
+
+# the table of every mask gives the outcome of the weighted count of each of the 512 configurations,
+# summed in the order of count_neighbors and rounded up
+@pytest.mark.parametrize('mask_name', sorted(masks))
+def test_rule_table_matches_weighted_count(mask_name):
+    mask = masks[mask_name]
+    table = compile_rule(mask)
+    for code, cells in enumerate(all_neighborhoods()):
+        total = 0
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                if i or j:
+                    total += cells[1 + i, 1 + j] * mask[1 + i, 1 + j]
+        count = int(np.ceil(total))
+        if cells[1, 1] == 1:
+            expected = SURVIVE if count in (2, 3) else DOOMED
+        else:
+            expected = BORN if count == 3 else DEAD
+        assert table[code] == expected, code
+    # the codes built from a grid index the same configurations
+    assert np.array_equal(outcomes(all_neighborhoods(), table)[:, 1, 1], table)
+
+
+# the background worker steps with the active set, and starts it again from a grid edited in a copy
+@pytest.mark.parametrize('script, n', [(GameOfLife_OG, None), (GameOfLife_SacrificeRules, 2)])
+def test_worker_update_active_set(monkeypatch, script, n):
+    monkeypatch.setattr(script, 'ACTIVE_SET', True)
+    monkeypatch.setattr(GameOfLife_SacrificeRules, 'n', n)
+    monkeypatch.setattr(GameOfLife_SacrificeRules, 'SEQUENTIAL', False)
+    update = script.worker_update()
+    grid, generation, expected = random_grid(4), 0, random_grid(4)
+    for step in range(8):
+        if step == 4:
+            # an edit of the worker, made in a copy of the grid
+            grid = grid.copy()
+            grid[10:13, 10:13] = expected[10:13, 10:13] = 1
+        grid, generation, alive_cells = update(grid, generation, 0)
+        expected = sacrifice_step(expected, n)
+        assert np.array_equal(grid, expected)
+        assert generation == step + 1 and alive_cells == np.sum(expected)
+
+
+def test_worker_update_hashlife(monkeypatch):
+    monkeypatch.setattr(GameOfLife_OG, 'HASHLIFE_STEP', 2)
+    update = GameOfLife_OG.worker_update()
+    grid = np.zeros((ROWS, COLS))
+    grid[20, 21] = grid[21, 22] = grid[22, 20:23] = 1  # a glider, far from the edges
+    expected = grid
+    for step in range(3):
+        grid, generation, alive_cells = update(grid, 4 * step, 0)
+        for generation_of_step in range(4):
+            expected = life_step(expected)
+        assert np.array_equal(grid, expected)
+        assert generation == 4 * (step + 1) and alive_cells == 5
+
+
+# the board drawn in bands is the board drawn at once
+def test_fill_random_matches_one_draw():
+    board = np.zeros((600, 77), dtype=np.uint8)
+    fill_random(board, 0.3, seed=5)
+    assert np.array_equal(board, np.random.default_rng(5).random((600, 77)) < 0.3)
+
+
+# a recorded run reopened with the memory-mapped reader gives back every generation, also after a
+# reset to generation 0 starts the run again with another grid
+def test_history_round_trip(tmp_path):
+    path = str(tmp_path / 'run.golh')
+    runs = []
+    with HistoryWriter(path, ROWS, COLS, keyframe_interval=8) as history:
+        for seed, generations in ((0, 30), (1, 20)):
+            grids = [random_grid(seed)]
+            for generation in range(1, generations + 1):
+                grids.append(life_step(grids[-1]))
+                history.append(grids[-1], generation)
+            runs.append(grids)
+    reader = HistoryReader(path)
+    assert len(reader.segments) == 2
+    for segment, grids in enumerate(runs):
+        for generation in range(1, len(grids)):
+            assert np.array_equal(reader.grid_at(generation, segment), grids[generation])
+    assert np.array_equal(reader.grid_at(25), runs[1][-1])
+
+
+# Conway's rules on a torus, the neighbours wrap around the edges
+def torus_step(grid):
+    counts = sum(np.roll(grid, (i, j), axis=(0, 1)) for i in range(-1, 2) for j in range(-1, 2)) - grid
+    return ((counts == 3) | ((grid == 1) & (counts == 2))).astype(grid.dtype)
+
+
+# a still life, a blinker and a glider on a 10 x 10 torus (back where it started after 4 x 10
+# generations) are found as cycles of their period, and not a generation before
+@pytest.mark.parametrize('cells, step, period', [([(4, 4), (4, 5), (5, 4), (5, 5)], life_step, 1),
+                                                 ([(5, 4), (5, 5), (5, 6)], life_step, 2),
+                                                 ([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)], torus_step, 40)])
+def test_steady_state_cycles(cells, step, period):
+    grid = np.zeros((10, 10))
+    grid[tuple(zip(*cells))] = 1
+    detector = SteadyStateDetector()
+    assert not detector.update(grid, 0, np.sum(grid))
+    for generation in range(1, period + 1):
+        grid = step(grid)
+        assert detector.update(grid, generation, np.sum(grid)) == (generation == period)
+    assert detector.kind == 'cycle' and detector.period == period and detector.generation == period
+
+
+# a series recorded in batches, with the buffer flushed part way, reads back the same as CSV and
+# as binary, and a binary record cut short by a crash is dropped
+@pytest.mark.parametrize('name', ['run.csv', 'run.bin'])
+def test_recorder_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    generations = np.arange(1, 2501)
+    populations = np.random.default_rng(0).integers(0, ROWS * COLS, len(generations)).astype(float)
+    with PopulationRecorder(path, batch_size=64) as recorder:
+        for generation, alive_cells in zip(generations[:1000], populations[:1000]):
+            recorder.append(generation, alive_cells)
+        recorder.extend(np.column_stack([generations[1000:], populations[1000:]]))
+    read_generations, read_populations = read_population(path)
+    assert np.array_equal(read_generations, generations) and np.array_equal(read_populations, populations)
+    if name.endswith('.bin'):
+        with open(path, 'ab') as file:
+            file.write(b'\0' * 5)
+        assert np.array_equal(read_population(path)[1], populations)
+
+
+# a glider started across the corner of four 8 x 8 tiles at negative coordinates crosses several tile
+# edges and matches the bounded grid it never reaches the edges of, and the tiles it left are freed
+def test_tiles_glider():
+    grid = np.zeros((40, 40))
+    grid[tuple(zip(*[(6, 7), (7, 8), (8, 6), (8, 7), (8, 8)]))] = 1
+    universe = TiledUniverse.from_grid(grid, top=-8, left=-8, tile=8)
+    for generation in range(60):
+        grid = life_step(grid)
+        universe.step()
+        assert np.array_equal(universe.window(-8, -8, 40, 40), grid)
+        assert universe.population == np.sum(grid) == 5
+    assert universe.generation == 60 and len(universe.tiles) <= 4
+
+
+# a long series decimated into 16 min/max buckets keeps the spikes: every bucket holds the min and
+# max of the generations it covers, whether the series is appended one generation at a time or at once
+@pytest.mark.parametrize('at_once', [False, True])
+def test_min_max_decimation(at_once):
+    generations = np.arange(1, 1001)
+    values = np.random.default_rng(0).integers(100, 200, len(generations)).astype(float)
+    values[[3, 377, 998]] = [1000, 0, 5000]
+    series = MinMaxSeries(bins=16)
+    if at_once:
+        series.extend(generations, values)
+    else:
+        for generation, value in zip(generations, values):
+            series.append(generation, value)
+    x, y = series.envelope()
+    assert y.min() == 0 and y.max() == 5000 and x.min() == 1 and x.max() >= 1000
+    for start, low, high in zip(x[0::2], y[0::2], y[1::2]):
+        covered = values[(generations >= start) & (generations < start + series.width)]
+        assert low == covered.min() and high == covered.max()
+
+
+# the cell by cell step the benchmark times the sequential rules against plays the original game
+@pytest.mark.parametrize('n', [None, 1, 2, 3, 4])
+def test_script_sacrifice_step(n):
+    grid = random_grid(n or 0)
+    assert np.array_equal(script_sacrifice_step(grid, n), sacrifice_step(grid, n))